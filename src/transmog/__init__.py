@@ -17,9 +17,15 @@ Advanced Usage:
 
 import logging
 
-from transmog.api import FlattenResult, flatten, flatten_stream
+from transmog.api import (
+    FlattenResult,
+    flatten,
+    flatten_stream,
+    flatten_stream_async,
+)
 from transmog.config import TransmogConfig
 from transmog.exceptions import MissingDependencyError, TransmogError, ValidationError
+from transmog.streaming import StreamResult, StreamSession
 from transmog.types import ArrayMode
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -29,7 +35,10 @@ __version__ = "2.0.4"
 __all__ = [
     "flatten",
     "flatten_stream",
+    "flatten_stream_async",
     "FlattenResult",
+    "StreamSession",
+    "StreamResult",
     "TransmogConfig",
     "ArrayMode",
     "TransmogError",
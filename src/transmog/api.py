@@ -5,18 +5,40 @@ nested data structures into tabular formats.
 """
 
 import logging
+import time
+from collections.abc import AsyncIterable
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+from transmog.cache import ParseCache
+from transmog.columnar import DataFrameLike, dataframe_kind
 from transmog.config import TransmogConfig
 from transmog.exceptions import (
     ConfigurationError,
     OutputError,
 )
 from transmog.flattening import get_current_timestamp, process_record_batch
-from transmog.iterators import get_data_iterator
-from transmog.streaming import stream_process
-from transmog.types import JsonDict, ProcessingContext, ProgressCallback
+from transmog.iterators import (
+    IJSON_READ_BUFFER,
+    BytesLike,
+    Stream,
+    get_data_iterator,
+    is_path_list,
+)
+from transmog.metrics import (
+    BatchMetrics,
+    MetricsCallback,
+    StreamMetrics,
+    count_table_rows,
+)
+from transmog.sharding import stream_process_sharded
+from transmog.streaming import StreamResult, stream_process, stream_process_async
+from transmog.types import (
+    JsonDict,
+    OutputFormat,
+    ProcessingContext,
+    ProgressCallback,
+)
 from transmog.writers import create_writer
 from transmog.writers.base import _sanitize_filename
 
@@ -34,6 +56,7 @@ class FlattenResult:
     ):
         """Initialize flattened data container."""
         self._entity_name = entity_name
+        self.metrics: StreamMetrics | None = None
         self._main_table = list(main_table) if main_table else []
         self._child_tables = (
             {name: list(records) for name, records in child_tables.items()}
@@ -180,10 +203,25 @@ class FlattenResult:
 
 
 def flatten(
-    data: dict[str, Any] | list[dict[str, Any]] | str | Path | bytes,
+    data: (
+        dict[str, Any]
+        | list[dict[str, Any]]
+        | str
+        | Path
+        | BytesLike
+        | Stream
+        | DataFrameLike
+    ),
     name: str = "data",
     config: TransmogConfig | None = None,
     progress_callback: ProgressCallback | None = None,
+    collect_metrics: bool = False,
+    metrics_callback: MetricsCallback | None = None,
+    parse_workers: int | None = None,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    parse_cache: ParseCache | str | Path | None = None,
 ) -> FlattenResult:
     """Flatten nested data structures into tabular format.
 
@@ -191,12 +229,33 @@ def flatten(
     into flat tables with preserved parent-child relationships.
 
     Args:
-        data: Input data - can be dict, list of dicts, file path, or JSON string
+        data: Input data - can be dict, list of dicts, file path, directory,
+            glob pattern, list of file paths, JSON string or bytes, a
+            readable stream such as sys.stdin, or a pandas or polars
+            DataFrame, whose dict and list cells are flattened like nested
+            JSON
         name: Base name for the flattened tables
         config: Optional configuration (uses defaults if not provided)
         progress_callback: Optional callable invoked after each batch flush with
             (records_processed, total_records). total_records is None when input
             length is unknown (file paths, byte strings).
+        collect_metrics: Attach read and flatten times and rows per table to
+            the result as ``result.metrics``.
+        metrics_callback: Optional callable invoked with the BatchMetrics of
+            each batch (enables metrics collection)
+        parse_workers: Number of worker processes parsing a JSONL file in
+            parallel byte ranges. Records keep their file order.
+        source_field: Add a field with this name to each main record of file
+            input, holding the path of the file the record was read from
+            (e.g. "_source_file").
+        record_path: ijson-style path of the records inside each input
+            document, such as "data.item" for ``{"meta": ..., "data": [...]}``.
+            Large .json files stream the records at constant memory.
+        record_meta: Keys next to the records' array, such as ["meta"],
+            whose values are added to every record.
+        parse_cache: Directory, or ParseCache, in which the parsed content
+            of .json5 and .hjson files is kept, so later runs over an
+            unchanged file skip the slow parser.
 
     Returns:
         FlattenResult with flattened tables
@@ -223,33 +282,61 @@ def flatten(
     total_records: int | None = None
     if isinstance(data, dict):
         total_records = 1
-    elif isinstance(data, list):
+    elif isinstance(data, list) and not is_path_list(data):
         total_records = len(data)
+    elif dataframe_kind(data) is not None:
+        total_records = len(cast(DataFrameLike, data))
 
     result = FlattenResult(entity_name=name)
+    if collect_metrics or metrics_callback is not None:
+        result.metrics = StreamMetrics()
 
-    if isinstance(data, dict):
+    if record_path is not None:
+        total_records = None
+
+    if record_path is None and isinstance(data, dict):
         iterator = iter([data])
-    elif isinstance(data, list):
+    elif record_path is None and isinstance(data, list) and not is_path_list(data):
         iterator = iter(data)
     else:
-        iterator = get_data_iterator(data)
+        iterator = get_data_iterator(
+            data,
+            parse_workers=parse_workers,
+            source_field=source_field,
+            record_path=record_path,
+            record_meta=record_meta,
+            parse_cache=parse_cache,
+        )
 
     timestamp = get_current_timestamp()
     context = ProcessingContext(extract_time=timestamp)
     batch: list[JsonDict] = []
     batch_size = max(1, config.batch_size)
     records_processed = 0
+    metrics = result.metrics
+    batch_started = 0.0
 
     def flush_batch() -> None:
         if not batch:
             return
+        started = time.perf_counter() if metrics is not None else 0.0
         flattened_records, child_tables = process_record_batch(
             records=batch,
             entity_name=name,
             config=config,
             _context=context,
         )
+        if metrics is not None:
+            batch_metrics = BatchMetrics(
+                batch=metrics.batches + 1,
+                records=len(batch),
+                read_seconds=started - batch_started,
+                flatten_seconds=time.perf_counter() - started,
+                rows=count_table_rows(name, flattened_records, child_tables),
+            )
+            metrics.add_batch(batch_metrics)
+            if metrics_callback is not None:
+                metrics_callback(batch_metrics)
         result._merge_child_tables(child_tables)
         result._extend_main(flattened_records)
         batch.clear()
@@ -259,6 +346,8 @@ def flatten(
             raise ConfigurationError(
                 f"Unsupported record type: {type(record).__name__}"
             )
+        if metrics is not None and not batch:
+            batch_started = time.perf_counter()
         batch.append(record)
         if len(batch) >= batch_size:
             records_processed += len(batch)
@@ -272,6 +361,9 @@ def flatten(
         if progress_callback is not None:
             progress_callback(records_processed, total_records)
 
+    if metrics is not None:
+        metrics.finish()
+
     logger.info(
         "flatten completed, name=%s, main_records=%d, child_tables=%d",
         name,
@@ -282,28 +374,124 @@ def flatten(
 
 
 def flatten_stream(
-    data: dict[str, Any] | list[dict[str, Any]] | str | Path | bytes,
+    data: (
+        dict[str, Any]
+        | list[dict[str, Any]]
+        | str
+        | Path
+        | BytesLike
+        | Stream
+        | DataFrameLike
+    ),
     output_path: str | Path,
     name: str = "data",
-    output_format: str = "csv",
+    output_format: OutputFormat = "csv",
     config: TransmogConfig | None = None,
     progress_callback: ProgressCallback | None = None,
+    max_batch_latency: float | None = None,
+    partition_by: list[str] | None = None,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_interval: int = 100,
+    resume: bool = False,
+    shards: int | None = None,
+    parse_workers: int | None = None,
+    collect_metrics: bool = False,
+    metrics_callback: MetricsCallback | None = None,
+    trace_path: str | Path | None = None,
+    manifest: bool = False,
+    write_manifest: bool = False,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    engine: str = "records",
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
     **format_options: Any,
-) -> list[Path]:
+) -> StreamResult:
     r"""Stream flatten data directly to files for memory-efficient processing.
 
     This function processes data and writes directly to output files without
     keeping results in memory, making it ideal for very large datasets.
 
     Args:
-        data: Input data - can be dict, list of dicts, file path, or JSON string
+        data: Input data - can be dict, list of dicts, file path, directory,
+            glob pattern, list of file paths, JSON string or bytes, or a
+            readable stream such as sys.stdin, read with constant memory
+            for JSON Lines and JSON arrays, or a pandas or polars DataFrame,
+            converted in slices. All files of a multi-file input
+            are written to one set of output files.
         output_path: Directory path where output files will be written
         name: Base name for the flattened tables
-        output_format: Output format ("csv", "parquet", "orc", "avro")
+        output_format: Output format ("csv", "parquet", "orc", "avro"). A list
+            of formats, or a dict mapping formats to their own options, writes
+            every format in a single pass; a dict entry's ``output_path``
+            option sets that format's output directory.
         config: Optional configuration (optimized for memory if not provided)
         progress_callback: Optional callable invoked after each batch flush with
             (records_processed, total_records). total_records is None when input
             length is unknown (file paths, byte strings).
+        max_batch_latency: Maximum seconds a record may wait in buffers. Once
+            the oldest buffered record is older, the partial batch is
+            flattened and writer buffers are flushed (a new Parquet row group
+            or Avro block). None (default) flushes on batch size only.
+        partition_by: Main table columns for Hive-style partitioned output.
+            Each table is written to ``<table>/<col>=<value>/part-<n>.<ext>``
+            and child rows follow the partition of their root record.
+        checkpoint_path: File to save progress to every
+            ``checkpoint_interval`` batches. Parquet and ORC files are
+            finalized at each checkpoint and continue in a new numbered file.
+            Not supported with partition_by.
+        checkpoint_interval: Batches between checkpoints (default: 100)
+        resume: Continue an interrupted run from checkpoint_path. Output is
+            identical to an uninterrupted run when IDs are deterministic
+            ("hash" or natural IDs).
+        shards: Number of worker processes for file input. A JSONL file is
+            split into byte ranges and a list of file paths is split by
+            file; each worker writes ``<table>/part-<shard>.<ext>``.
+        parse_workers: Number of worker processes parsing a JSONL file in
+            parallel byte ranges, while flattening and writing stay in this
+            process. Records keep their file order.
+        collect_metrics: Attach stage-level metrics (read, flatten and write
+            times, rows and bytes per table, buffer depth) to the result as
+            ``result.metrics``.
+        metrics_callback: Optional callable invoked with the BatchMetrics of
+            each batch. Enables metrics collection; not supported with shards.
+        trace_path: Save a Chrome trace-event JSON of the run (read, flatten
+            and write spans per batch, writer flushes and GC pauses) to this
+            file, viewable in Perfetto.
+        manifest: Attach a manifest to the result as ``result.manifest``,
+            with rows, bytes, files, final schema and ID range per table and
+            elapsed time per stage.
+        write_manifest: Also save the manifest as ``_manifest.json`` in the
+            output directory.
+        source_field: Add a field with this name to each main record of file
+            input, holding the path of the file the record was read from
+            (e.g. "_source_file").
+        record_path: ijson-style path of the records inside each input
+            document, such as "data.item" for ``{"meta": ..., "data": [...]}``.
+            Large .json files stream the records at constant memory.
+        record_meta: Keys next to the records' array, such as ["meta"],
+            whose values are added to every record.
+        engine: "records" (default) builds each input record before
+            flattening it. "events" flattens a single large JSON document
+            from ijson parse events: child rows are written as their array
+            elements complete, so memory is bounded by the largest element
+            rather than the document. Requires ijson and
+            ``id_generation="random"``; child rows are written before the
+            main record.
+        read_buffer_size: Bytes read at a time when parsing .json input
+            with ijson (1 MiB by default)
+        use_decimal: Parse non-integer numbers of .json input streamed with
+            ijson as Decimal, keeping their exact digits, instead of float
+        parse_cache: Directory, or ParseCache, in which the parsed content
+            of .json5 and .hjson files is kept across runs
+        read_ahead: Bytes of file input to read ahead on a background
+            thread, such as ``32 * 1024 * 1024``. Disk reads then overlap
+            with flattening and writing, which helps most on network
+            storage and cold caches. None (default) reads on the calling
+            thread; compressed files are always read on a background thread.
         **format_options: Format-specific writer options:
 
             Parquet options:
@@ -324,8 +512,22 @@ def flatten_stream(
                 - sync_interval: int - Approximate sync block size in bytes
                   (default: 16000)
 
+            Rolling options (csv, parquet, orc, avro):
+                - max_rows_per_file: int - Start a new numbered file per table
+                  after this many rows
+                - max_bytes_per_file: int - Start a new numbered file per table
+                  once a file reaches about this size
+                - max_open_files: int - Tables with an open file at once
+                  (csv, parquet, orc; default: unbounded)
+
+            Partitioned output options (with partition_by):
+                - max_open_files: int - Part files kept open at once
+                  (default: 64)
+
     Returns:
-        List of Path objects for each file written.
+        StreamResult, a list of Path objects for each file written. Its
+        ``metrics`` and ``manifest`` attributes hold a StreamMetrics and a
+        StreamManifest when collected.
 
     Examples:
         >>> # Stream large dataset to CSV files
@@ -347,6 +549,25 @@ def flatten_stream(
         >>> # Stream to Avro with snappy compression
         >>> flatten_stream(data, "output/", output_format="avro",
         ...                codec="snappy")
+
+        >>> # Parquet and CSV from one pass over the input
+        >>> flatten_stream(data, "output/", output_format={
+        ...     "parquet": {"compression": "zstd"},
+        ...     "csv": {"output_path": "legacy/"},
+        ... })
+
+        >>> # Resume an interrupted run from its last checkpoint
+        >>> flatten_stream("events.jsonl", "output/", output_format="parquet",
+        ...                checkpoint_path="output/_checkpoint.json",
+        ...                resume=True)
+
+        >>> # Four worker processes: output/data/part-0.parquet ... part-3
+        >>> flatten_stream("events.jsonl", "output/", output_format="parquet",
+        ...                shards=4)
+
+        >>> # Hive-style partitions: output/data/region=eu/part-0.parquet
+        >>> flatten_stream(data, "output/", output_format="parquet",
+        ...                partition_by=["region"])
     """
     if config is None:
         config = TransmogConfig(batch_size=100)
@@ -357,8 +578,12 @@ def flatten_stream(
     total_records: int | None = None
     if isinstance(data, dict):
         total_records = 1
-    elif isinstance(data, list):
+    elif isinstance(data, list) and not is_path_list(data):
         total_records = len(data)
+    elif dataframe_kind(data) is not None:
+        total_records = len(cast(DataFrameLike, data))
+    if record_path is not None:
+        total_records = None
 
     logger.info(
         "flatten_stream started, name=%s, format=%s, output=%s",
@@ -367,6 +592,47 @@ def flatten_stream(
         str(output_path),
     )
 
+    if parse_workers is not None and (
+        shards is not None or checkpoint_path is not None
+    ):
+        raise ConfigurationError(
+            "parse_workers cannot be combined with shards or checkpoints"
+        )
+
+    if shards is not None:
+        if engine != "records":
+            raise ConfigurationError("engine='events' is not supported with shards")
+        if checkpoint_path is not None:
+            raise ConfigurationError("Checkpoints are not supported with shards")
+        if metrics_callback is not None:
+            raise ConfigurationError("metrics_callback is not supported with shards")
+        files_written = stream_process_sharded(
+            config=config,
+            data=data,
+            entity_name=name,
+            output_format=output_format,
+            output_destination=str(output_path),
+            shards=shards,
+            progress_callback=progress_callback,
+            total_records=total_records,
+            max_batch_latency=max_batch_latency,
+            partition_by=partition_by,
+            collect_metrics=collect_metrics,
+            trace_path=trace_path,
+            manifest=manifest,
+            write_manifest=write_manifest,
+            source_field=source_field,
+            record_path=record_path,
+            record_meta=record_meta,
+            read_buffer_size=read_buffer_size,
+            use_decimal=use_decimal,
+            parse_cache=parse_cache,
+            read_ahead=read_ahead,
+            **format_options,
+        )
+        logger.info("flatten_stream completed, name=%s", name)
+        return files_written
+
     files_written = stream_process(
         config=config,
         data=data,
@@ -375,6 +641,25 @@ def flatten_stream(
         output_destination=str(output_path),
         progress_callback=progress_callback,
         total_records=total_records,
+        max_batch_latency=max_batch_latency,
+        partition_by=partition_by,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        resume=resume,
+        parse_workers=parse_workers,
+        collect_metrics=collect_metrics,
+        metrics_callback=metrics_callback,
+        trace_path=trace_path,
+        manifest=manifest,
+        write_manifest=write_manifest,
+        source_field=source_field,
+        record_path=record_path,
+        record_meta=record_meta,
+        engine=engine,
+        read_buffer_size=read_buffer_size,
+        use_decimal=use_decimal,
+        parse_cache=parse_cache,
+        read_ahead=read_ahead,
         **format_options,
     )
 
@@ -382,9 +667,93 @@ def flatten_stream(
     return files_written
 
 
+async def flatten_stream_async(
+    data: (
+        AsyncIterable[dict[str, Any]]
+        | dict[str, Any]
+        | list[dict[str, Any]]
+        | str
+        | Path
+        | bytes
+    ),
+    output_path: str | Path,
+    name: str = "data",
+    output_format: OutputFormat = "csv",
+    config: TransmogConfig | None = None,
+    progress_callback: ProgressCallback | None = None,
+    **format_options: Any,
+) -> list[Path]:
+    """Stream flatten data to files from within an asyncio event loop.
+
+    Async counterpart of ``flatten_stream()``. Records are pulled from an
+    async iterable on the event loop while flattening and encoding run on a
+    worker thread, so the loop stays responsive during large streams. Only
+    one batch is written at a time; the producer waits for it before the
+    next batch is handed over.
+
+    Args:
+        data: Async iterable yielding dictionaries, or any input accepted
+            by ``flatten_stream()``
+        output_path: Directory path where output files will be written
+        name: Base name for the flattened tables
+        output_format: Output format ("csv", "parquet", "orc", "avro"). A list
+            of formats, or a dict mapping formats to their own options, writes
+            every format in a single pass; a dict entry's ``output_path``
+            option sets that format's output directory.
+        config: Optional configuration (optimized for memory if not provided)
+        progress_callback: Optional callable invoked on the event loop after
+            each batch is written, with (records_processed, total_records)
+        **format_options: Format-specific writer options (see
+            ``flatten_stream()``)
+
+    Returns:
+        List of Path objects for each file written.
+
+    Examples:
+        >>> async def records():
+        ...     async for message in queue_client:
+        ...         yield message.payload
+        >>> files = await flatten_stream_async(records(), "output/",
+        ...                                    output_format="parquet")
+    """
+    if config is None:
+        config = TransmogConfig(batch_size=100)
+
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    total_records: int | None = None
+    if isinstance(data, dict):
+        total_records = 1
+    elif isinstance(data, list) and not is_path_list(data):
+        total_records = len(data)
+
+    logger.info(
+        "flatten_stream_async started, name=%s, format=%s, output=%s",
+        name,
+        output_format,
+        str(output_path),
+    )
+
+    files_written = await stream_process_async(
+        config=config,
+        data=data,
+        entity_name=name,
+        output_format=output_format,
+        output_destination=str(output_path),
+        progress_callback=progress_callback,
+        total_records=total_records,
+        **format_options,
+    )
+
+    logger.info("flatten_stream_async completed, name=%s", name)
+    return files_written
+
+
 __all__ = [
     "flatten",
     "flatten_stream",
+    "flatten_stream_async",
     "FlattenResult",
     "TransmogConfig",
 ]
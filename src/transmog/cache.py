@@ -0,0 +1,212 @@
+"""On-disk cache of parsed input files."""
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from transmog.compression import open_decompressed
+from transmog.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson as _orjson  # type: ignore[import-untyped]
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+# Bumped when the entry layout changes, invalidating older entries
+CACHE_VERSION = 1
+
+# Default limit on the total size of a cache directory
+PARSE_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+CACHE_SUFFIX = ".cache"
+
+_MISSING = object()
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a parsed payload."""
+    if _orjson is not None:
+        return bytes(_orjson.dumps(value))
+    return json.dumps(value, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    """Deserialize a cached payload."""
+    if _orjson is not None:
+        return _orjson.loads(payload)
+    return json.loads(payload)
+
+
+class ParseCache:
+    """Directory of parsed input files, reused across runs.
+
+    Entries are keyed by the file's path, size, modification time and
+    parser, and hold a digest of the file's content that must match for
+    the entry to be used. Payloads are stored as JSON bytes (written and
+    read with orjson when installed), so a cache hit replaces a slow
+    pure-Python parser with one fast load. Once the directory exceeds
+    ``max_size`` bytes, the least recently used entries are removed.
+
+    Payloads that do not survive a JSON round trip unchanged, such as
+    those holding NaN, are parsed on every run instead of being cached.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_size: int = PARSE_CACHE_MAX_SIZE
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory, created on first write
+            max_size: Maximum total size of the entries in bytes
+
+        Raises:
+            ConfigurationError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ConfigurationError("max_size must be at least 1")
+        self.directory = str(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, file_path: str, parser: str, parse: Callable[[bytes], Any]) -> Any:
+        """Return a file's parsed content, from the cache when possible.
+
+        Args:
+            file_path: Path of the input file, optionally compressed
+            parser: Name of the parser, part of the cache key
+            parse: Callable parsing the file's decompressed bytes
+
+        Returns:
+            Parsed content of the file
+        """
+        stat = os.stat(file_path)
+        with open_decompressed(file_path) as handle:
+            content = handle.read()
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest().encode()
+        entry = self._entry_path(file_path, parser, stat)
+
+        value = self._read(entry, digest)
+        if value is not _MISSING:
+            self.hits += 1
+            logger.debug("parse cache hit, path=%s, parser=%s", file_path, parser)
+            return value
+
+        self.misses += 1
+        logger.debug("parse cache miss, path=%s, parser=%s", file_path, parser)
+        value = parse(content)
+        self._write(entry, digest, value)
+        return value
+
+    def _entry_path(self, file_path: str, parser: str, stat: os.stat_result) -> str:
+        """Path of the entry for a file in its current state."""
+        key = "\0".join(
+            [
+                str(CACHE_VERSION),
+                parser,
+                os.path.abspath(file_path),
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+            ]
+        )
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + CACHE_SUFFIX)
+
+    def _read(self, entry: str, digest: bytes) -> Any:
+        """Load an entry, or return _MISSING if absent or stale."""
+        try:
+            with open(entry, "rb") as handle:
+                data = handle.read()
+        except OSError:
+            return _MISSING
+        header, _, payload = data.partition(b"\n")
+        if header != digest:
+            return _MISSING
+        try:
+            value = _loads(payload)
+        except ValueError:
+            return _MISSING
+        try:
+            # The entry's mtime records its last use for LRU eviction
+            os.utime(entry)
+        except OSError:
+            pass
+        return value
+
+    def _write(self, entry: str, digest: bytes, value: Any) -> None:
+        """Store an entry and evict old ones, ignoring failures."""
+        try:
+            payload = _dumps(value)
+        except (TypeError, ValueError) as exc:
+            logger.debug("parse cache skipped, payload not serializable: %s", exc)
+            return
+        if len(payload) + len(digest) + 1 > self.max_size:
+            logger.debug("parse cache skipped, payload larger than max_size")
+            return
+        if _loads(payload) != value:
+            logger.debug("parse cache skipped, payload does not round-trip")
+            return
+
+        temp_path = f"{entry}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as handle:
+                handle.write(digest + b"\n" + payload)
+            os.replace(temp_path, entry)
+        except OSError as exc:
+            logger.warning("parse cache entry not written to %s: %s", entry, exc)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_size."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for item in scan:
+                    if item.name.endswith(CACHE_SUFFIX) and item.is_file():
+                        stat = item.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            logger.debug("parse cache entry evicted, path=%s", path)
+
+    def clear(self) -> None:
+        """Remove all entries of the cache."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(CACHE_SUFFIX):
+                os.remove(os.path.join(self.directory, name))
+
+
+def as_parse_cache(value: ParseCache | str | Path | None) -> ParseCache | None:
+    """Return a ParseCache for a cache directory or an existing cache."""
+    if value is None or isinstance(value, ParseCache):
+        return value
+    return ParseCache(value)
+
+
+__all__ = [
+    "PARSE_CACHE_MAX_SIZE",
+    "ParseCache",
+    "as_parse_cache",
+]
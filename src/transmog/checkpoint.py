@@ -0,0 +1,171 @@
+"""Checkpoint files for resumable streaming runs."""
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from transmog.cache import ParseCache
+from transmog.compression import detect_compression
+from transmog.exceptions import ConfigurationError
+from transmog.iterators import (
+    IJSON_READ_BUFFER,
+    get_data_iterator,
+    get_jsonl_file_positions,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str | Path, state: dict[str, Any]) -> None:
+    """Atomically write a checkpoint file.
+
+    The state is written to a temporary file that replaces the checkpoint,
+    so a crash while saving leaves the previous checkpoint intact.
+
+    Args:
+        path: Checkpoint file path
+        state: JSON-serializable checkpoint state
+    """
+    path = str(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump({"version": CHECKPOINT_VERSION, **state}, handle, indent=2)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: str | Path) -> dict[str, Any] | None:
+    """Read a checkpoint file.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        Checkpoint state, or None if the file does not exist
+
+    Raises:
+        ConfigurationError: If the file is not a valid checkpoint
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            state = json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        raise ConfigurationError(f"Invalid checkpoint file {path}: {exc}") from exc
+
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        raise ConfigurationError(f"Unsupported checkpoint file: {path}")
+    return state
+
+
+def resumable_input(
+    data: Any,
+    input_state: dict[str, Any] | None = None,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
+) -> tuple[Iterator[dict[str, Any]], Callable[[], dict[str, Any]]]:
+    """Open an input positioned after the records covered by a checkpoint.
+
+    JSON Lines files are resumed by seeking to the stored byte offset.
+    Other inputs are re-read and the already processed records skipped,
+    which for JSON arrays still parses but no longer flattens or writes
+    them.
+
+    Args:
+        data: Input accepted by get_data_iterator()
+        input_state: Input position from a checkpoint, or None to start
+            at the beginning
+        source_field: Field holding the source file path of each record
+        record_path: ijson-style path of the records inside each document;
+            disables offset-based resumption
+        record_meta: Keys next to the records' array to add to each record
+        read_buffer_size: Bytes read at a time when streaming .json input
+        use_decimal: Parse non-integer numbers of streamed .json input as
+            Decimal
+        parse_cache: Cache of parsed .json5 and .hjson files
+        read_ahead: Bytes of file input to read ahead on a background thread
+
+    Returns:
+        Tuple of (record iterator, function returning the current position)
+    """
+    position: dict[str, Any] = {"records": 0}
+    if input_state:
+        position.update(input_state)
+
+    source = str(data) if isinstance(data, Path) else data
+    if (
+        isinstance(source, str)
+        and os.path.splitext(source)[1].lower() in (".jsonl", ".ndjson")
+        and os.path.isfile(source)
+        and detect_compression(source) is None
+        and record_path is None
+    ):
+        position.setdefault("offset", 0)
+        position.setdefault("line", 0)
+
+        def jsonl_records() -> Iterator[dict[str, Any]]:
+            for record, offset, line in get_jsonl_file_positions(
+                source, position["offset"], position["line"], read_ahead
+            ):
+                position["records"] += 1
+                position["offset"] = offset
+                position["line"] = line
+                if source_field:
+                    record[source_field] = source
+                yield record
+
+        logger.debug(
+            "checkpoint input opened, path=%s, offset=%d",
+            source,
+            position["offset"],
+        )
+        return jsonl_records(), lambda: dict(position)
+
+    iterator = get_data_iterator(
+        data,
+        streaming=True,
+        source_field=source_field,
+        record_path=record_path,
+        record_meta=record_meta,
+        read_buffer_size=read_buffer_size,
+        use_decimal=use_decimal,
+        parse_cache=parse_cache,
+        read_ahead=read_ahead,
+    )
+    skipped = position["records"]
+    if skipped:
+        for _ in islice(iterator, skipped):
+            pass
+        logger.debug("checkpoint input skipped, records=%d", skipped)
+
+    def records() -> Iterator[dict[str, Any]]:
+        for record in iterator:
+            position["records"] += 1
+            yield record
+
+    return records(), lambda: dict(position)
+
+
+__all__ = [
+    "CHECKPOINT_VERSION",
+    "load_checkpoint",
+    "resumable_input",
+    "save_checkpoint",
+]
@@ -0,0 +1,330 @@
+"""Readers for Parquet, ORC, Avro and Arrow IPC files and DataFrames."""
+
+import logging
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any, Protocol
+
+from transmog.compression import (
+    content_extension,
+    detect_compression,
+    open_decompressed,
+)
+from transmog.exceptions import MissingDependencyError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as _pa
+    import pyarrow.ipc as _ipc
+    import pyarrow.orc as _orc
+    import pyarrow.parquet as _pq
+
+    _READ_ERRORS: tuple[type[Exception], ...] = (
+        OSError,
+        ValueError,
+        EOFError,
+        _pa.ArrowException,
+    )
+except ImportError:
+    _pa = None
+    _ipc = None
+    _orc = None
+    _pq = None
+    _READ_ERRORS: tuple[type[Exception], ...] = (  # type: ignore[no-redef]
+        OSError,
+        ValueError,
+        EOFError,
+    )
+
+try:
+    import fastavro as _fastavro
+except ImportError:
+    _fastavro = None  # type: ignore[assignment]
+
+# Input extensions read by this module and the format of each
+COLUMNAR_EXTENSIONS: dict[str, str] = {
+    ".parquet": "parquet",
+    ".orc": "orc",
+    ".avro": "avro",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+# Rows converted to records at a time
+COLUMNAR_BATCH_SIZE = 10_000
+
+_FORMAT_NAMES = {
+    "parquet": "Parquet",
+    "orc": "ORC",
+    "avro": "Avro",
+    "arrow": "Arrow IPC",
+}
+
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+
+class DataFrameLike(Protocol):
+    """A pandas or polars DataFrame, typed without importing either."""
+
+    @property
+    def columns(self) -> Any:
+        """Column labels of the frame."""
+
+    def __len__(self) -> int:
+        """Number of rows of the frame."""
+
+
+def _has_map(data_type: Any) -> bool:
+    """Check whether an Arrow type is or contains a map type."""
+    if _pa.types.is_map(data_type):
+        return True
+    if _pa.types.is_struct(data_type):
+        return any(
+            _has_map(data_type.field(i).type) for i in range(data_type.num_fields)
+        )
+    if (
+        _pa.types.is_list(data_type)
+        or _pa.types.is_large_list(data_type)
+        or _pa.types.is_fixed_size_list(data_type)
+        or _pa.types.is_list_view(data_type)
+        or _pa.types.is_large_list_view(data_type)
+    ):
+        return _has_map(data_type.value_type)
+    return False
+
+
+def _iter_parquet_batches(file_path: str, batch_size: int) -> Iterator[Any]:
+    """Yield the record batches of a Parquet file."""
+    with _pq.ParquetFile(file_path) as parquet_file:
+        yield from parquet_file.iter_batches(batch_size=batch_size)
+
+
+def _iter_orc_batches(file_path: str, batch_size: int) -> Iterator[Any]:
+    """Yield the record batches of an ORC file, one stripe at a time."""
+    orc_file = _orc.ORCFile(file_path)
+    for index in range(orc_file.nstripes):
+        stripe = orc_file.read_stripe(index)
+        for offset in range(0, stripe.num_rows, batch_size):
+            yield stripe.slice(offset, batch_size)
+
+
+def _iter_arrow_batches(file_path: str) -> Iterator[Any]:
+    """Yield the record batches of an Arrow IPC file or stream."""
+    with open(file_path, "rb") as handle:
+        is_file_format = handle.read(len(_ARROW_FILE_MAGIC)) == _ARROW_FILE_MAGIC
+    with _pa.memory_map(file_path) as source:
+        if is_file_format:
+            reader = _ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield reader.get_batch(index)
+        else:
+            yield from _ipc.open_stream(source)
+
+
+def _iter_arrow_records(
+    file_path: str, file_format: str, batch_size: int
+) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a file read with pyarrow as records."""
+    if _pa is None:
+        raise MissingDependencyError(
+            f"pyarrow is required for {_FORMAT_NAMES[file_format]} input. "
+            "Install with: pip install pyarrow"
+        )
+    if detect_compression(file_path) is not None:
+        raise ValidationError(
+            f"Compressed {_FORMAT_NAMES[file_format]} files are not supported: "
+            f"{file_path}"
+        )
+
+    batches: Iterator[Any]
+    if file_format == "parquet":
+        batches = _iter_parquet_batches(file_path, batch_size)
+    elif file_format == "orc":
+        batches = _iter_orc_batches(file_path, batch_size)
+    else:
+        batches = _iter_arrow_batches(file_path)
+    yield from _iter_batch_records(batches)
+
+
+def _iter_batch_records(batches: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Yield the rows of Arrow record batches sharing a schema as records."""
+    options: dict[str, Any] | None = None
+    for batch in batches:
+        if options is None:
+            # Maps become dicts, which the flattener handles like JSON
+            # objects. The conversion is several times slower, so it is
+            # only requested for schemas that have maps.
+            has_map = any(_has_map(field.type) for field in batch.schema)
+            options = {"maps_as_pydicts": "lossy"} if has_map else {}
+        yield from batch.to_pylist(**options)
+
+
+def _iter_avro_records(file_path: str) -> Iterator[dict[str, Any]]:
+    """Yield the records of an Avro object container file."""
+    if _fastavro is None:
+        raise MissingDependencyError(
+            "fastavro is required for Avro input. Install with: pip install fastavro"
+        )
+    with open_decompressed(file_path) as handle:
+        for index, record in enumerate(_fastavro.reader(handle)):
+            if not isinstance(record, dict):
+                raise ValidationError(
+                    f"Expected Avro record at index {index} in {file_path}, "
+                    f"got {type(record).__name__}"
+                )
+            yield record
+
+
+def get_columnar_file_iterator(
+    file_path: str, batch_size: int = COLUMNAR_BATCH_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the rows of a Parquet, ORC, Avro or Arrow IPC file.
+
+    The file is read batch by batch, so memory is bounded by one batch
+    rather than the file. Arrow batches are converted to records in C++
+    without a JSON round trip: struct columns become nested dicts, list
+    columns lists and map columns dicts. Values keep their Python types,
+    such as datetime for timestamps and Decimal for decimals.
+
+    Args:
+        file_path: Path to the file; its extension selects the format.
+            Avro files may be compressed (``events.avro.gz``).
+        batch_size: Rows read and converted at a time
+
+    Returns:
+        Iterator over data records
+
+    Raises:
+        MissingDependencyError: If pyarrow (or fastavro for Avro) is not
+            installed
+        ValidationError: If the file is missing, compressed or unreadable
+    """
+    if not os.path.exists(file_path):
+        raise ValidationError(f"File not found: {file_path}")
+
+    file_format = COLUMNAR_EXTENSIONS.get(content_extension(file_path))
+    if file_format is None:
+        raise ValidationError(f"Unsupported columnar file extension: {file_path}")
+
+    logger.debug(
+        "columnar input opened, path=%s, format=%s, batch_size=%d",
+        file_path,
+        file_format,
+        batch_size,
+    )
+    try:
+        if file_format == "avro":
+            yield from _iter_avro_records(file_path)
+        else:
+            yield from _iter_arrow_records(file_path, file_format, batch_size)
+    except _READ_ERRORS as exc:
+        raise ValidationError(
+            f"Error reading {_FORMAT_NAMES[file_format]} file {file_path}: {exc}"
+        ) from exc
+
+
+def dataframe_kind(data: Any) -> str | None:
+    """Identify a pandas or polars DataFrame.
+
+    Neither library is imported: a DataFrame can only exist once its
+    library has been imported by the caller.
+
+    Args:
+        data: Input data
+
+    Returns:
+        "pandas" or "polars" for a DataFrame, otherwise None
+    """
+    for kind in ("pandas", "polars"):
+        module = sys.modules.get(kind)
+        if module is not None and isinstance(data, module.DataFrame):
+            return kind
+    return None
+
+
+def _is_arrow_backed(frame: Any) -> bool:
+    """Check whether a pandas DataFrame has Arrow-backed columns."""
+    arrow_dtype = getattr(sys.modules["pandas"], "ArrowDtype", None)
+    return arrow_dtype is not None and any(
+        isinstance(dtype, arrow_dtype) for dtype in frame.dtypes
+    )
+
+
+def _iter_pandas_records(frame: Any, batch_size: int) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a pandas DataFrame as records, one slice at a time."""
+    use_arrow = _pa is not None and _is_arrow_backed(frame)
+    for start in range(0, len(frame), batch_size):
+        chunk = frame.iloc[start : start + batch_size]
+        if use_arrow:
+            try:
+                batch = _pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+            except (_pa.ArrowInvalid, _pa.ArrowTypeError, _pa.ArrowNotImplementedError):
+                logger.debug(
+                    "DataFrame slice not convertible to Arrow, offset=%d", start
+                )
+            else:
+                yield from _iter_batch_records([batch])
+                continue
+        # Missing values (NaN, NaT, pd.NA) become None
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        yield from chunk.to_dict("records")
+
+
+def get_dataframe_iterator(
+    frame: DataFrameLike, batch_size: int = COLUMNAR_BATCH_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the rows of a pandas or polars DataFrame.
+
+    Rows are converted ``batch_size`` at a time rather than with a single
+    ``to_dict("records")`` call, so the records of the whole frame never
+    exist alongside it. Dict and list cells are kept as they are and
+    flattened like nested JSON. polars frames and pandas frames with
+    Arrow-backed columns are converted through Arrow, with struct and list
+    columns becoming dicts and lists. Other pandas frames are converted
+    with ``to_dict("records")`` per slice, which for object columns is
+    faster than inferring Arrow types. Missing values become None and the
+    index of a pandas frame is not included.
+
+    Args:
+        frame: pandas or polars DataFrame
+        batch_size: Rows converted at a time
+
+    Returns:
+        Iterator over data records
+
+    Raises:
+        ValidationError: If frame is not a pandas or polars DataFrame
+    """
+    kind = dataframe_kind(frame)
+    if kind is None:
+        raise ValidationError(f"Unsupported DataFrame type: {type(frame)}")
+
+    logger.debug(
+        "DataFrame input opened, kind=%s, rows=%d, batch_size=%d",
+        kind,
+        len(frame),
+        batch_size,
+    )
+    data: Any = frame
+    if kind == "pandas":
+        yield from _iter_pandas_records(data, batch_size)
+    elif _pa is not None:
+        yield from _iter_batch_records(
+            data.to_arrow().to_batches(max_chunksize=batch_size)
+        )
+    else:
+        for chunk in data.iter_slices(batch_size):
+            yield from chunk.to_dicts()
+
+
+__all__ = [
+    "COLUMNAR_BATCH_SIZE",
+    "COLUMNAR_EXTENSIONS",
+    "DataFrameLike",
+    "dataframe_kind",
+    "get_columnar_file_iterator",
+    "get_dataframe_iterator",
+]
@@ -0,0 +1,394 @@
+"""Streaming decompression and read-ahead of input files."""
+
+import bz2
+import io
+import logging
+import lzma
+import os
+import queue
+import threading
+import zlib
+from collections.abc import Callable
+from typing import Any, BinaryIO
+
+from transmog.exceptions import ConfigurationError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard as _zstandard  # type: ignore[import-not-found]
+except ImportError:
+    _zstandard = None
+
+try:
+    from compression import zstd as _stdlib_zstd  # type: ignore[import-not-found]
+except ImportError:
+    _stdlib_zstd = None
+
+try:
+    import cramjam as _cramjam
+except ImportError:
+    _cramjam = None  # type: ignore[assignment]
+
+COMPRESSION_EXTENSIONS: dict[str, str] = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+# Leading bytes identifying each codec, for files without a telling extension
+MAGIC_BYTES: tuple[tuple[bytes, str], ...] = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+# Compressed bytes read per decompression step
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Decompressed chunks buffered ahead of the reader
+QUEUE_DEPTH = 8
+
+
+def detect_compression(file_path: str) -> str | None:
+    """Detect the compression codec of a file.
+
+    The extension is checked first (``data.jsonl.gz``), then the file's
+    leading magic bytes.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Codec name ("gzip", "bz2", "xz" or "zstd"), or None if uncompressed
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in COMPRESSION_EXTENSIONS:
+        return COMPRESSION_EXTENSIONS[extension]
+    try:
+        with open(file_path, "rb") as handle:
+            header = handle.read(6)
+    except OSError:
+        return None
+    for magic, codec in MAGIC_BYTES:
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def content_extension(file_path: str) -> str:
+    """Get the extension describing a file's content format.
+
+    A compression extension is skipped, so ``events.jsonl.gz`` gives
+    ``.jsonl``.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Lowercase extension including the dot, or an empty string
+    """
+    root, extension = os.path.splitext(file_path)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(root)[1]
+    return extension.lower()
+
+
+class _MultiStreamDecoder:
+    """Incremental decoder handling concatenated compressed streams.
+
+    gzip, bz2, xz and zstd files may consist of several streams written one
+    after another (``cat a.gz b.gz``); a new decompressor is started for the
+    data following each finished stream.
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._decoder = factory()
+        self._started = False
+
+    def _unused(self) -> bytes:
+        unused = getattr(self._decoder, "unused_data", b"")
+        return bytes(unused) if unused else b""
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the next chunk of compressed data."""
+        output = []
+        while data:
+            self._started = True
+            output.append(self._decoder.decompress(data))
+            if not getattr(self._decoder, "eof", False):
+                break
+            data = self._unused()
+            self._decoder = self._factory()
+            self._started = False
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        """Return any remaining output once the input is exhausted.
+
+        Raises:
+            EOFError: If the input ended in the middle of a stream
+        """
+        flush = getattr(self._decoder, "flush", None)
+        output = flush() if flush is not None else b""
+        if self._started and not getattr(self._decoder, "eof", True):
+            raise EOFError("compressed file ended before the end-of-stream marker")
+        return output
+
+
+class _BufferedDecoder:
+    """Whole-input decoder for codecs without a streaming implementation."""
+
+    def __init__(self, decompress: Callable[[bytes], Any]) -> None:
+        self._decompress = decompress
+        self._chunks: list[bytes] = []
+
+    def decompress(self, data: bytes) -> bytes:
+        """Collect a chunk of compressed data."""
+        self._chunks.append(data)
+        return b""
+
+    def flush(self) -> bytes:
+        """Decompress all collected data."""
+        return bytes(self._decompress(b"".join(self._chunks)))
+
+
+class _PassThroughDecoder:
+    """Decoder returning uncompressed data unchanged."""
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return a chunk as is."""
+        return data
+
+    def flush(self) -> bytes:
+        """Return nothing, no data is held back."""
+        return b""
+
+
+def _create_decoder(
+    codec: str | None,
+) -> _MultiStreamDecoder | _BufferedDecoder | _PassThroughDecoder:
+    """Create an incremental decoder for a codec.
+
+    Args:
+        codec: Codec name, or None for uncompressed data
+
+    Returns:
+        Decoder with ``decompress`` and ``flush`` methods
+
+    Raises:
+        ValidationError: If the codec is unknown
+    """
+    if codec is None:
+        return _PassThroughDecoder()
+    if codec == "gzip":
+        return _MultiStreamDecoder(lambda: zlib.decompressobj(16 + zlib.MAX_WBITS))
+    if codec == "bz2":
+        return _MultiStreamDecoder(bz2.BZ2Decompressor)
+    if codec == "xz":
+        return _MultiStreamDecoder(lzma.LZMADecompressor)
+    if codec == "zstd":
+        if _zstandard is not None:
+            decompressor = _zstandard.ZstdDecompressor()
+            return _MultiStreamDecoder(decompressor.decompressobj)
+        if _stdlib_zstd is not None:
+            return _MultiStreamDecoder(_stdlib_zstd.ZstdDecompressor)
+        if _cramjam is not None:
+            # cramjam decodes whole frames only, so the file is buffered
+            logger.debug("zstd input decoded in memory, no streaming decoder")
+            return _BufferedDecoder(_cramjam.zstd.decompress)
+        raise ValidationError(
+            "zstandard or cramjam is required for .zst input. "
+            "Install with: pip install zstandard"
+        )
+    raise ValidationError(f"Unsupported compression codec: {codec}")
+
+
+class _ReadAheadReader(io.RawIOBase):
+    """Raw binary stream reading a file on a background thread.
+
+    File reads, zlib, bz2, lzma and zstd all release the GIL, so the reader
+    thread reads and decodes the next chunks while the consumer parses the
+    current one. At most ``queue_depth`` chunks are held ahead.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        codec: str | None,
+        offset: int = 0,
+        chunk_size: int = READ_CHUNK_SIZE,
+        queue_depth: int = QUEUE_DEPTH,
+    ) -> None:
+        super().__init__()
+        self.name = file_path
+        try:
+            # The decoder may need a missing optional dependency, so it is
+            # created before the file is opened
+            self._decoder = _create_decoder(codec)
+            self._handle = open(file_path, "rb", buffering=0)  # noqa: SIM115
+            try:
+                if offset:
+                    self._handle.seek(offset)
+            except BaseException:
+                self._handle.close()
+                raise
+        except BaseException:
+            # Marks the stream closed, so that close() has no thread to stop
+            super().close()
+            raise
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue[bytes | BaseException | None] = queue.Queue(
+            queue_depth
+        )
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._run, name="transmog-read-ahead", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: bytes | BaseException | None) -> bool:
+        """Queue an item unless the reader was closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        """Read and decode the file into the queue."""
+        try:
+            while not self._stop.is_set():
+                chunk = self._handle.read(self._chunk_size)
+                if not chunk:
+                    break
+                data = self._decoder.decompress(chunk)
+                if data and not self._put(data):
+                    return
+            data = self._decoder.flush()
+            if data:
+                self._put(data)
+        except OSError as exc:
+            self._put(exc)
+            return
+        except Exception as exc:
+            self._put(ValidationError(f"Error decompressing file {self.name}: {exc}"))
+            return
+        self._put(None)
+
+    def readable(self) -> bool:
+        """Whether the stream can be read (always True)."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read decompressed bytes into a buffer.
+
+        Args:
+            buffer: Writable buffer
+
+        Returns:
+            Number of bytes read, 0 at the end of the file
+        """
+        while not self._pending:
+            if self._done:
+                return 0
+            item = self._queue.get()
+            if item is None:
+                self._done = True
+                return 0
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            self._pending = memoryview(item)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        """Stop the reader thread and close the file."""
+        if self.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._handle.close()
+        super().close()
+
+
+def open_decompressed(
+    file_path: str,
+    codec: str | None = None,
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    read_ahead: int | None = None,
+    offset: int = 0,
+) -> BinaryIO:
+    """Open a file for binary reading, decompressing it if needed.
+
+    Compressed files are always read and decompressed on a background
+    thread. With ``read_ahead``, uncompressed files are read on a
+    background thread as well, keeping up to that many bytes buffered ahead
+    of the consumer so that disk reads overlap with parsing and flattening.
+
+    Args:
+        file_path: Path to the file
+        codec: Codec name, or None to detect it
+        buffer_size: Buffer size of the returned stream
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread
+        offset: Byte offset to start reading at, for uncompressed files
+
+    Returns:
+        Buffered binary stream of the file's decompressed content
+
+    Raises:
+        ConfigurationError: If read_ahead is less than 1
+        ValidationError: If an offset is given for a compressed file
+    """
+    if read_ahead is not None and read_ahead < 1:
+        raise ConfigurationError("read_ahead must be at least 1")
+    if codec is None:
+        codec = detect_compression(file_path)
+    if codec is not None and offset:
+        raise ValidationError(f"Cannot seek in compressed file {file_path}")
+    if read_ahead is None:
+        if codec is None:
+            handle = open(file_path, "rb", buffering=buffer_size)  # noqa: SIM115
+            if offset:
+                handle.seek(offset)
+            return handle
+        logger.debug("compressed input opened, path=%s, codec=%s", file_path, codec)
+        return io.BufferedReader(_ReadAheadReader(file_path, codec), buffer_size)
+
+    chunk_size = min(READ_CHUNK_SIZE, read_ahead)
+    logger.debug(
+        "read-ahead input opened, path=%s, codec=%s, read_ahead=%d",
+        file_path,
+        codec,
+        read_ahead,
+    )
+    reader = _ReadAheadReader(
+        file_path,
+        codec,
+        offset,
+        chunk_size=chunk_size,
+        queue_depth=max(1, read_ahead // chunk_size),
+    )
+    return io.BufferedReader(reader, buffer_size)
+
+
+__all__ = [
+    "COMPRESSION_EXTENSIONS",
+    "content_extension",
+    "detect_compression",
+    "open_decompressed",
+]
@@ -0,0 +1,320 @@
+"""Event-driven flattening of single large JSON documents.
+
+The record-based pipeline builds each input record as a dictionary before
+flattening it. For a document whose nested arrays hold millions of
+elements, that dictionary is the whole file. This module instead consumes
+ijson parse events: scalar fields go straight into the flattened root
+record, and each element of an extracted array is built, flattened and
+released on its own, so memory is bounded by the largest array element.
+"""
+
+import io
+import json
+import logging
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+from transmog.compression import open_decompressed
+from transmog.config import TransmogConfig
+from transmog.exceptions import (
+    ConfigurationError,
+    MissingDependencyError,
+    ValidationError,
+)
+from transmog.flattening import (
+    _process_array_items,
+    annotate_with_metadata,
+    is_null_like,
+)
+from transmog.iterators import IJSON_BACKEND, IJSON_READ_BUFFER, BytesLike, _ijson
+from transmog.types import ArrayMode, ProcessingContext
+
+logger = logging.getLogger(__name__)
+
+# Flattened tables produced by one step: (main records, child tables)
+TableChunk = tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]
+
+Events = Iterator[tuple[str, Any]]
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+
+def _build_value(events: Events, event: str, value: Any) -> Any:
+    """Build the value starting with an event from the following events."""
+    if event not in _START_EVENTS:
+        return value
+    builder = _ijson.common.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1
+    for event, value in events:
+        builder.event(event, value)
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
+
+
+def _skip_value(events: Events, event: str) -> None:
+    """Consume the events of a value without building it."""
+    if event not in _START_EVENTS:
+        return
+    depth = 1
+    for event, _ in events:
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                return
+
+
+class _DocumentFlattener:
+    """Flatten one root object from its parse events.
+
+    Mirrors flatten_json() for the root object and the objects nested in it,
+    and hands every element of an extracted array to _process_array_items()
+    one at a time.
+    """
+
+    def __init__(
+        self,
+        entity_name: str,
+        config: TransmogConfig,
+        context: ProcessingContext,
+        chunk_rows: int,
+    ) -> None:
+        self.entity_name = entity_name
+        self.config = config
+        self.context = context
+        self.chunk_rows = chunk_rows
+        self.pending: dict[str, list[dict[str, Any]]] = {}
+        self.pending_rows = 0
+        self.root_id = ""
+
+    def take_pending(self) -> dict[str, list[dict[str, Any]]]:
+        """Return and reset the child rows not emitted yet."""
+        pending, self.pending = self.pending, {}
+        self.pending_rows = 0
+        return pending
+
+    def document(self, events: Events) -> Iterator[TableChunk]:
+        """Flatten a root object whose start_map event was consumed.
+
+        Yields:
+            Child rows every ``chunk_rows`` rows, then the root record with
+            the remaining child rows
+        """
+        self.root_id = str(uuid.uuid4())
+        result: dict[str, Any] = {}
+        yield from self._object(events, result, [], 0)
+        annotate_with_metadata(
+            result,
+            config=self.config,
+            transmog_time=self.context.extract_time,
+            record_id=self.root_id,
+        )
+        yield [result], self.take_pending()
+
+    def _object(
+        self, events: Events, result: dict[str, Any], path: list[str], depth: int
+    ) -> Iterator[TableChunk]:
+        """Flatten the fields of an object into result."""
+        for event, key in events:
+            if event == "end_map":
+                return
+            event, value = next(events)
+            field_path = [*path, key]
+            name = "_".join(field_path) if path else key
+            if event == "start_map":
+                if depth + 1 >= self.config.max_depth:
+                    _skip_value(events, event)
+                else:
+                    yield from self._object(events, result, field_path, depth + 1)
+            elif event == "start_array":
+                yield from self._array(events, result, key, name, path, depth)
+            elif not is_null_like(value):
+                if self.config.stringify_values and not isinstance(value, str):
+                    value = str(value)
+                result[name] = value
+            elif self.config.include_nulls:
+                result[name] = None
+
+    def _array(
+        self,
+        events: Events,
+        result: dict[str, Any],
+        key: str,
+        name: str,
+        path: list[str],
+        depth: int,
+    ) -> Iterator[TableChunk]:
+        """Flatten an array whose start_array event was consumed."""
+        mode = self.config.array_mode
+        if mode == ArrayMode.SKIP:
+            _skip_value(events, "start_array")
+            return
+        if mode == ArrayMode.INLINE:
+            value = _build_value(events, "start_array", None)
+            if value:
+                result[name] = json.dumps(value, ensure_ascii=False)
+            return
+
+        context = ProcessingContext(
+            current_depth=depth,
+            path_components=path,
+            extract_time=self.context.extract_time,
+        )
+        # SMART keeps arrays without objects on the record, so primitive
+        # elements wait until the first object decides the array is complex
+        simple: list[Any] | None = [] if mode == ArrayMode.SMART else None
+        for event, value in events:
+            if event == "end_array":
+                break
+            item = _build_value(events, event, value)
+            if simple is not None:
+                if not isinstance(item, dict):
+                    simple.append(item)
+                    continue
+                items, simple = [*simple, item], None
+            else:
+                items = [item]
+            self._extract(items, key, context)
+            if self.pending_rows >= self.chunk_rows:
+                yield [], self.take_pending()
+
+        if simple:
+            if self.config.stringify_values:
+                simple = [
+                    str(v) if not isinstance(v, str) and not is_null_like(v) else v
+                    for v in simple
+                ]
+            result[name] = simple
+
+    def _extract(self, items: list[Any], key: str, context: ProcessingContext) -> None:
+        """Flatten array elements into pending child rows."""
+        _, tables = _process_array_items(
+            items,
+            key,
+            self.config,
+            context,
+            True,
+            self.root_id,
+            self.entity_name,
+        )
+        for table_name, rows in tables.items():
+            self.pending.setdefault(table_name, []).extend(rows)
+            self.pending_rows += len(rows)
+
+
+def check_event_config(config: TransmogConfig) -> None:
+    """Check that a configuration can be used with event-driven flattening.
+
+    Raises:
+        ConfigurationError: If the root record ID cannot be known before
+            the document has been read
+        MissingDependencyError: If ijson is not installed
+    """
+    if _ijson is None:
+        raise MissingDependencyError(
+            "ijson is required for event-driven flattening. "
+            "Install with: pip install ijson"
+        )
+    if config.id_generation != "random":
+        raise ConfigurationError(
+            "engine='events' requires id_generation='random': child rows are "
+            "written before the root record is complete, so its ID must be "
+            "generated up front"
+        )
+
+
+def iter_document_tables(
+    source: str | BytesLike,
+    entity_name: str,
+    config: TransmogConfig,
+    context: ProcessingContext,
+    chunk_rows: int | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    read_ahead: int | None = None,
+) -> Iterator[TableChunk]:
+    """Flatten large JSON documents from parse events.
+
+    Each root object (the document, or each element of a top-level array)
+    gets its ID before its fields are read. Child rows are emitted in
+    chunks of about ``chunk_rows`` rows as their array elements complete;
+    the flattened root record follows its last child rows. Output matches
+    process_record_batch() except for row order.
+
+    Args:
+        source: Path to a JSON file (optionally compressed), or JSON bytes
+        entity_name: Name of the main table
+        config: Configuration; id_generation must be "random"
+        context: Processing context holding the extraction timestamp
+        chunk_rows: Child rows per emitted chunk (defaults to
+            config.batch_size)
+        read_buffer_size: Bytes requested from the input per ijson read
+        use_decimal: Parse non-integer numbers as Decimal instead of float
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread
+
+    Yields:
+        (main records, child tables) chunks
+
+    Raises:
+        ConfigurationError: If the configuration is not supported
+        MissingDependencyError: If ijson is not installed
+        ValidationError: If the input is not valid JSON or its root values
+            are not objects
+    """
+    check_event_config(config)
+    flattener = _DocumentFlattener(
+        entity_name, config, context, chunk_rows or config.batch_size
+    )
+    label = source if isinstance(source, str) else "JSON data"
+    handle = (
+        open_decompressed(source, read_ahead=read_ahead)
+        if isinstance(source, str)
+        else io.BytesIO(source)
+    )
+    documents = 0
+    logger.debug(
+        "event flattening started, source=%s, backend=%s", label, IJSON_BACKEND
+    )
+    try:
+        with handle:
+            events: Events = iter(
+                _ijson.basic_parse(
+                    handle, buf_size=read_buffer_size, use_float=not use_decimal
+                )
+            )
+            event, _ = next(events, ("", None))
+            if event == "start_map":
+                documents += 1
+                yield from flattener.document(events)
+            elif event == "start_array":
+                for event, _ in events:
+                    if event == "end_array":
+                        break
+                    if event != "start_map":
+                        kind = "list" if event == "start_array" else event
+                        raise ValidationError(
+                            f"Expected JSON object at index {documents} in "
+                            f"{label}, got {kind}"
+                        )
+                    documents += 1
+                    yield from flattener.document(events)
+            else:
+                raise ValidationError(f"Expected JSON object or array in {label}")
+    except _ijson.common.IncompleteJSONError as exc:
+        raise ValidationError(f"Invalid JSON in {label}: {exc}") from exc
+    except OSError as exc:
+        raise ValidationError(f"Error reading file {label}: {exc}") from exc
+    logger.debug("event flattening completed, documents=%d", documents)
+
+
+__all__ = ["check_event_config", "iter_document_tables"]
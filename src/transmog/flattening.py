@@ -46,6 +46,26 @@ def is_null_like(value: Any) -> bool:
 # ============================================================================
 
 
+def _json_default(value: Any) -> str:
+    """Encode values JSON has no type for, such as those of columnar input.
+
+    Dates and times become ISO 8601 strings, bytes hex strings and anything
+    else (Decimal, numpy scalars) its str() form.
+
+    Args:
+        value: Value json.dumps() cannot serialize
+
+    Returns:
+        String representation of the value
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    isoformat = getattr(value, "isoformat", None)
+    if callable(isoformat):
+        return str(isoformat())
+    return str(value)
+
+
 def _hash_value(value: Any) -> str:
     """Generate a deterministic UUID5 from a value.
 
@@ -56,7 +76,9 @@ def _hash_value(value: Any) -> str:
         UUID5 string
     """
     if isinstance(value, (dict, list)):
-        value_str = json.dumps(value, sort_keys=True, ensure_ascii=False)
+        value_str = json.dumps(
+            value, sort_keys=True, ensure_ascii=False, default=_json_default
+        )
     else:
         value_str = str(value)
 
@@ -345,7 +367,9 @@ def flatten_json(
             if config.array_mode == ArrayMode.SKIP:
                 continue
             elif config.array_mode == ArrayMode.INLINE:
-                result[current_path] = json.dumps(value, ensure_ascii=False)
+                result[current_path] = json.dumps(
+                    value, ensure_ascii=False, default=_json_default
+                )
             elif config.array_mode == ArrayMode.SMART:
                 is_simple, array_items = _process_array_items(
                     value,
@@ -576,9 +600,80 @@ def process_record_batch(
     return flattened_records, all_child_arrays
 
 
+def partition_record_batch(
+    records: list[JsonDict],
+    entity_name: str,
+    config: TransmogConfig,
+    _context: ProcessingContext,
+    partition_by: list[str],
+) -> dict[
+    tuple[Any, ...], tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]
+]:
+    """Process a batch of records grouped by partition values.
+
+    Partition values are read from each flattened main record. Child records
+    are grouped with the root record they were extracted from, so every table
+    of a partition only holds rows belonging to that partition's roots.
+
+    Args:
+        records: List of records to process
+        entity_name: Entity name
+        config: Configuration settings
+        _context: Processing context
+        partition_by: Main table column names to partition by
+
+    Returns:
+        Mapping of partition values to (flattened_records, child_arrays),
+        in order of first appearance. Booleans are given as "true" and
+        "false", so they do not share a group with the equal ints 1 and 0.
+
+    Raises:
+        ValidationError: If a partition column holds a non-scalar value
+    """
+    logger.debug(
+        "processing partitioned batch, records=%d, entity=%s",
+        len(records),
+        entity_name,
+    )
+
+    groups: dict[
+        tuple[Any, ...], tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]
+    ] = {}
+
+    for record in records:
+        flattened, child_arrays = _process_structure(
+            record,
+            entity_name,
+            config,
+            _context,
+        )
+
+        values = tuple(flattened.get(column) for column in partition_by)
+        for column, value in zip(partition_by, values, strict=True):
+            if isinstance(value, (list, dict)):
+                raise ValidationError(
+                    f"Partition column '{column}' must hold scalar values, "
+                    f"got {type(value).__name__}"
+                )
+
+        values = tuple(
+            ("true" if value else "false") if isinstance(value, bool) else value
+            for value in values
+        )
+        main_records, child_tables = groups.setdefault(values, ([], {}))
+        if flattened:
+            main_records.append(flattened)
+
+        for table_name, table_records in child_arrays.items():
+            child_tables.setdefault(table_name, []).extend(table_records)
+
+    return groups
+
+
 __all__ = [
     "get_current_timestamp",
     "annotate_with_metadata",
     "process_record_batch",
+    "partition_record_batch",
     "is_null_like",
 ]
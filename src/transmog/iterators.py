@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import glob
+import io
 import json
 import logging
+import multiprocessing
 import os
+import re
+from collections import deque
 from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any
-
-from transmog.exceptions import ValidationError
+from typing import IO, Any, cast
+
+from transmog.cache import ParseCache, as_parse_cache
+from transmog.columnar import (
+    COLUMNAR_EXTENSIONS,
+    DataFrameLike,
+    dataframe_kind,
+    get_columnar_file_iterator,
+    get_dataframe_iterator,
+)
+from transmog.compression import (
+    content_extension,
+    detect_compression,
+    open_decompressed,
+)
+from transmog.exceptions import ConfigurationError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -33,81 +58,491 @@ try:
 except ImportError:
     _ijson = None  # type: ignore[assignment]
 
+# ijson backends in order of preference; yajl2_c is a C extension several
+# times faster than the pure-Python parser
+IJSON_BACKENDS = ("yajl2_c", "yajl2_cffi", "yajl2", "python")
+
+
+def _select_ijson_backend(module: Any) -> Any:
+    """Load the most preferred ijson backend that is available."""
+    for name in IJSON_BACKENDS:
+        try:
+            return module.get_backend(name)
+        except ImportError:
+            continue
+    return module
+
+
+if _ijson is not None:
+    _ijson = _select_ijson_backend(_ijson)
+
 IJSON_AVAILABLE: bool = _ijson is not None
 
+# Name of the ijson backend used for streaming JSON parsing
+IJSON_BACKEND: str | None = _ijson.backend_name if _ijson is not None else None
+
+# Bytes requested per read by ijson (its own default is 64 KiB)
+IJSON_READ_BUFFER = 1024 * 1024
+
+# Bytes read at the start of a file to find its first non-whitespace byte
+PEEK_SIZE = 4096
+
+# Bytes requested per read when peeking at the start of a stream
+STREAM_PEEK_SIZE = 64 * 1024
+
+# Most bytes peeked to find the first lines of a stream starting with "{"
+STREAM_PEEK_MAX_SIZE = 4 * 1024 * 1024
+
 if _orjson is not None:
     JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (
         json.JSONDecodeError,
         _orjson.JSONDecodeError,
     )
 else:
-    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+# Buffer size for reading JSON Lines files in binary mode, and block size
+# for splitting in-memory JSON Lines content
+JSONL_READ_BUFFER = 1024 * 1024
+
+# Lines starting with "{" parsed to tell in-memory JSON Lines from JSON
+FORMAT_SNIFF_LINES = 5
+
+# In-memory input accepted as JSON or JSON Lines content
+BytesLike = bytes | bytearray | memoryview
+
+# Readable binary or text stream, such as sys.stdin
+Stream = IO[bytes] | IO[str]
+
+_NON_WHITESPACE = re.compile(rb"\S")
+_LINE_BREAK = re.compile(rb"\n")
+_CONTENT_AFTER_LINE_BREAK = re.compile(rb"\n\s*\S")
+
+# Target size of the byte ranges parsed by each worker task
+JSONL_PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Threads reading the files of a multi-file input
+MULTI_FILE_READ_WORKERS = 4
+
+# Files of a multi-file input read ahead of the consumer
+MULTI_FILE_PREFETCH = 16
+
+# Larger files are streamed by the consumer instead of loaded whole ahead
+MULTI_FILE_PREFETCH_MAX_SIZE = 64 * 1024 * 1024
 
 
 def get_data_iterator(
     data: (
         dict[str, Any]
         | list[dict[str, Any]]
+        | list[str | Path]
         | str
         | Path
-        | bytes
+        | BytesLike
+        | Stream
+        | DataFrameLike
         | Iterator[dict[str, Any]]
     ),
     *,
     streaming: bool = False,
+    parse_workers: int | None = None,
+    ordered: bool = True,
+    source_field: str | None = None,
+    read_workers: int = MULTI_FILE_READ_WORKERS,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
 ) -> Iterator[dict[str, Any]]:
     """Return an iterator over input records.
 
     Args:
-        data: Input data in various formats
+        data: Input data in various formats. A directory, a glob pattern or
+            a list of file paths reads every file in turn. .parquet, .orc,
+            .avro and .arrow files are read batch by batch. bytes, bytearray
+            and memoryview content is parsed without decoding or copying it
+            whole. A readable binary or text stream, such as sys.stdin, is
+            read incrementally. A pandas or polars DataFrame is converted
+            in slices through Arrow.
         streaming: When True and ijson is available, use streaming JSON
             parsing for .json files to reduce memory usage.
+        parse_workers: Number of worker processes parsing .jsonl and .ndjson
+            files in parallel byte ranges. None parses in this process.
+            Ignored for compressed files, which are read sequentially, and
+            for multi-file input.
+        ordered: With parse_workers, yield records in file order. When
+            False, ranges are yielded as soon as they are parsed.
+        source_field: Field to add to each record of file input, holding
+            the path of the file it was read from
+        read_workers: Threads reading ahead the files of multi-file input
+        record_path: ijson-style prefix of the records inside each input
+            document, such as "data.item" for ``{"data": [...]}``. Large
+            .json files are streamed at this prefix when streaming is on.
+        record_meta: Keys next to the records' array to copy into each
+            record, such as ["meta"] for ``{"meta": {...}, "data": [...]}``
+        read_buffer_size: Bytes read at a time when streaming .json files
+            with ijson
+        use_decimal: Parse non-integer numbers of streamed .json files as
+            Decimal instead of float, preserving their exact digits
+        parse_cache: Cache directory, or ParseCache, reusing the parsed
+            content of .json5 and .hjson files across runs
+        read_ahead: Bytes of a .jsonl, .ndjson or streamed .json file to
+            read ahead on a background thread, overlapping disk reads with
+            record processing. None reads on the calling thread.
 
     Returns:
         Iterator over data records
     """
-    if isinstance(data, dict):
-        return iter([data])
-    if isinstance(data, list):
-        return iter(data)
-    if isinstance(data, Iterator):
-        return data
+    cache = as_parse_cache(parse_cache)
+    documents: Iterator[dict[str, Any]] | None = None
+    if is_stream(data):
+        documents = get_stream_iterator(
+            cast(Stream, data),
+            streaming=streaming,
+            read_buffer_size=read_buffer_size,
+            use_decimal=use_decimal,
+        )
+    elif dataframe_kind(data) is not None:
+        documents = get_dataframe_iterator(cast(DataFrameLike, data))
+    elif isinstance(data, dict):
+        documents = iter([data])
+    elif isinstance(data, list) and not is_path_list(data):
+        documents = iter(cast(list[dict[str, Any]], data))
+    elif isinstance(data, Iterator):
+        documents = cast(Iterator[dict[str, Any]], data)
+    if documents is not None:
+        if record_path is not None:
+            return select_records(documents, record_path, record_meta)
+        return documents
+
+    paths = resolve_input_paths(data)
+    if paths is not None:
+        return get_multi_file_iterator(
+            paths,
+            streaming=streaming,
+            source_field=source_field,
+            read_workers=read_workers,
+            record_path=record_path,
+            record_meta=record_meta,
+            read_buffer_size=read_buffer_size,
+            use_decimal=use_decimal,
+            parse_cache=cache,
+            read_ahead=read_ahead,
+        )
 
     if isinstance(data, Path):
         data = str(data)
 
+    if isinstance(data, str) and source_field and os.path.isfile(data):
+        return _tag_source(
+            get_data_iterator(
+                data,
+                streaming=streaming,
+                parse_workers=parse_workers,
+                ordered=ordered,
+                record_path=record_path,
+                record_meta=record_meta,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                parse_cache=cache,
+                read_ahead=read_ahead,
+            ),
+            source_field,
+            data,
+        )
+
+    if record_path is not None:
+        if (
+            streaming
+            and IJSON_AVAILABLE
+            and isinstance(data, str)
+            and os.path.isfile(data)
+            and content_extension(data) == ".json"
+        ):
+            return get_json_file_iterator_streaming(
+                data,
+                record_path,
+                record_meta,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                read_ahead=read_ahead,
+            )
+        return select_records(
+            get_data_iterator(
+                data,
+                streaming=streaming,
+                parse_workers=parse_workers,
+                ordered=ordered,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                parse_cache=cache,
+                read_ahead=read_ahead,
+            ),
+            record_path,
+            record_meta,
+        )
+
     if isinstance(data, str) and os.path.exists(data):
-        extension = os.path.splitext(data)[1].lower()
-        logger.debug("file input detected, path=%s, extension=%s", data, extension)
+        extension = content_extension(data)
+        compression = detect_compression(data)
+        logger.debug(
+            "file input detected, path=%s, extension=%s, compression=%s",
+            data,
+            extension,
+            compression,
+        )
         if extension in (".jsonl", ".ndjson"):
-            return get_jsonl_file_iterator(data)
+            if parse_workers is not None and compression is None:
+                return get_jsonl_parallel_iterator(data, parse_workers, ordered)
+            return get_jsonl_file_iterator(data, read_ahead)
+        if extension in COLUMNAR_EXTENSIONS:
+            return get_columnar_file_iterator(data)
         if extension == ".json5":
-            return get_json5_file_iterator(data)
+            return get_json5_file_iterator(data, cache)
         if extension == ".hjson":
-            return get_hjson_file_iterator(data)
+            return get_hjson_file_iterator(data, cache)
         if streaming and IJSON_AVAILABLE:
-            return get_json_file_iterator_streaming(data)
+            return get_json_file_iterator_streaming(
+                data,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                read_ahead=read_ahead,
+            )
         return get_json_file_iterator(data)
 
-    if isinstance(data, (str, bytes)):
-        text = data if isinstance(data, str) else data.decode("utf-8")
-        if not text.strip():
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        view = _as_buffer(data)
+        if _NON_WHITESPACE.search(view) is None:
             raise ValidationError("No JSON content provided")
 
-        normalised = _detect_string_format(text)
-        logger.debug("string format detected as %s", normalised)
-
-        if normalised == "jsonl":
-            return get_jsonl_data_iterator(data)
-        if normalised == "json":
-            return get_json_data_iterator(data)
-        raise ValueError(f"Unsupported input format: {normalised}")
+        sniffed = _sniff_jsonl(view)
+        logger.debug(
+            "string format detected as %s", "json" if sniffed is None else "jsonl"
+        )
+        if sniffed is not None:
+            return _iter_sniffed_jsonl(*sniffed)
+        return get_json_data_iterator(view)
 
     raise ValidationError(f"Unsupported data type: {type(data)}")
 
 
+def is_path_list(data: Any) -> bool:
+    """Check whether input is a non-empty list of file paths.
+
+    Args:
+        data: Input data
+
+    Returns:
+        True for a list or tuple containing only strings and Paths
+    """
+    return (
+        isinstance(data, (list, tuple))
+        and bool(data)
+        and all(isinstance(item, (str, Path)) for item in data)
+    )
+
+
+def _is_glob_pattern(value: str) -> bool:
+    """Check whether a string is a glob pattern rather than inline JSON."""
+    stripped = value.lstrip()
+    return (
+        any(char in value for char in "*?[")
+        and "\n" not in value
+        and not stripped.startswith(("{", "["))
+    )
+
+
+def _list_directory(directory: str) -> list[str]:
+    """List the files below a directory, sorted by path.
+
+    Names starting with "." or "_" (such as ``_SUCCESS`` markers and
+    manifests) are skipped, as are directories with such names.
+    """
+    files: list[str] = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [d for d in dirs if not d.startswith((".", "_"))]
+        files.extend(
+            os.path.join(root, name)
+            for name in names
+            if not name.startswith((".", "_"))
+        )
+    return sorted(files)
+
+
+def resolve_input_paths(data: Any) -> list[str] | None:
+    """Expand a multi-file input into the files it names.
+
+    Args:
+        data: Input data: a directory, a glob pattern or a list of paths
+
+    Returns:
+        File paths in reading order, or None if the input is not a
+        multi-file input
+
+    Raises:
+        ValidationError: If no files are found or a listed file is missing
+    """
+    if is_path_list(data):
+        paths = [str(item) for item in data]
+        for path in paths:
+            if not os.path.isfile(path):
+                raise ValidationError(f"File not found: {path}")
+        return paths
+
+    if isinstance(data, Path):
+        data = str(data)
+    if not isinstance(data, str):
+        return None
+
+    if os.path.isdir(data):
+        paths = _list_directory(data)
+        if not paths:
+            raise ValidationError(f"No files found in directory: {data}")
+        return paths
+
+    if not os.path.exists(data) and _is_glob_pattern(data):
+        paths = sorted(
+            path for path in glob.glob(data, recursive=True) if os.path.isfile(path)
+        )
+        if not paths:
+            raise ValidationError(f"No files match pattern: {data}")
+        return paths
+    return None
+
+
+def _tag_source(
+    records: Iterable[dict[str, Any]], source_field: str, source: str
+) -> Iterator[dict[str, Any]]:
+    """Add the source file path to each record.
+
+    Every record of a file shares the same string object.
+    """
+    for record in records:
+        record[source_field] = source
+        yield record
+
+
+def _read_file(
+    file_path: str,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    parse_cache: ParseCache | None = None,
+) -> list[dict[str, Any]]:
+    """Load all records of one file of a multi-file input."""
+    records = list(
+        get_data_iterator(
+            file_path,
+            record_path=record_path,
+            record_meta=record_meta,
+            parse_cache=parse_cache,
+        )
+    )
+    if source_field:
+        for record in records:
+            record[source_field] = file_path
+    return records
+
+
+def get_multi_file_iterator(
+    paths: list[str],
+    *,
+    streaming: bool = False,
+    source_field: str | None = None,
+    read_workers: int = MULTI_FILE_READ_WORKERS,
+    prefetch: int = MULTI_FILE_PREFETCH,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | None = None,
+    read_ahead: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the records of several files as one input.
+
+    Files are loaded by a pool of ``read_workers`` threads, at most
+    ``prefetch`` files ahead of the consumer, which hides the open and read
+    latency of many small files. Records are yielded in file order. Files
+    larger than ``MULTI_FILE_PREFETCH_MAX_SIZE`` are not loaded ahead but
+    streamed when their turn comes.
+
+    Args:
+        paths: File paths in reading order
+        streaming: Use streaming JSON parsing for large .json files
+        source_field: Field to add to each record, holding its file path
+        read_workers: Number of reader threads
+        prefetch: Maximum number of files loaded ahead
+        record_path: ijson-style prefix of the records inside each file
+        record_meta: Keys next to the records' array to copy into each record
+        read_buffer_size: Bytes read at a time when streaming .json files
+        use_decimal: Parse non-integer numbers of streamed .json files as
+            Decimal
+        parse_cache: Cache of parsed .json5 and .hjson files
+        read_ahead: Bytes of each streamed file to read ahead on a
+            background thread
+
+    Returns:
+        Iterator over data records
+
+    Raises:
+        ConfigurationError: If read_workers or prefetch is less than 1
+    """
+    if read_workers < 1:
+        raise ConfigurationError("read_workers must be at least 1")
+    if prefetch < 1:
+        raise ConfigurationError("prefetch must be at least 1")
+
+    logger.debug(
+        "multi-file input started, files=%d, read_workers=%d",
+        len(paths),
+        read_workers,
+    )
+    remaining = deque(paths)
+    pending: deque[tuple[str, Future[list[dict[str, Any]]] | None]] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=read_workers, thread_name_prefix="transmog-read"
+    )
+    try:
+        while remaining or pending:
+            while remaining and len(pending) < prefetch:
+                path = remaining.popleft()
+                if os.path.getsize(path) > MULTI_FILE_PREFETCH_MAX_SIZE:
+                    pending.append((path, None))
+                else:
+                    loaded = executor.submit(
+                        _read_file,
+                        path,
+                        source_field,
+                        record_path,
+                        record_meta,
+                        parse_cache,
+                    )
+                    pending.append((path, loaded))
+            path, future = pending.popleft()
+            if future is not None:
+                yield from future.result()
+                continue
+            records = get_data_iterator(
+                path,
+                streaming=streaming,
+                record_path=record_path,
+                record_meta=record_meta,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                parse_cache=parse_cache,
+                read_ahead=read_ahead,
+            )
+            if source_field:
+                records = _tag_source(records, source_field, path)
+            yield from records
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def get_json_data_iterator(
-    data: dict[str, Any] | list[dict[str, Any]] | str | bytes,
+    data: dict[str, Any] | list[dict[str, Any]] | str | BytesLike,
 ) -> Iterator[dict[str, Any]]:
     """Iterate over JSON data loaded into memory."""
     if isinstance(data, dict):
@@ -123,7 +558,7 @@ def get_json_data_iterator(
             yield item
         return
 
-    if not isinstance(data, (str, bytes)):
+    if not isinstance(data, (str, bytes, bytearray, memoryview)):
         raise ValidationError("JSON data must be a string, bytes, dict, or list")
 
     payload = data
@@ -153,19 +588,42 @@ def get_json_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
     yield from _iter_parsed_json(parsed)
 
 
-def get_json_file_iterator_streaming(file_path: str) -> Iterator[dict[str, Any]]:
+def get_json_file_iterator_streaming(
+    file_path: str,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    *,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    read_ahead: int | None = None,
+) -> Iterator[dict[str, Any]]:
     """Iterate over records in a JSON file using streaming parsing.
 
     Uses ijson for constant-memory parsing of large JSON arrays.
-    Single-object files fall back to standard loading.
+    Single-object files fall back to standard loading, unless
+    ``record_path`` points into them: then only the records at that prefix
+    are built, so a wrapper object around a huge array streams as well.
 
     Args:
         file_path: Path to the JSON file
+        record_path: ijson-style prefix of the records, such as "data.item"
+        record_meta: Keys next to the records' array to copy into each
+            record. Each key costs a parse of the file up to where it is
+            found.
+        read_buffer_size: Bytes requested from the file per ijson read
+        use_decimal: Parse non-integer numbers as Decimal instead of float
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread
 
     Returns:
         Iterator over data records
     """
-    logger.debug("streaming JSON parse requested, path=%s", file_path)
+    logger.debug(
+        "streaming JSON parse requested, path=%s, backend=%s, buffer=%d",
+        file_path,
+        IJSON_BACKEND,
+        read_buffer_size,
+    )
 
     if _ijson is None:
         raise ValidationError(
@@ -178,6 +636,25 @@ def get_json_file_iterator_streaming(file_path: str) -> Iterator[dict[str, Any]]
 
     first_byte = _peek_first_byte(file_path)
 
+    options = {"buf_size": read_buffer_size, "use_float": not use_decimal}
+    if record_path is not None:
+        if first_byte == ord("{"):
+            yield from _stream_record_path(
+                file_path, record_path, record_meta, options, read_ahead
+            )
+        else:
+            yield from select_records(
+                get_json_file_iterator_streaming(
+                    file_path,
+                    read_buffer_size=read_buffer_size,
+                    use_decimal=use_decimal,
+                    read_ahead=read_ahead,
+                ),
+                record_path,
+                record_meta,
+            )
+        return
+
     if first_byte == ord("{"):
         yield from get_json_file_iterator(file_path)
         return
@@ -189,20 +666,280 @@ def get_json_file_iterator_streaming(file_path: str) -> Iterator[dict[str, Any]]
         )
 
     try:
-        with open(file_path, "rb") as handle:
-            for index, item in enumerate(_ijson.items(handle, "item")):
-                if not isinstance(item, dict):
-                    raise ValidationError(
-                        f"Expected JSON object at index {index} in "
-                        f"{file_path}, got {type(item).__name__}"
-                    )
-                yield item
+        with open_decompressed(file_path, read_ahead=read_ahead) as handle:
+            yield from _iter_ijson_array(handle, file_path, options)
+    except _ijson.common.IncompleteJSONError as exc:
+        raise ValidationError(f"Invalid JSON in file {file_path}: {exc}") from exc
+    except OSError as exc:
+        raise ValidationError(f"Error reading file {file_path}: {exc}") from exc
+
+
+def _iter_ijson_array(
+    handle: IO[bytes], source: str, options: dict[str, Any]
+) -> Iterator[dict[str, Any]]:
+    """Yield the objects of a top-level JSON array with ijson."""
+    for index, item in enumerate(_ijson.items(handle, "item", **options)):
+        if not isinstance(item, dict):
+            raise ValidationError(
+                f"Expected JSON object at index {index} in "
+                f"{source}, got {type(item).__name__}"
+            )
+        yield item
+
+
+def is_stream(data: Any) -> bool:
+    """Check whether input is a readable file-like object.
+
+    Args:
+        data: Input data
+
+    Returns:
+        True for objects with a ``read`` method, such as open files,
+        sockets' file objects and sys.stdin
+    """
+    return callable(getattr(data, "read", None))
+
+
+class _PeekedStream(io.RawIOBase):
+    """Raw binary stream replaying peeked bytes before the rest of a stream.
+
+    Text streams without an underlying binary buffer are encoded as UTF-8.
+    Closing this stream leaves the wrapped stream open.
+    """
+
+    def __init__(self, head: bytes, stream: Stream) -> None:
+        super().__init__()
+        self._pending = memoryview(head)
+        self._read = cast(Any, getattr(stream, "read1", stream.read))
+
+    def readable(self) -> bool:
+        """Whether the stream can be read (always True)."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into a buffer, returning 0 at the end of the stream."""
+        if not self._pending:
+            chunk = self._read(len(buffer))
+            if not chunk:
+                return 0
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _binary_source(stream: Stream) -> Stream:
+    """Return the binary buffer under a text stream, if it has one."""
+    if isinstance(stream, io.TextIOBase):
+        return cast(Stream, getattr(stream, "buffer", stream))
+    return stream
+
+
+def _peek_stream(stream: Stream) -> bytes:
+    """Read the start of a stream, enough to tell its format.
+
+    Reading stops after the first chunk unless the content starts with
+    "{", in which case it continues until FORMAT_SNIFF_LINES lines are
+    complete, the stream ends, or STREAM_PEEK_MAX_SIZE bytes were read.
+    """
+    read = cast(Any, getattr(stream, "read1", stream.read))
+    head = b""
+    while len(head) < STREAM_PEEK_MAX_SIZE:
+        chunk = read(STREAM_PEEK_SIZE)
+        if not chunk:
+            break
+        head += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        content = head.lstrip()
+        if content and (
+            not content.startswith(b"{") or content.count(b"\n") > FORMAT_SNIFF_LINES
+        ):
+            break
+    return head
+
+
+def get_stream_iterator(
+    stream: Stream,
+    *,
+    streaming: bool = False,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the records of a readable stream.
+
+    The format is told from the first bytes of the stream, using the same
+    rules as for in-memory content. JSON Lines are read in blocks and
+    split as bytes, so memory stays constant however long the stream is.
+    A top-level JSON array is parsed with ijson when ``streaming`` is set;
+    any other JSON document is read whole. The stream is not closed.
+
+    Args:
+        stream: Binary or text stream, such as ``sys.stdin`` or an open
+            file. Text streams are read through their binary buffer when
+            they have one.
+        streaming: Parse a JSON array incrementally with ijson
+        read_buffer_size: Bytes requested per ijson read
+        use_decimal: Parse non-integer numbers of a streamed array as
+            Decimal
+
+    Returns:
+        Iterator over data records
+
+    Raises:
+        ValidationError: If the stream holds no JSON content or is invalid
+    """
+    source = _binary_source(stream)
+    label = str(getattr(stream, "name", "stream"))
+    head = _peek_stream(source)
+    start = _NON_WHITESPACE.search(head)
+    if start is None:
+        raise ValidationError(f"No JSON content provided in {label}")
+
+    handle = io.BufferedReader(_PeekedStream(head, source), JSONL_READ_BUFFER)
+    first = head[start.start()]
+    if first == ord("{") and _sniff_jsonl(memoryview(head)) is not None:
+        logger.debug("stream format detected as jsonl, source=%s", label)
+        yield from _iter_jsonl_bytes(handle, label)
+    elif first == ord("[") and streaming and IJSON_AVAILABLE:
+        logger.debug(
+            "stream format detected as json array, source=%s, backend=%s",
+            label,
+            IJSON_BACKEND,
+        )
+        options = {"buf_size": read_buffer_size, "use_float": not use_decimal}
+        try:
+            yield from _iter_ijson_array(handle, label, options)
+        except _ijson.common.IncompleteJSONError as exc:
+            raise ValidationError(f"Invalid JSON in {label}: {exc}") from exc
+    else:
+        logger.debug("stream format detected as json, source=%s", label)
+        yield from get_json_data_iterator(handle.read())
+
+
+def _stream_record_path(
+    file_path: str,
+    record_path: str,
+    record_meta: list[str] | None,
+    options: dict[str, Any],
+    read_ahead: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream the records at a prefix of a JSON object file with ijson."""
+    _, parent = _parse_record_path(record_path, record_meta)
+    try:
+        meta = {}
+        for key in record_meta or []:
+            with open_decompressed(file_path) as handle:
+                prefix = ".".join([*parent, key])
+                for value in _ijson.items(handle, prefix, **options):
+                    meta[key] = value
+                    break
+        with open_decompressed(file_path, read_ahead=read_ahead) as handle:
+            for value in _ijson.items(handle, record_path, **options):
+                for record in _iter_selected(value, record_path, file_path):
+                    _attach_meta(record, meta)
+                    yield record
     except _ijson.common.IncompleteJSONError as exc:
         raise ValidationError(f"Invalid JSON in file {file_path}: {exc}") from exc
     except OSError as exc:
         raise ValidationError(f"Error reading file {file_path}: {exc}") from exc
 
 
+def _parse_record_path(
+    record_path: str, record_meta: list[str] | None = None
+) -> tuple[list[str], list[str]]:
+    """Split a record path into its keys and those of the records' parent.
+
+    Raises:
+        ConfigurationError: If the path is malformed, or record_meta is set
+            and an array lies between the document root and the records
+    """
+    parts = record_path.split(".")
+    if not record_path or "" in parts:
+        raise ConfigurationError(f"Invalid record_path: {record_path!r}")
+    array = parts[:-1] if parts[-1] == "item" else parts
+    parent = array[:-1]
+    if record_meta and "item" in parent:
+        raise ConfigurationError(
+            "record_meta requires a record_path without arrays above the records"
+        )
+    return parts, parent
+
+
+def _select_path(value: Any, parts: list[str]) -> Iterator[Any]:
+    """Yield the values at a path, where "item" steps into array elements."""
+    if not parts:
+        yield value
+        return
+    head, rest = parts[0], parts[1:]
+    if head == "item" and isinstance(value, list):
+        for element in value:
+            yield from _select_path(element, rest)
+    elif isinstance(value, dict) and head in value:
+        yield from _select_path(value[head], rest)
+
+
+def _iter_selected(value: Any, record_path: str, source: str) -> Iterator[Any]:
+    """Yield the records in a value found at the record path."""
+    values = value if isinstance(value, list) else [value]
+    for item in values:
+        if not isinstance(item, dict):
+            raise ValidationError(
+                f"Expected JSON object at {record_path!r} in {source}, "
+                f"got {type(item).__name__}"
+            )
+        yield item
+
+
+def _attach_meta(record: dict[str, Any], meta: dict[str, Any]) -> None:
+    """Copy document metadata into a record without replacing its fields."""
+    for key, value in meta.items():
+        record.setdefault(key, value)
+
+
+def select_records(
+    documents: Iterable[dict[str, Any]],
+    record_path: str,
+    record_meta: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the records nested at a path inside each document.
+
+    The path uses ijson prefix syntax: keys separated by dots, with "item"
+    standing for the elements of an array. ``"data.item"`` selects the
+    elements of the ``data`` array; a path ending at an array selects its
+    elements too.
+
+    Args:
+        documents: Parsed input documents
+        record_path: Path of the records inside each document
+        record_meta: Keys of the object holding the records' array whose
+            values are copied into each record. Fields already present in
+            a record are kept.
+
+    Returns:
+        Iterator over the selected records
+
+    Raises:
+        ConfigurationError: If the record path is malformed
+    """
+    parts, parent = _parse_record_path(record_path, record_meta)
+
+    def records() -> Iterator[dict[str, Any]]:
+        for document in documents:
+            meta: dict[str, Any] = {}
+            if record_meta:
+                holder = next(_select_path(document, parent), None)
+                if isinstance(holder, dict):
+                    meta = {key: holder[key] for key in record_meta if key in holder}
+            for value in _select_path(document, parts):
+                for record in _iter_selected(value, record_path, "input"):
+                    _attach_meta(record, meta)
+                    yield record
+
+    return records()
+
+
 def _peek_first_byte(file_path: str) -> int:
     """Read the first non-whitespace byte from a file.
 
@@ -215,20 +952,23 @@ def _peek_first_byte(file_path: str) -> int:
     Raises:
         ValidationError: If the file is empty or whitespace-only.
     """
-    with open(file_path, "rb") as handle:
-        while True:
-            byte = handle.read(1)
-            if not byte:
-                raise ValidationError(f"File is empty: {file_path}")
-            if not byte.isspace():
-                return byte[0]
+    with open_decompressed(file_path) as handle:
+        while chunk := handle.read(PEEK_SIZE):
+            content = chunk.lstrip()
+            if content:
+                return content[0]
+    raise ValidationError(f"File is empty: {file_path}")
 
 
-def get_jsonl_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
+def get_jsonl_file_iterator(
+    file_path: str, read_ahead: int | None = None
+) -> Iterator[dict[str, Any]]:
     """Iterate over records in a JSON Lines file.
 
     Args:
         file_path: Path to the JSONL file
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread
 
     Returns:
         Iterator over data records
@@ -237,37 +977,228 @@ def get_jsonl_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
         raise ValidationError(f"File not found: {file_path}")
 
     try:
-        with open(file_path, encoding="utf-8") as handle:
-            yield from _iter_jsonl_lines(handle, file_path)
+        with open_decompressed(
+            file_path, buffer_size=JSONL_READ_BUFFER, read_ahead=read_ahead
+        ) as handle:
+            yield from _iter_jsonl_bytes(handle, file_path)
     except OSError as exc:
         raise ValidationError(f"Error reading file {file_path}: {exc}") from exc
 
 
-def get_jsonl_data_iterator(data: str | bytes) -> Iterator[dict[str, Any]]:
+def get_jsonl_file_positions(
+    file_path: str, offset: int = 0, line: int = 0, read_ahead: int | None = None
+) -> Iterator[tuple[dict[str, Any], int, int]]:
+    """Iterate over JSON Lines records with the file position after each.
+
+    Used for checkpointing, where a later run seeks straight to the
+    position after the last processed record instead of re-reading.
+
+    Args:
+        file_path: Path to the JSONL file
+        offset: Byte offset to start reading at
+        line: Number of lines before the offset
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread
+
+    Returns:
+        Iterator over (record, byte offset after it, lines read) tuples
+    """
+    if not os.path.exists(file_path):
+        raise ValidationError(f"File not found: {file_path}")
+
+    try:
+        with open_decompressed(
+            file_path,
+            buffer_size=JSONL_READ_BUFFER,
+            read_ahead=read_ahead,
+            offset=offset,
+        ) as handle:
+            for raw_line in handle:
+                offset += len(raw_line)
+                line += 1
+                for record in _iter_jsonl_bytes([raw_line], file_path, line):
+                    yield record, offset, line
+    except OSError as exc:
+        raise ValidationError(f"Error reading file {file_path}: {exc}") from exc
+
+
+def split_jsonl_file(file_path: str, parts: int) -> list[tuple[int, int]]:
+    """Split a JSON Lines file into byte ranges that start on line boundaries.
+
+    Args:
+        file_path: Path to the JSONL file
+        parts: Desired number of ranges
+
+    Returns:
+        Non-empty (start, end) byte ranges covering the file, at most
+        ``parts`` of them
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, "rb") as handle:
+        for index in range(1, parts):
+            target = size * index // parts
+            if target <= boundaries[-1]:
+                continue
+            # Move to the start of the line containing or following target
+            handle.seek(target - 1)
+            handle.readline()
+            position = handle.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:], strict=False)
+        if end > start
+    ]
+
+
+def get_jsonl_range_iterator(
+    file_path: str, start: int, end: int, read_ahead: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the JSON Lines records starting within a byte range.
+
+    Args:
+        file_path: Path to the JSONL file
+        start: Offset of the first line in the range
+        end: Offset at which the range ends
+        read_ahead: Bytes of the file to read ahead on a background thread,
+            or None to read on the calling thread. The reader may run past
+            the end of the range by up to this many bytes.
+
+    Returns:
+        Iterator over data records
+    """
+    if not os.path.exists(file_path):
+        raise ValidationError(f"File not found: {file_path}")
+
+    def lines(handle: Any) -> Iterator[bytes]:
+        position = start
+        for raw_line in handle:
+            if position >= end:
+                return
+            position += len(raw_line)
+            yield raw_line
+
+    try:
+        with open_decompressed(
+            file_path,
+            buffer_size=JSONL_READ_BUFFER,
+            read_ahead=read_ahead,
+            offset=start,
+        ) as handle:
+            yield from _iter_jsonl_bytes(
+                lines(handle), f"{file_path} (bytes {start}-{end})"
+            )
+    except OSError as exc:
+        raise ValidationError(f"Error reading file {file_path}: {exc}") from exc
+
+
+def _parse_jsonl_range(file_path: str, start: int, end: int) -> list[dict[str, Any]]:
+    """Parse the records of a JSONL byte range in a worker process."""
+    return list(get_jsonl_range_iterator(file_path, start, end))
+
+
+def get_jsonl_parallel_iterator(
+    file_path: str,
+    workers: int,
+    ordered: bool = True,
+    chunk_size: int = JSONL_PARALLEL_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over a JSON Lines file parsed by several worker processes.
+
+    The file is split into byte ranges of about ``chunk_size`` bytes on line
+    boundaries. Each range is parsed in a worker process and its records
+    sent back as one list. At most two ranges per worker are in flight, so
+    memory stays bounded however large the file is.
+
+    Args:
+        file_path: Path to the JSONL file
+        workers: Number of worker processes
+        ordered: Yield records in file order. When False, the records of
+            each range are yielded as soon as any worker finishes it.
+        chunk_size: Target size of each byte range
+
+    Returns:
+        Iterator over data records
+
+    Raises:
+        ConfigurationError: If workers is less than 1
+    """
+    if workers < 1:
+        raise ConfigurationError("parse_workers must be at least 1")
+    if not os.path.exists(file_path):
+        raise ValidationError(f"File not found: {file_path}")
+
+    size = os.path.getsize(file_path)
+    parts = max(workers, -(-size // max(1, chunk_size)))
+    ranges = deque(split_jsonl_file(file_path, parts))
+    if workers == 1 or len(ranges) <= 1:
+        yield from get_jsonl_file_iterator(file_path)
+        return
+
+    logger.debug(
+        "parallel JSONL parse started, path=%s, workers=%d, ranges=%d",
+        file_path,
+        workers,
+        len(ranges),
+    )
+    context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(
+        max_workers=min(workers, len(ranges)), mp_context=context
+    )
+    pending: deque[Future[list[dict[str, Any]]]] = deque()
+    try:
+        while ranges or pending:
+            while ranges and len(pending) < 2 * workers:
+                start, end = ranges.popleft()
+                pending.append(
+                    executor.submit(_parse_jsonl_range, file_path, start, end)
+                )
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def get_jsonl_data_iterator(data: str | BytesLike) -> Iterator[dict[str, Any]]:
     """Iterate over JSON Lines content.
 
     Args:
-        data: JSONL data as string or bytes
+        data: JSONL data as string, bytes, bytearray or memoryview. Binary
+            content is split one block at a time, without decoding.
 
     Returns:
         Iterator over data records
     """
-    if not isinstance(data, (str, bytes)):
+    if not isinstance(data, (str, bytes, bytearray, memoryview)):
         raise ValidationError("JSONL data must be a string or bytes")
 
-    text = data if isinstance(data, str) else data.decode("utf-8")
-    if not text.strip():
+    if not isinstance(data, str):
+        yield from _iter_jsonl_bytes(_split_lines(_as_buffer(data)), "JSONL data")
         return
 
-    lines = text.splitlines()
+    if not data.strip():
+        return
+
+    lines = data.splitlines()
     yield from _iter_jsonl_lines(lines, "JSONL data")
 
 
-def get_json5_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
+def get_json5_file_iterator(
+    file_path: str, parse_cache: ParseCache | None = None
+) -> Iterator[dict[str, Any]]:
     """Iterate over records in a JSON5 file.
 
     Args:
         file_path: Path to the JSON5 file
+        parse_cache: Cache to load the parsed file from, or store it in
 
     Returns:
         Iterator over data records
@@ -282,7 +1213,7 @@ def get_json5_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
         )
 
     try:
-        parsed = _load_json5_file(file_path)
+        parsed = _load_json5_file(file_path, parse_cache)
     except ValueError as exc:
         raise ValidationError(f"Invalid JSON5 in file {file_path}: {exc}") from exc
     except OSError as exc:
@@ -291,11 +1222,14 @@ def get_json5_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
     yield from _iter_parsed_json(parsed)
 
 
-def get_hjson_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
+def get_hjson_file_iterator(
+    file_path: str, parse_cache: ParseCache | None = None
+) -> Iterator[dict[str, Any]]:
     """Iterate over records in an HJSON file.
 
     Args:
         file_path: Path to the HJSON file
+        parse_cache: Cache to load the parsed file from, or store it in
 
     Returns:
         Iterator over data records
@@ -310,7 +1244,7 @@ def get_hjson_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
         )
 
     try:
-        parsed = _load_hjson_file(file_path)
+        parsed = _load_hjson_file(file_path, parse_cache)
     except ValueError as exc:
         raise ValidationError(f"Invalid HJSON in file {file_path}: {exc}") from exc
     except OSError as exc:
@@ -319,33 +1253,46 @@ def get_hjson_file_iterator(file_path: str) -> Iterator[dict[str, Any]]:
     yield from _iter_parsed_json(parsed)
 
 
-def _loads(value: str | bytes) -> Any:
+def _loads(value: str | BytesLike) -> Any:
     """Load JSON content using the fastest available parser."""
     if _orjson is not None:
         return _orjson.loads(value)
-    if isinstance(value, bytes):
-        return json.loads(value.decode("utf-8"))
+    if not isinstance(value, str):
+        return json.loads(bytes(value).decode("utf-8"))
     return json.loads(value)
 
 
+def _open_text(path: str) -> io.TextIOWrapper:
+    """Open a possibly compressed file as UTF-8 text."""
+    return io.TextIOWrapper(open_decompressed(path), encoding="utf-8")
+
+
 def _load_json_file(path: str) -> Any:
     """Load JSON payload from disk."""
     if _orjson is not None:
-        with open(path, "rb") as handle:
+        with open_decompressed(path) as handle:
             return _orjson.loads(handle.read())
-    with open(path, encoding="utf-8") as handle:
+    with _open_text(path) as handle:
         return json.load(handle)
 
 
-def _load_json5_file(path: str) -> Any:
+def _load_json5_file(path: str, parse_cache: ParseCache | None = None) -> Any:
     """Load JSON5 payload from disk."""
-    with open(path, encoding="utf-8") as handle:
+    if parse_cache is not None:
+        return parse_cache.load(
+            path, "json5", lambda content: _json5.loads(content.decode("utf-8"))
+        )
+    with _open_text(path) as handle:
         return _json5.load(handle)
 
 
-def _load_hjson_file(path: str) -> Any:
+def _load_hjson_file(path: str, parse_cache: ParseCache | None = None) -> Any:
     """Load HJSON payload from disk."""
-    with open(path, encoding="utf-8") as handle:
+    if parse_cache is not None:
+        return parse_cache.load(
+            path, "hjson", lambda content: _hjson.loads(content.decode("utf-8"))
+        )
+    with _open_text(path) as handle:
         return _hjson.load(handle)
 
 
@@ -369,17 +1316,20 @@ def _iter_parsed_json(payload: Any) -> Iterator[dict[str, Any]]:
     )
 
 
-def _iter_jsonl_lines(lines: Iterable[str], source: str) -> Iterator[dict[str, Any]]:
+def _iter_jsonl_lines(
+    lines: Iterable[str | bytes], source: str, start: int = 1
+) -> Iterator[dict[str, Any]]:
     """Yield dictionaries from JSON Lines content.
 
     Args:
         lines: Iterable of JSONL lines
         source: Source description for error messages
+        start: Line number of the first line, for error messages
 
     Returns:
         Iterator over data records
     """
-    for index, raw_line in enumerate(lines, 1):
+    for index, raw_line in enumerate(lines, start):
         line = raw_line.strip()
         if not line:
             continue
@@ -400,29 +1350,120 @@ def _iter_jsonl_lines(lines: Iterable[str], source: str) -> Iterator[dict[str, A
         yield record
 
 
-def _detect_string_format(value: str) -> str:
-    """Detect whether in-memory text is JSON or JSONL."""
-    snippet = value.strip()
-    if not snippet or "\n" not in snippet:
-        return "json"
+def _iter_jsonl_bytes(
+    lines: Iterable[bytes], source: str, start: int = 1
+) -> Iterator[dict[str, Any]]:
+    """Yield dictionaries from undecoded JSON Lines content.
 
-    hits = 0
-    checked = 0
-    for line in snippet.splitlines():
-        line = line.strip()
-        if not line or not line.startswith("{"):
-            continue
+    Lines go to the parser as raw bytes, without UTF-8 decoding or
+    stripping: JSON allows the surrounding whitespace and line break, so
+    blank lines are only told apart from invalid ones after a parse error.
+
+    Args:
+        lines: Iterable of JSONL lines as bytes
+        source: Source description for error messages
+        start: Line number of the first line, for error messages
+
+    Returns:
+        Iterator over data records
+    """
+    loads = _orjson.loads if _orjson is not None else json.loads
+    for index, raw_line in enumerate(lines, start):
         try:
-            _loads(line)
-            hits += 1
-        except JSON_DECODE_ERRORS:
-            pass
+            record = loads(raw_line)
+        except JSON_DECODE_ERRORS as exc:
+            if not raw_line.strip():
+                continue
+            raise ValidationError(
+                f"Invalid JSON on line {index} in {source}: {exc}"
+            ) from exc
+
+        if not isinstance(record, dict):
+            raise ValidationError(
+                f"Expected JSON object on line {index} in {source}, "
+                f"got {type(record).__name__}"
+            )
+
+        yield record
+
+
+def _as_buffer(data: str | BytesLike) -> memoryview:
+    """View in-memory content as bytes, encoding only text."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return memoryview(data).cast("B")
 
-        checked += 1
-        if checked >= 5:
+
+def _split_lines(view: memoryview) -> Iterator[bytes]:
+    """Yield the lines of in-memory content.
+
+    The content is copied and split one block of about JSONL_READ_BUFFER
+    bytes at a time, ending at a line break, so splitting a large payload
+    never holds a second copy of it.
+    """
+    position, size = 0, len(view)
+    while position < size:
+        end = size
+        if position + JSONL_READ_BUFFER < size:
+            match = _LINE_BREAK.search(view, position + JSONL_READ_BUFFER - 1)
+            if match is not None:
+                end = match.end()
+        yield from view[position:end].tobytes().splitlines()
+        position = end
+
+
+def _sniff_jsonl(
+    view: memoryview,
+) -> tuple[list[tuple[bytes, dict[str, Any] | None]], Iterator[bytes]] | None:
+    """Tell in-memory JSON Lines from JSON by parsing the first lines.
+
+    Content spanning several lines is JSON Lines when at least two of its
+    first FORMAT_SNIFF_LINES lines starting with "{" parse.
+
+    Returns:
+        None for JSON. For JSON Lines, the lines read so far with their
+        parsed records (None where not parsed), and an iterator over the
+        remaining lines, so no line is parsed twice.
+    """
+    start = _NON_WHITESPACE.search(view)
+    if start is None or not _CONTENT_AFTER_LINE_BREAK.search(view, start.start()):
+        return None
+
+    lines = _split_lines(view)
+    consumed: list[tuple[bytes, dict[str, Any] | None]] = []
+    hits = 0
+    checked = 0
+    for line in lines:
+        record = None
+        if line.lstrip().startswith(b"{"):
+            try:
+                record = _loads(line)
+                hits += 1
+            except JSON_DECODE_ERRORS:
+                pass
+            checked += 1
+        consumed.append((line, record))
+        if checked >= FORMAT_SNIFF_LINES:
             break
 
-    return "jsonl" if hits >= 2 else "json"
+    return (consumed, lines) if hits >= 2 else None
+
+
+def _iter_sniffed_jsonl(
+    consumed: list[tuple[bytes, dict[str, Any] | None]], lines: Iterator[bytes]
+) -> Iterator[dict[str, Any]]:
+    """Yield JSON Lines records, reusing the lines parsed by detection."""
+    for index, (line, record) in enumerate(consumed, 1):
+        if record is None:
+            yield from _iter_jsonl_bytes([line], "JSONL data", index)
+        else:
+            yield record
+    yield from _iter_jsonl_bytes(lines, "JSONL data", len(consumed) + 1)
+
+
+def _detect_string_format(value: str | BytesLike) -> str:
+    """Detect whether in-memory content is JSON or JSONL."""
+    return "json" if _sniff_jsonl(_as_buffer(value)) is None else "jsonl"
 
 
 __all__ = [
@@ -432,7 +1473,14 @@ __all__ = [
     "get_json_file_iterator",
     "get_json_file_iterator_streaming",
     "get_jsonl_file_iterator",
+    "get_jsonl_parallel_iterator",
     "get_jsonl_data_iterator",
     "get_json5_file_iterator",
     "get_hjson_file_iterator",
+    "get_multi_file_iterator",
+    "get_stream_iterator",
+    "is_path_list",
+    "is_stream",
+    "resolve_input_paths",
+    "select_records",
 ]
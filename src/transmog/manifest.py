@@ -0,0 +1,228 @@
+"""Per-table manifests of streaming output."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from transmog.exceptions import OutputError
+from transmog.metrics import StreamMetrics
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE_NAME = "_manifest.json"
+
+# Lowest and highest ID seen per table
+IdRanges = dict[str, tuple[Any, Any]]
+
+
+def _min_max(values: list[Any]) -> tuple[Any, Any]:
+    """Get the smallest and largest value, comparing mixed types as strings."""
+    try:
+        return min(values), max(values)
+    except TypeError:
+        return min(values, key=str), max(values, key=str)
+
+
+def update_id_ranges(
+    ranges: IdRanges,
+    entity_name: str,
+    main_records: list[dict[str, Any]],
+    child_tables: dict[str, list[dict[str, Any]]],
+    id_field: str,
+) -> None:
+    """Extend the ID range of each table with a batch's rows.
+
+    Args:
+        ranges: Ranges to update, keyed by table name
+        entity_name: Name of the main table
+        main_records: Main table records
+        child_tables: Child table records keyed by table name
+        id_field: ID field name
+    """
+    tables = [(entity_name, main_records), *child_tables.items()]
+    for table_name, records in tables:
+        values = [r[id_field] for r in records if r.get(id_field) is not None]
+        if not values:
+            continue
+        if table_name in ranges:
+            values.extend(ranges[table_name])
+        ranges[table_name] = _min_max(values)
+
+
+@dataclass
+class TableManifest:
+    """Catalog entry of one output table."""
+
+    rows: int = 0
+    """Rows written to the table."""
+
+    bytes: int = 0
+    """Bytes in the table's output files."""
+
+    files: list[str] = field(default_factory=list)
+    """Output files of the table."""
+
+    schema: dict[str, Any] = field(default_factory=dict)
+    """Final column types in the output format's notation."""
+
+    min_id: Any = None
+    """Lowest value of the ID field, or None without IDs."""
+
+    max_id: Any = None
+    """Highest value of the ID field, or None without IDs."""
+
+    def merge(self, other: "TableManifest") -> None:
+        """Add the output of the same table written by another run.
+
+        Args:
+            other: Entry to add to this one
+        """
+        self.rows += other.rows
+        self.bytes += other.bytes
+        self.files.extend(other.files)
+        for column, column_type in other.schema.items():
+            self.schema.setdefault(column, column_type)
+        bounds = (self.min_id, self.max_id, other.min_id, other.max_id)
+        ids = [value for value in bounds if value is not None]
+        if ids:
+            self.min_id, self.max_id = _min_max(ids)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the entry to a JSON-serializable dictionary."""
+        return {
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "files": list(self.files),
+            "schema": dict(self.schema),
+            "min_id": self.min_id,
+            "max_id": self.max_id,
+        }
+
+
+@dataclass
+class StreamManifest:
+    """Description of everything a streaming run wrote.
+
+    Built from what the writers already track, so catalogs can register the
+    output without reading file metadata back.
+    """
+
+    entity: str
+    """Name of the main table."""
+
+    extract_time: str | None = None
+    """Extraction timestamp shared by all records."""
+
+    records: int = 0
+    """Input records processed."""
+
+    stages: dict[str, float] = field(default_factory=dict)
+    """Elapsed seconds per stage (read, flatten, write, close, total)."""
+
+    tables: dict[str, TableManifest] = field(default_factory=dict)
+    """Entries per table, main table first."""
+
+    @classmethod
+    def from_run(
+        cls,
+        entity_name: str,
+        extract_time: str | None,
+        metrics: StreamMetrics,
+        table_files: dict[str, list[Path]],
+        table_schemas: dict[str, dict[str, Any]],
+        id_ranges: IdRanges,
+    ) -> "StreamManifest":
+        """Assemble the manifest of a finished run.
+
+        Args:
+            entity_name: Name of the main table
+            extract_time: Extraction timestamp of the run
+            metrics: Metrics of the run, including bytes per table
+            table_files: Output files per table ("main" for the main table)
+            table_schemas: Column types per table ("main" for the main table)
+            id_ranges: Lowest and highest ID per table
+
+        Returns:
+            Manifest of the run
+        """
+        manifest = cls(
+            entity=entity_name,
+            extract_time=extract_time,
+            records=metrics.records,
+            stages={
+                "read_seconds": metrics.read_seconds,
+                "flatten_seconds": metrics.flatten_seconds,
+                "write_seconds": metrics.write_seconds,
+                "close_seconds": metrics.close_seconds,
+                "elapsed_seconds": metrics.elapsed_seconds,
+            },
+        )
+
+        def table_name(name: str) -> str:
+            return entity_name if name == "main" else name
+
+        for name, table_metrics in metrics.tables.items():
+            manifest.tables[name] = TableManifest(
+                rows=table_metrics.rows, bytes=table_metrics.bytes
+            )
+        for name, paths in table_files.items():
+            entry = manifest.tables.setdefault(table_name(name), TableManifest())
+            entry.files = [str(path) for path in paths]
+        for name, schema in table_schemas.items():
+            entry = manifest.tables.setdefault(table_name(name), TableManifest())
+            entry.schema = dict(schema)
+        for name, (min_id, max_id) in id_ranges.items():
+            entry = manifest.tables.setdefault(name, TableManifest())
+            entry.min_id, entry.max_id = min_id, max_id
+        return manifest
+
+    def merge(self, other: "StreamManifest") -> None:
+        """Add the manifest of another run of the same entity, such as a shard.
+
+        Args:
+            other: Manifest to add to this one
+        """
+        self.records += other.records
+        for stage, seconds in other.stages.items():
+            if stage != "elapsed_seconds":
+                self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        for name, table in other.tables.items():
+            self.tables.setdefault(name, TableManifest()).merge(table)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the manifest to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with run information and one entry per table
+        """
+        return {
+            "version": MANIFEST_VERSION,
+            "entity": self.entity,
+            "extract_time": self.extract_time,
+            "records": self.records,
+            "stages": dict(self.stages),
+            "tables": {name: table.to_dict() for name, table in self.tables.items()},
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Write the manifest as JSON.
+
+        Args:
+            path: Manifest file path
+
+        Raises:
+            OutputError: If the file cannot be written
+        """
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2, default=str)
+        except OSError as exc:
+            raise OutputError(f"Failed to write manifest {path}: {exc}") from exc
+
+
+__all__ = [
+    "MANIFEST_FILE_NAME",
+    "StreamManifest",
+    "TableManifest",
+    "update_id_ranges",
+]
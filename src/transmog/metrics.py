@@ -0,0 +1,215 @@
+"""Stage-level metrics for flatten and streaming runs."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class TableMetrics:
+    """Output statistics of a single table."""
+
+    rows: int = 0
+    """Rows emitted to the table."""
+
+    bytes: int = 0
+    """Bytes in the table's output files, known once a stream is closed."""
+
+
+@dataclass
+class BatchMetrics:
+    """Timings and sizes of one processed batch.
+
+    Passed to the metrics callback after each batch has been written.
+    """
+
+    batch: int
+    """1-based batch number."""
+
+    records: int
+    """Input records in the batch."""
+
+    read_seconds: float = 0.0
+    """Time from the batch's first record to its flush, spent reading and
+    parsing input (or waiting for a push-based producer)."""
+
+    flatten_seconds: float = 0.0
+    """Time spent flattening the batch."""
+
+    write_seconds: float = 0.0
+    """Time spent in the writer encoding and writing the batch."""
+
+    writer_seconds: dict[str, float] = field(default_factory=dict)
+    """Write time per output, for multi-format output."""
+
+    rows: dict[str, int] = field(default_factory=dict)
+    """Rows emitted per table."""
+
+    buffered_rows: int = 0
+    """Rows held in writer buffers after the batch was written."""
+
+    @property
+    def child_rows(self) -> int:
+        """Rows emitted to child tables (all tables but the first)."""
+        return sum(list(self.rows.values())[1:])
+
+
+MetricsCallback = Callable[[BatchMetrics], None]
+
+
+def count_table_rows(
+    entity_name: str,
+    main_records: list[dict[str, Any]],
+    child_tables: dict[str, list[dict[str, Any]]],
+    rows: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """Count rows emitted per table, main table first.
+
+    Args:
+        entity_name: Name of the main table
+        main_records: Main table records
+        child_tables: Child table records keyed by table name
+        rows: Existing counts to add to
+
+    Returns:
+        Row counts keyed by table name
+    """
+    if rows is None:
+        rows = {}
+    rows[entity_name] = rows.get(entity_name, 0) + len(main_records)
+    for table_name, records in child_tables.items():
+        rows[table_name] = rows.get(table_name, 0) + len(records)
+    return rows
+
+
+@dataclass
+class StreamMetrics:
+    """Metrics accumulated over a whole run.
+
+    Attached to the result of flatten() and flatten_stream() when metrics
+    collection is enabled.
+    """
+
+    records: int = 0
+    """Input records processed."""
+
+    batches: int = 0
+    """Batches processed."""
+
+    read_seconds: float = 0.0
+    """Total time spent reading and parsing input."""
+
+    flatten_seconds: float = 0.0
+    """Total time spent flattening."""
+
+    write_seconds: float = 0.0
+    """Total time spent in writers, excluding close."""
+
+    close_seconds: float = 0.0
+    """Time spent finalizing writers."""
+
+    elapsed_seconds: float = 0.0
+    """Wall-clock time of the run."""
+
+    writer_seconds: dict[str, float] = field(default_factory=dict)
+    """Total write time per output, for multi-format output."""
+
+    tables: dict[str, TableMetrics] = field(default_factory=dict)
+    """Output statistics per table, main table first."""
+
+    max_buffered_rows: int = 0
+    """Largest number of rows held in writer buffers after a batch."""
+
+    json_backend: str | None = None
+    """ijson backend parsing streamed JSON input, such as "yajl2_c"; the
+    pure-Python "python" backend is several times slower."""
+
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def fan_out(self) -> dict[str, float]:
+        """Rows emitted per input record, for each table."""
+        if not self.records:
+            return {}
+        return {name: table.rows / self.records for name, table in self.tables.items()}
+
+    def add_batch(self, batch: BatchMetrics) -> None:
+        """Accumulate the metrics of one batch.
+
+        Args:
+            batch: Metrics of the processed batch
+        """
+        self.records += batch.records
+        self.batches += 1
+        self.read_seconds += batch.read_seconds
+        self.flatten_seconds += batch.flatten_seconds
+        self.write_seconds += batch.write_seconds
+        for label, seconds in batch.writer_seconds.items():
+            self.writer_seconds[label] = self.writer_seconds.get(label, 0.0) + seconds
+        for name, rows in batch.rows.items():
+            self.tables.setdefault(name, TableMetrics()).rows += rows
+        self.max_buffered_rows = max(self.max_buffered_rows, batch.buffered_rows)
+        self.elapsed_seconds = time.perf_counter() - self._started
+
+    def merge(self, other: "StreamMetrics") -> None:
+        """Accumulate the metrics of another run, such as a worker shard.
+
+        Args:
+            other: Metrics to add to this object
+        """
+        self.records += other.records
+        self.batches += other.batches
+        self.read_seconds += other.read_seconds
+        self.flatten_seconds += other.flatten_seconds
+        self.write_seconds += other.write_seconds
+        self.close_seconds += other.close_seconds
+        for label, seconds in other.writer_seconds.items():
+            self.writer_seconds[label] = self.writer_seconds.get(label, 0.0) + seconds
+        for name, table in other.tables.items():
+            target = self.tables.setdefault(name, TableMetrics())
+            target.rows += table.rows
+            target.bytes += table.bytes
+        self.max_buffered_rows = max(self.max_buffered_rows, other.max_buffered_rows)
+        self.json_backend = self.json_backend or other.json_backend
+        self.elapsed_seconds = time.perf_counter() - self._started
+
+    def finish(self) -> None:
+        """Record the end of the run."""
+        self.elapsed_seconds = time.perf_counter() - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the metrics to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary of all metrics, including per-table fan-out
+        """
+        return {
+            "records": self.records,
+            "batches": self.batches,
+            "read_seconds": self.read_seconds,
+            "flatten_seconds": self.flatten_seconds,
+            "write_seconds": self.write_seconds,
+            "close_seconds": self.close_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+            "writer_seconds": dict(self.writer_seconds),
+            "max_buffered_rows": self.max_buffered_rows,
+            "json_backend": self.json_backend,
+            "tables": {
+                name: {
+                    "rows": table.rows,
+                    "bytes": table.bytes,
+                    "fan_out": table.rows / self.records if self.records else 0.0,
+                }
+                for name, table in self.tables.items()
+            },
+        }
+
+
+__all__ = [
+    "BatchMetrics",
+    "MetricsCallback",
+    "StreamMetrics",
+    "TableMetrics",
+    "count_table_rows",
+]
@@ -0,0 +1,362 @@
+"""Multi-process streaming over sharded file inputs."""
+
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, cast
+
+from transmog.cache import ParseCache
+from transmog.compression import detect_compression
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError, ValidationError
+from transmog.flattening import get_current_timestamp
+from transmog.iterators import (
+    IJSON_READ_BUFFER,
+    get_data_iterator,
+    get_jsonl_range_iterator,
+    resolve_input_paths,
+    select_records,
+    split_jsonl_file,
+)
+from transmog.manifest import MANIFEST_FILE_NAME, StreamManifest
+from transmog.metrics import StreamMetrics
+from transmog.streaming import StreamResult, StreamSession
+from transmog.tracing import Tracer
+from transmog.types import OutputFormat, ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+# A unit of shard input: a whole file, or a JSONL byte range of one
+ShardTask = tuple[str, int | None, int | None]
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+def _is_jsonl(path: str) -> bool:
+    return (
+        os.path.splitext(path)[1].lower() in JSONL_EXTENSIONS
+        and detect_compression(path) is None
+    )
+
+
+def plan_shards(data: Any, shards: int) -> list[list[ShardTask]]:
+    """Split file input into per-process work lists.
+
+    A single JSON Lines file is split into byte ranges on line boundaries.
+    Several files are assigned whole to the least loaded shard, largest
+    first.
+
+    Args:
+        data: A file path, a directory, a glob pattern, or a list of file
+            paths
+        shards: Number of shards
+
+    Returns:
+        Non-empty task lists, at most ``shards`` of them
+
+    Raises:
+        ConfigurationError: If the input is not file based
+    """
+    if not isinstance(data, (str, Path, list, tuple)):
+        raise ConfigurationError(
+            "shards requires a file path or a list of file paths as input"
+        )
+    try:
+        resolved = resolve_input_paths(data)
+    except ValidationError as exc:
+        raise ConfigurationError(str(exc)) from exc
+    if resolved is not None:
+        paths = resolved
+    elif isinstance(data, (str, Path)):
+        paths = [str(data)]
+    else:
+        raise ConfigurationError(
+            "shards requires a file path or a list of file paths as input"
+        )
+
+    for path in paths:
+        if not os.path.isfile(path):
+            raise ConfigurationError(f"shards requires existing files: {path}")
+
+    if len(paths) == 1 and _is_jsonl(paths[0]):
+        return [
+            [(paths[0], start, end)]
+            for start, end in split_jsonl_file(paths[0], shards)
+        ]
+
+    plan: list[list[ShardTask]] = [[] for _ in range(min(shards, len(paths)))]
+    loads = [0] * len(plan)
+    for path in sorted(paths, key=os.path.getsize, reverse=True):
+        index = loads.index(min(loads))
+        plan[index].append((path, None, None))
+        loads[index] += os.path.getsize(path)
+    return plan
+
+
+def _shard_records(
+    tasks: list[ShardTask],
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of a shard's tasks in order."""
+    for path, start, end in tasks:
+        records: Iterator[dict[str, Any]]
+        if start is not None and end is not None:
+            records = get_jsonl_range_iterator(path, start, end, read_ahead)
+            if record_path is not None:
+                records = select_records(records, record_path, record_meta)
+        else:
+            records = get_data_iterator(
+                path,
+                streaming=True,
+                record_path=record_path,
+                record_meta=record_meta,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                parse_cache=parse_cache,
+                read_ahead=read_ahead,
+            )
+        for record in records:
+            if source_field:
+                record[source_field] = path
+            yield record
+
+
+def _run_shard(
+    shard: int,
+    shards: int,
+    tasks: list[ShardTask],
+    options: dict[str, Any],
+    format_options: dict[str, Any],
+) -> dict[str, Any]:
+    """Process one shard in a worker process.
+
+    Args:
+        shard: Shard number, used as the first part file number
+        shards: Total number of shards, used as the part number step
+        tasks: Inputs of this shard
+        options: StreamSession arguments shared by all shards
+        format_options: Format-specific writer options
+
+    Returns:
+        Files written, record and batch counts, metrics, trace events and
+        manifest
+    """
+    options = dict(options)
+    tracer = Tracer() if options.pop("trace", False) else None
+    input_options = {
+        key: options.pop(key)
+        for key in (
+            "source_field",
+            "record_path",
+            "record_meta",
+            "read_buffer_size",
+            "use_decimal",
+            "parse_cache",
+            "read_ahead",
+        )
+    }
+    session = StreamSession(
+        part_start=shard,
+        part_step=shards,
+        tracer=tracer,
+        **options,
+        **format_options,
+    )
+    with session:
+        session.feed_many(_shard_records(tasks, **input_options))
+    files = session.close()
+    return {
+        "shard": shard,
+        "files": [str(path) for path in files],
+        "records": session.records_processed,
+        "batches": session.batch_count,
+        "metrics": session.metrics,
+        "trace_events": tracer.events if tracer is not None else [],
+        "manifest": session.manifest,
+    }
+
+
+def stream_process_sharded(
+    config: TransmogConfig,
+    data: Any,
+    entity_name: str,
+    output_format: OutputFormat,
+    output_destination: str,
+    shards: int,
+    extract_time: str | None = None,
+    batch_size: int | None = None,
+    progress_callback: ProgressCallback | None = None,
+    total_records: int | None = None,
+    max_batch_latency: float | None = None,
+    partition_by: list[str] | None = None,
+    collect_metrics: bool = False,
+    trace_path: str | Path | None = None,
+    manifest: bool = False,
+    write_manifest: bool = False,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
+    **format_options: Any,
+) -> StreamResult:
+    """Stream process file input in parallel worker processes.
+
+    Each shard runs its own session and writers and writes every table to
+    ``<table>/part-<shard>.<ext>`` (below the Hive partition directories
+    when partition_by is set). Flattened rows never leave the workers; the
+    parent only collects file lists and counts.
+
+    Args:
+        config: TransmogConfig instance
+        data: A file path, a directory, a glob pattern, or a list of file
+            paths
+        entity_name: Name of the entity being processed
+        output_format: Output format, or several formats
+        output_destination: Output directory
+        shards: Number of worker processes
+        extract_time: Optional extraction timestamp shared by all shards
+        batch_size: Size of batches to process
+        progress_callback: Optional callable invoked as each shard completes
+        total_records: Total input record count (None when unknown)
+        max_batch_latency: Maximum seconds a record may wait in buffers
+        partition_by: Main table columns for Hive-style partitioned output
+        collect_metrics: Merge the metrics of all shards into the result
+        trace_path: File to save the combined Chrome trace of all shards to,
+            with one process track per worker
+        manifest: Attach the combined per-table manifest of all shards
+        write_manifest: Also save the manifest as ``_manifest.json`` in the
+            output directory
+        source_field: Field holding the source file path of each record
+        record_path: ijson-style path of the records inside each document
+        record_meta: Keys next to the records' array to add to each record
+        read_buffer_size: Bytes read at a time when streaming .json files
+        use_decimal: Parse non-integer numbers of streamed .json files as
+            Decimal
+        parse_cache: Cache directory, or ParseCache, reusing the parsed
+            content of .json5 and .hjson files across runs
+        read_ahead: Bytes of each input file to read ahead on a background
+            thread of each worker
+        **format_options: Format-specific options for the writers
+
+    Returns:
+        Files written by all shards, in shard order, with merged metrics and
+        manifest attached when collected.
+
+    Raises:
+        ConfigurationError: If shards is less than 1 or the input is not
+            file based
+    """
+    if shards < 1:
+        raise ConfigurationError("shards must be at least 1")
+    if read_ahead is not None and read_ahead < 1:
+        raise ConfigurationError("read_ahead must be at least 1")
+
+    started = time.perf_counter()
+    plan = plan_shards(data, shards)
+    extract_time = extract_time or get_current_timestamp()
+    options = {
+        "output_path": output_destination,
+        "name": entity_name,
+        "output_format": output_format,
+        "config": config,
+        "extract_time": extract_time,
+        "batch_size": batch_size,
+        "flush_interval": max_batch_latency,
+        "partition_by": list(partition_by or []),
+        "collect_metrics": collect_metrics,
+        "trace": trace_path is not None,
+        "manifest": manifest or write_manifest,
+        "source_field": source_field,
+        "record_path": record_path,
+        "record_meta": record_meta,
+        "read_buffer_size": read_buffer_size,
+        "use_decimal": use_decimal,
+        "parse_cache": parse_cache,
+        "read_ahead": read_ahead,
+    }
+    metrics = StreamMetrics() if collect_metrics else None
+    tracer = Tracer(trace_gc=False) if trace_path is not None else None
+
+    logger.info(
+        "sharded stream started, entity=%s, shards=%d, tasks=%d",
+        entity_name,
+        len(plan),
+        sum(len(tasks) for tasks in plan),
+    )
+
+    results: list[dict[str, Any]] = []
+    records = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(plan), mp_context=context) as executor:
+        futures = [
+            executor.submit(_run_shard, shard, shards, tasks, options, format_options)
+            for shard, tasks in enumerate(plan)
+        ]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    for other in pending:
+                        other.cancel()
+                    raise error
+                result = future.result()
+                results.append(result)
+                records += result["records"]
+                if metrics is not None:
+                    metrics.merge(result["metrics"])
+                if tracer is not None:
+                    tracer.extend(result["trace_events"])
+                logger.info(
+                    "shard completed, shard=%d, records=%d, batches=%d",
+                    result["shard"],
+                    result["records"],
+                    result["batches"],
+                )
+                if progress_callback is not None:
+                    progress_callback(records, total_records)
+
+    results.sort(key=lambda result: result["shard"])
+    combined: StreamManifest | None = None
+    if manifest or write_manifest:
+        combined = StreamManifest(entity_name, extract_time)
+        for result in results:
+            combined.merge(result["manifest"])
+    logger.info(
+        "sharded stream completed, entity=%s, shards=%d, total_records=%d, "
+        "total_batches=%d",
+        entity_name,
+        len(results),
+        records,
+        sum(result["batches"] for result in results),
+    )
+    if metrics is not None:
+        metrics.finish()
+    if tracer is not None:
+        tracer.save(cast(str | Path, trace_path))
+    if combined is not None:
+        combined.stages["elapsed_seconds"] = time.perf_counter() - started
+        if write_manifest:
+            combined.save(os.path.join(output_destination, MANIFEST_FILE_NAME))
+    return StreamResult(
+        (Path(path) for result in results for path in result["files"]),
+        metrics,
+        combined,
+    )
+
+
+__all__ = ["plan_shards", "stream_process_sharded"]
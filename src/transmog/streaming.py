@@ -1,18 +1,850 @@
 """Streaming processing and result containers."""
 
+import asyncio
 import logging
-from collections.abc import Iterator
+import os
+import threading
+import time
+from collections.abc import AsyncIterable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Literal, cast
 
-from transmog.flattening import get_current_timestamp, process_record_batch
-from transmog.iterators import get_data_iterator
-from transmog.types import ProcessingContext, ProgressCallback
-from transmog.writers import create_streaming_writer
+from transmog.cache import ParseCache
+from transmog.checkpoint import load_checkpoint, resumable_input, save_checkpoint
+from transmog.columnar import DataFrameLike
+from transmog.config import TransmogConfig
+from transmog.events import check_event_config, iter_document_tables
+from transmog.exceptions import ConfigurationError, OutputError
+from transmog.flattening import (
+    get_current_timestamp,
+    partition_record_batch,
+    process_record_batch,
+)
+from transmog.iterators import (
+    IJSON_BACKEND,
+    IJSON_READ_BUFFER,
+    BytesLike,
+    Stream,
+    get_data_iterator,
+)
+from transmog.manifest import (
+    MANIFEST_FILE_NAME,
+    IdRanges,
+    StreamManifest,
+    update_id_ranges,
+)
+from transmog.metrics import (
+    BatchMetrics,
+    MetricsCallback,
+    StreamMetrics,
+    TableMetrics,
+    count_table_rows,
+)
+from transmog.tracing import Tracer
+from transmog.types import OutputFormat, ProcessingContext, ProgressCallback
+from transmog.writers import (
+    PartitionedStreamingWriter,
+    StreamingWriter,
+    TeeStreamingWriter,
+    create_partitioned_writer,
+    create_streaming_writer,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _create_writer(
+    config: Any,
+    entity_name: str,
+    output_format: OutputFormat,
+    output_destination: str | BinaryIO | None,
+    format_options: dict[str, Any],
+    partition_by: list[str] | None = None,
+) -> StreamingWriter:
+    """Create the streaming writer for a processing run."""
+    if not isinstance(output_format, str):
+        return _create_tee_writer(
+            config,
+            entity_name,
+            output_format,
+            output_destination,
+            format_options,
+            partition_by,
+        )
+
+    # Pass stringify_mode to writer for optimization (skip type inference)
+    writer_options = dict(format_options)
+    if hasattr(config, "stringify_values") and config.stringify_values:
+        writer_options["stringify_mode"] = True
+
+    if partition_by is not None:
+        if not isinstance(output_destination, str):
+            raise ConfigurationError(
+                "partition_by requires a directory path as output destination"
+            )
+        return create_partitioned_writer(
+            format_name=output_format,
+            destination=output_destination,
+            partition_by=partition_by,
+            entity_name=entity_name,
+            **writer_options,
+        )
+
+    return create_streaming_writer(
+        format_name=output_format,
+        destination=output_destination,
+        entity_name=entity_name,
+        **writer_options,
+    )
+
+
+def _create_tee_writer(
+    config: Any,
+    entity_name: str,
+    output_format: list[str] | dict[str, dict[str, Any]],
+    output_destination: str | BinaryIO | None,
+    format_options: dict[str, Any],
+    partition_by: list[str] | None = None,
+) -> TeeStreamingWriter:
+    """Create a writer fanning out to one writer per output format.
+
+    A list of formats shares ``format_options`` and the output destination.
+    A dict maps each format to its own options, which override the shared
+    ones; an ``output_path`` entry gives that format its own destination.
+    """
+    if isinstance(output_format, dict):
+        specs = [
+            (format_name, dict(options or {}))
+            for format_name, options in output_format.items()
+        ]
+    else:
+        specs = [(format_name, {}) for format_name in output_format]
+
+    writers: dict[str, StreamingWriter] = {}
+    try:
+        for format_name, options in specs:
+            label = format_name.lower()
+            if label in writers:
+                raise ConfigurationError(f"Duplicate output format: {format_name}")
+            destination = options.pop("output_path", output_destination)
+            if isinstance(destination, Path):
+                destination = str(destination)
+            if not isinstance(destination, str):
+                raise ConfigurationError(
+                    "Multiple output formats require directory path destinations"
+                )
+            writers[label] = _create_writer(
+                config,
+                entity_name,
+                label,
+                destination,
+                {**format_options, **options},
+                partition_by=partition_by,
+            )
+        return TeeStreamingWriter(writers)
+    except Exception:
+        for writer in writers.values():
+            writer.close()
+        raise
+
+
+def _span(tracer: Tracer | None, name: str, **args: Any) -> AbstractContextManager[Any]:
+    """Get a trace span for a block, or a no-op when not tracing."""
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, category="stream", **args)
+
+
+def _write_batch(
+    writer: StreamingWriter,
+    records: list[dict[str, Any]],
+    entity_name: str,
+    config: Any,
+    context: ProcessingContext,
+    partition_by: list[str] | None = None,
+    metrics: BatchMetrics | None = None,
+    tracer: Tracer | None = None,
+    id_ranges: IdRanges | None = None,
+) -> None:
+    """Flatten a batch of records and hand the tables to the writer.
+
+    When ``metrics`` is given, flatten and write times and the rows emitted
+    per table are recorded on it. When ``tracer`` is given, flattening and
+    writing are recorded as spans. When ``id_ranges`` is given, it is
+    extended with the lowest and highest ID of each table.
+    """
+    started = time.perf_counter() if metrics is not None else 0.0
+
+    if partition_by and isinstance(
+        writer, (PartitionedStreamingWriter, TeeStreamingWriter)
+    ):
+        with _span(tracer, "partition_record_batch", records=len(records)):
+            groups = partition_record_batch(
+                records=records,
+                entity_name=entity_name,
+                config=config,
+                _context=context,
+                partition_by=partition_by,
+            )
+        if metrics is not None:
+            flattened = time.perf_counter()
+            metrics.flatten_seconds = flattened - started
+            for main_records, child_tables in groups.values():
+                count_table_rows(entity_name, main_records, child_tables, metrics.rows)
+        if id_ranges is not None:
+            for main_records, child_tables in groups.values():
+                update_id_ranges(
+                    id_ranges, entity_name, main_records, child_tables, config.id_field
+                )
+        with _span(tracer, "write_partitions", partitions=len(groups)):
+            for values, (main_records, child_tables) in groups.items():
+                writer.write_partition(values, main_records, child_tables)
+        if metrics is not None:
+            metrics.write_seconds = time.perf_counter() - flattened
+        return
+
+    with _span(tracer, "process_record_batch", records=len(records)):
+        main_records, child_tables = process_record_batch(
+            records=records,
+            entity_name=entity_name,
+            config=config,
+            _context=context,
+        )
+    if metrics is not None:
+        flattened = time.perf_counter()
+        metrics.flatten_seconds = flattened - started
+        count_table_rows(entity_name, main_records, child_tables, metrics.rows)
+    if id_ranges is not None:
+        update_id_ranges(
+            id_ranges, entity_name, main_records, child_tables, config.id_field
+        )
+    with _span(tracer, "write_tables", tables=len(child_tables) + 1):
+        writer.write_tables(main_records, child_tables)
+    if metrics is not None:
+        metrics.write_seconds = time.perf_counter() - flattened
+
+
+class StreamResult(list[Path]):
+    """Files written by a streaming run.
+
+    A list of output paths, with the run's metrics and manifest attached
+    when they were collected.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path] = (),
+        metrics: StreamMetrics | None = None,
+        manifest: StreamManifest | None = None,
+    ) -> None:
+        """Initialize the result.
+
+        Args:
+            files: Output files written
+            metrics: Metrics of the run, or None when not collected
+            manifest: Per-table manifest of the run, or None when not built
+        """
+        super().__init__(files)
+        self.metrics = metrics
+        self.manifest = manifest
+
+
+def _manifest_file_path(output_path: str) -> str:
+    """Get the manifest location for an output directory or file."""
+    if os.path.splitext(output_path)[1] and not os.path.isdir(output_path):
+        return os.path.join(os.path.dirname(output_path), MANIFEST_FILE_NAME)
+    return os.path.join(output_path, MANIFEST_FILE_NAME)
+
+
+class StreamSession:
+    """Push-based streaming session for long-running producers.
+
+    Keeps the writer, inferred schemas and processing context alive across
+    calls so that records arriving one at a time do not pay for writer setup
+    or configuration handling on every call. Records are buffered and
+    flattened in batches; a batch is flushed when it reaches the configured
+    batch size or, when ``flush_interval`` is set, once its oldest record has
+    waited that many seconds. A time-based flush also flushes the writer's own
+    buffers, so no record waits longer than ``flush_interval`` before it is
+    handed to the output file.
+
+    The extraction timestamp is fixed when the session is created and shared
+    by every record written through it. All methods are safe to call from
+    multiple threads.
+
+    With ``checkpoint_path`` set, checkpoint() saves the session and writer
+    state so that a later session created with ``resume=True`` continues the
+    same output. The caller provides the input position to store and, on
+    resume, reads it back from ``resume_state``.
+
+    With ``trace_path`` set, each batch's read, flatten and write stages,
+    writer flushes and garbage collection pauses are recorded as spans and
+    saved as Chrome trace-event JSON when the session is closed.
+
+    With ``manifest`` set, ``manifest`` holds a StreamManifest once the
+    session is closed: rows, bytes, files, final schema and ID range of
+    every table. ``write_manifest`` also saves it as ``_manifest.json`` in
+    the output directory.
+
+    Examples:
+        >>> with StreamSession("output/", name="events") as session:
+        ...     for message in consumer:
+        ...         session.feed(message)
+    """
+
+    def __init__(
+        self,
+        output_path: str | Path | BinaryIO | None,
+        name: str = "data",
+        output_format: OutputFormat = "csv",
+        config: TransmogConfig | None = None,
+        *,
+        flush_interval: float | None = None,
+        progress_callback: ProgressCallback | None = None,
+        total_records: int | None = None,
+        extract_time: str | None = None,
+        batch_size: int | None = None,
+        partition_by: list[str] | None = None,
+        checkpoint_path: str | Path | None = None,
+        resume: bool = False,
+        collect_metrics: bool = False,
+        metrics_callback: MetricsCallback | None = None,
+        trace_path: str | Path | None = None,
+        tracer: Tracer | None = None,
+        manifest: bool = False,
+        write_manifest: bool = False,
+        **format_options: Any,
+    ) -> None:
+        """Initialize the session and its writer.
+
+        Args:
+            output_path: Directory path, file path, or file-like object to write
+                to (None writes CSV to stdout)
+            name: Base name for the flattened tables
+            output_format: Output format ("csv", "parquet", "orc", "avro"), or
+                several formats as a list or a dict of per-format options
+            config: Optional configuration (uses defaults if not provided)
+            flush_interval: Maximum seconds a record may wait in the session
+                or writer buffers before being flushed. None disables
+                time-based flushing.
+            progress_callback: Optional callable invoked after each batch flush
+            total_records: Total input record count (None when unknown)
+            extract_time: Optional extraction timestamp for all records
+            batch_size: Records per batch (defaults to config.batch_size)
+            partition_by: Main table columns for Hive-style partitioned
+                output. Requires a directory path as output_path. An empty
+                list writes ``<table>/part-<n>`` files without partitions.
+            checkpoint_path: File that checkpoint() saves the session state to.
+                Not supported with partition_by.
+            resume: Continue from the state in checkpoint_path, if it exists
+            collect_metrics: Accumulate stage-level metrics in ``metrics``
+            metrics_callback: Optional callable invoked with the BatchMetrics
+                of each batch (enables metrics collection)
+            trace_path: File to save a Chrome trace of the session to on close
+            tracer: Tracer to record spans to (created when trace_path is set)
+            manifest: Build a per-table manifest of the output on close
+                (enables metrics collection)
+            write_manifest: Also save the manifest as ``_manifest.json`` next
+                to the output. Requires a path as output_path.
+            **format_options: Format-specific options for the writer
+        """
+        if config is None:
+            config = TransmogConfig()
+        if flush_interval is not None and flush_interval <= 0:
+            raise ConfigurationError("flush_interval must be greater than 0")
+        if batch_size is not None and batch_size < 1:
+            raise ConfigurationError("Batch size must be at least 1")
+
+        if isinstance(output_path, Path):
+            output_path = str(output_path)
+        if resume and checkpoint_path is None:
+            raise ConfigurationError("resume requires a checkpoint_path")
+        if checkpoint_path is not None and partition_by is not None:
+            raise ConfigurationError("partition_by is not supported with checkpoints")
+        if write_manifest and not isinstance(output_path, str):
+            raise ConfigurationError("write_manifest requires an output path")
+        manifest = manifest or write_manifest
+
+        self.config = config
+        self.entity_name = name
+        self.output_format = output_format
+        self.batch_size = batch_size or config.batch_size
+        self.flush_interval = flush_interval
+        self.progress_callback = progress_callback
+        self.total_records = total_records
+        self.partition_by = list(partition_by) if partition_by is not None else None
+        self.batch_count = 0
+        self.records_processed = 0
+        self.metrics_callback = metrics_callback
+        self.metrics: StreamMetrics | None = (
+            StreamMetrics(json_backend=IJSON_BACKEND)
+            if collect_metrics or metrics_callback or manifest
+            else None
+        )
+        self.manifest: StreamManifest | None = None
+        self._id_ranges: IdRanges | None = {} if manifest else None
+        self._manifest_path = (
+            _manifest_file_path(output_path)
+            if write_manifest and isinstance(output_path, str)
+            else None
+        )
+        self.checkpoint_path = str(checkpoint_path) if checkpoint_path else None
+        self.resume_state: dict[str, Any] | None = None
+        self.trace_path = str(trace_path) if trace_path else None
+        if tracer is None and trace_path is not None:
+            tracer = Tracer()
+        self.tracer = tracer
+
+        if resume:
+            self.resume_state = load_checkpoint(cast(str, self.checkpoint_path))
+            if self.resume_state is not None:
+                checkpoint_entity = self.resume_state.get("entity")
+                if checkpoint_entity != name:
+                    raise ConfigurationError(
+                        f"Checkpoint is for entity {checkpoint_entity!r}, not {name!r}"
+                    )
+                extract_time = self.resume_state["extract_time"]
+                self.batch_count = self.resume_state["batch_count"]
+                self.records_processed = self.resume_state["records_processed"]
+
+        timestamp = extract_time if extract_time else get_current_timestamp()
+        self._context = ProcessingContext(extract_time=timestamp)
+        self._buffer: list[dict[str, Any]] = []
+        self._oldest: float = 0.0
+        self._tables_written = time.perf_counter()
+        self._writer_oldest: float | None = None
+        self._lock = threading.RLock()
+        self._closed = False
+        self._files: list[Path] = []
+        self._timer_error: BaseException | None = None
+        self._stop = threading.Event()
+        self._timer: threading.Thread | None = None
+
+        self._writer = _create_writer(
+            config,
+            name,
+            output_format,
+            output_path,
+            format_options,
+            partition_by=self.partition_by,
+        )
+        if self.tracer is not None:
+            self._writer.attach_tracer(self.tracer)
+            self.tracer.start()
+
+        if self.metrics is not None and isinstance(self._writer, TeeStreamingWriter):
+            self._writer.timings = {}
+
+        if self.resume_state is not None:
+            try:
+                self._writer.restore_state(self.resume_state["writer"])
+            except BaseException:
+                self._writer.close()
+                self._finish_trace()
+                raise
+            if self._id_ranges is not None:
+                self._restore_manifest_state(self.resume_state.get("manifest"))
+            logger.info(
+                "stream resumed, entity=%s, batches=%d, records=%d",
+                name,
+                self.batch_count,
+                self.records_processed,
+            )
+
+        logger.info("stream started, entity=%s, format=%s", name, output_format)
+
+        if flush_interval is not None:
+            self._timer = threading.Thread(
+                target=self._run_timer, name="transmog-session-flush", daemon=True
+            )
+            self._timer.start()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session has been closed."""
+        return self._closed
+
+    def feed(self, record: dict[str, Any]) -> None:
+        """Add a single record to the session.
+
+        Args:
+            record: Record to flatten and write
+        """
+        with self._lock:
+            self._check_open()
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append(record)
+            if self._expired():
+                self._flush_expired()
+            elif len(self._buffer) >= self.batch_size:
+                self._flush_buffer()
+
+    def feed_many(self, records: Iterable[dict[str, Any]]) -> None:
+        """Add records from an iterable to the session.
+
+        Args:
+            records: Records to flatten and write
+        """
+        for record in records:
+            self.feed(record)
+
+    def write_tables(
+        self,
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+        records: int = 0,
+    ) -> None:
+        """Write tables that were flattened outside the session.
+
+        Buffered records are flushed first, so output keeps the order in
+        which data reached the session. The tables count as one batch.
+
+        Args:
+            main_records: Flattened main table records
+            child_tables: Flattened child records keyed by table name
+            records: Input records completed by these tables
+
+        Raises:
+            ConfigurationError: If the session writes partitioned output,
+                which needs the unflattened records
+        """
+        with self._lock:
+            self._check_open()
+            if self.partition_by is not None:
+                raise ConfigurationError(
+                    "write_tables is not supported with partition_by"
+                )
+            self._flush_buffer()
+            started = time.perf_counter()
+            batch_metrics = None
+            timings_before: dict[str, float] = {}
+            if self.metrics is not None:
+                batch_metrics = BatchMetrics(
+                    batch=self.batch_count + 1,
+                    records=records,
+                    read_seconds=started - self._tables_written,
+                    rows=count_table_rows(self.entity_name, main_records, child_tables),
+                )
+                timings = getattr(self._writer, "timings", None)
+                if timings is not None:
+                    timings_before = dict(timings)
+            if self._id_ranges is not None:
+                update_id_ranges(
+                    self._id_ranges,
+                    self.entity_name,
+                    main_records,
+                    child_tables,
+                    self.config.id_field,
+                )
+            with _span(self.tracer, "write_tables", tables=len(child_tables) + 1):
+                self._writer.write_tables(main_records, child_tables)
+            self._tables_written = time.perf_counter()
+            self.batch_count += 1
+            self.records_processed += records
+            if batch_metrics is not None:
+                batch_metrics.write_seconds = self._tables_written - started
+                self._record_batch_metrics(batch_metrics, timings_before)
+            if self.progress_callback is not None and records:
+                self.progress_callback(self.records_processed, self.total_records)
+
+    def flush(self) -> None:
+        """Flatten and write all buffered records."""
+        with self._lock:
+            self._check_open()
+            self._flush_buffer()
+
+    def checkpoint(self, input_state: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Flush buffered records and save a checkpoint.
+
+        All buffered records are written and the writer makes its output
+        durable, finalizing files where the format requires it (Parquet and
+        ORC continue in a new numbered file).
+
+        Args:
+            input_state: JSON-serializable input position covering exactly the
+                records fed so far
+
+        Returns:
+            The checkpoint state, also saved to checkpoint_path when set
+        """
+        with self._lock:
+            self._check_open()
+            self._flush_buffer()
+            self._writer_oldest = None
+            with _span(self.tracer, "checkpoint", batch=self.batch_count):
+                writer_state = self._writer.checkpoint_state()
+            state = {
+                "entity": self.entity_name,
+                "extract_time": self._context.extract_time,
+                "batch_count": self.batch_count,
+                "records_processed": self.records_processed,
+                "input": input_state,
+                "files": writer_state["files"],
+                "writer": writer_state,
+            }
+            if self._id_ranges is not None:
+                state["manifest"] = self._manifest_state()
+            if self.checkpoint_path is not None:
+                save_checkpoint(self.checkpoint_path, state)
+            logger.info(
+                "stream checkpoint saved, entity=%s, batches=%d, records=%d",
+                self.entity_name,
+                self.batch_count,
+                self.records_processed,
+            )
+            return state
+
+    def close(self) -> list[Path]:
+        """Flush buffered records, finalize the writer and stop the session.
+
+        Returns:
+            List of file paths written, or empty list if writing to a stream.
+        """
+        self._stop.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
+        with self._lock:
+            if self._closed:
+                return self._files
+            self._closed = True
+            try:
+                self._raise_timer_error()
+                self._flush_buffer()
+            finally:
+                started = time.perf_counter()
+                try:
+                    with _span(self.tracer, "close"):
+                        self._files = self._writer.close()
+                finally:
+                    self._finish_trace()
+                if self.metrics is not None:
+                    self._finish_metrics(self.metrics, started)
+                if self._id_ranges is not None:
+                    self._finish_manifest(cast(StreamMetrics, self.metrics))
+            logger.info(
+                "stream completed, entity=%s, total_batches=%d, total_records=%d",
+                self.entity_name,
+                self.batch_count,
+                self.records_processed,
+            )
+        return self._files
+
+    def _abort(self) -> list[Path]:
+        """Finalize the writer without flushing buffered records."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._buffer = []
+                try:
+                    self._files = self._writer.close()
+                finally:
+                    self._finish_trace()
+        return self._files
+
+    def _finish_trace(self) -> None:
+        """Stop tracing and save the trace when a trace_path is set."""
+        if self.tracer is None:
+            return
+        self.tracer.stop()
+        if self.trace_path is not None:
+            self.tracer.save(self.trace_path)
+
+    def _finish_metrics(self, metrics: StreamMetrics, close_started: float) -> None:
+        """Record close time and output bytes per table once closed."""
+        metrics.close_seconds = time.perf_counter() - close_started
+        for table_name, paths in self._writer.get_table_files().items():
+            name = self.entity_name if table_name == "main" else table_name
+            table = metrics.tables.setdefault(name, TableMetrics())
+            table.bytes = sum(p.stat().st_size for p in paths if p.exists())
+        metrics.finish()
+
+    def _finish_manifest(self, metrics: StreamMetrics) -> None:
+        """Build the manifest of the closed session and save it if requested."""
+        self.manifest = StreamManifest.from_run(
+            self.entity_name,
+            self._context.extract_time,
+            metrics,
+            self._writer.get_table_files(),
+            self._writer.get_table_schemas(),
+            cast(IdRanges, self._id_ranges),
+        )
+        if self._manifest_path is not None:
+            self.manifest.save(self._manifest_path)
+
+    def _manifest_state(self) -> dict[str, Any]:
+        """Get the manifest totals so far, for saving in a checkpoint."""
+        metrics = cast(StreamMetrics, self.metrics)
+        return {
+            "records": metrics.records,
+            "rows": {name: table.rows for name, table in metrics.tables.items()},
+            "id_ranges": {
+                name: list(id_range)
+                for name, id_range in cast(IdRanges, self._id_ranges).items()
+            },
+        }
+
+    def _restore_manifest_state(self, state: dict[str, Any] | None) -> None:
+        """Continue the manifest totals of a resumed run from its checkpoint."""
+        if state is None:
+            logger.warning(
+                "checkpoint has no manifest totals, manifest covers resumed "
+                "records only, entity=%s",
+                self.entity_name,
+            )
+            return
+        metrics = cast(StreamMetrics, self.metrics)
+        metrics.records = state["records"]
+        for name, rows in state["rows"].items():
+            metrics.tables.setdefault(name, TableMetrics()).rows = rows
+        for name, (min_id, max_id) in state["id_ranges"].items():
+            cast(IdRanges, self._id_ranges)[name] = (min_id, max_id)
+
+    def _check_open(self) -> None:
+        """Raise if the session is closed or the flush timer failed."""
+        if self._closed:
+            raise OutputError("Stream session is closed")
+        self._raise_timer_error()
+
+    def _raise_timer_error(self) -> None:
+        """Re-raise an error captured by the background flush timer."""
+        if self._timer_error is not None:
+            error, self._timer_error = self._timer_error, None
+            raise error
+
+    def _pending_since(self) -> float | None:
+        """Arrival time of the oldest record not yet flushed by the writer."""
+        candidates = []
+        if self._buffer:
+            candidates.append(self._oldest)
+        if self._writer_oldest is not None:
+            candidates.append(self._writer_oldest)
+        return min(candidates) if candidates else None
+
+    def _expired(self) -> bool:
+        """Check whether a pending record has waited at least flush_interval."""
+        if self.flush_interval is None:
+            return False
+        since = self._pending_since()
+        return since is not None and time.monotonic() - since >= self.flush_interval
+
+    def _flush_buffer(self) -> None:
+        """Flatten and write the current buffer. Caller must hold the lock."""
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, []
+        if self.flush_interval is not None and self._writer_oldest is None:
+            self._writer_oldest = self._oldest
+        batch_metrics = None
+        timings_before: dict[str, float] = {}
+        if self.metrics is not None:
+            batch_metrics = BatchMetrics(
+                batch=self.batch_count + 1,
+                records=len(buffer),
+                read_seconds=time.monotonic() - self._oldest,
+            )
+            timings = getattr(self._writer, "timings", None)
+            if timings is not None:
+                timings_before = dict(timings)
+        if self.tracer is not None:
+            now = time.perf_counter()
+            self.tracer.add_span(
+                "read",
+                now - (time.monotonic() - self._oldest),
+                now,
+                category="stream",
+                batch=self.batch_count + 1,
+                records=len(buffer),
+            )
+        _write_batch(
+            self._writer,
+            buffer,
+            self.entity_name,
+            self.config,
+            self._context,
+            partition_by=self.partition_by,
+            metrics=batch_metrics,
+            tracer=self.tracer,
+            id_ranges=self._id_ranges,
+        )
+        self.batch_count += 1
+        self.records_processed += len(buffer)
+        if batch_metrics is not None:
+            self._record_batch_metrics(batch_metrics, timings_before)
+        logger.info(
+            "stream batch %d processed, records_in_batch=%d, total_records=%d",
+            self.batch_count,
+            len(buffer),
+            self.records_processed,
+        )
+        if self.progress_callback is not None:
+            self.progress_callback(self.records_processed, self.total_records)
+
+    def _record_batch_metrics(
+        self, batch_metrics: BatchMetrics, timings_before: dict[str, float]
+    ) -> None:
+        """Complete and accumulate the metrics of a written batch."""
+        timings = getattr(self._writer, "timings", None)
+        if timings is not None:
+            batch_metrics.writer_seconds = {
+                label: seconds - timings_before.get(label, 0.0)
+                for label, seconds in timings.items()
+            }
+        batch_metrics.buffered_rows = self._writer.buffered_rows()
+        cast(StreamMetrics, self.metrics).add_batch(batch_metrics)
+        if self.metrics_callback is not None:
+            self.metrics_callback(batch_metrics)
+
+    def _flush_expired(self) -> None:
+        """Flush the partial batch and the writer's buffers after a timeout.
+
+        Caller must hold the lock.
+        """
+        self._flush_buffer()
+        self._writer_oldest = None
+        with _span(self.tracer, "flush"):
+            self._writer.flush()
+        logger.debug("stream latency flush, entity=%s", self.entity_name)
+
+    def _run_timer(self) -> None:
+        """Flush pending records once the oldest exceeded flush_interval."""
+        interval = cast(float, self.flush_interval)
+        timeout = interval
+        while not self._stop.wait(timeout):
+            with self._lock:
+                if self._closed:
+                    return
+                if self._expired():
+                    try:
+                        self._flush_expired()
+                    except BaseException as exc:
+                        self._timer_error = exc
+                        return
+                since = self._pending_since()
+                if since is not None:
+                    timeout = max(0.0, since + interval - time.monotonic())
+                else:
+                    timeout = interval
+
+    def __enter__(self) -> "StreamSession":
+        """Support for context manager protocol."""
+        return self
+
+    def __exit__(self, exc_type: Any, _exc_val: Any, _exc_tb: Any) -> Literal[False]:
+        """Close the session, discarding buffered records on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+        return False
+
+
 def stream_process(
     config: Any,
     data: (
@@ -20,101 +852,360 @@ def stream_process(
         | list[dict[str, Any]]
         | str
         | Path
-        | bytes
+        | BytesLike
+        | Stream
+        | DataFrameLike
         | Iterator[dict[str, Any]]
     ),
     entity_name: str,
-    output_format: str,
+    output_format: OutputFormat,
     output_destination: str | BinaryIO | None = None,
     extract_time: str | None = None,
     batch_size: int | None = None,
     progress_callback: ProgressCallback | None = None,
     total_records: int | None = None,
+    max_batch_latency: float | None = None,
+    partition_by: list[str] | None = None,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_interval: int = 100,
+    resume: bool = False,
+    parse_workers: int | None = None,
+    collect_metrics: bool = False,
+    metrics_callback: MetricsCallback | None = None,
+    trace_path: str | Path | None = None,
+    manifest: bool = False,
+    write_manifest: bool = False,
+    source_field: str | None = None,
+    record_path: str | None = None,
+    record_meta: list[str] | None = None,
+    engine: str = "records",
+    read_buffer_size: int = IJSON_READ_BUFFER,
+    use_decimal: bool = False,
+    parse_cache: ParseCache | str | Path | None = None,
+    read_ahead: int | None = None,
     **format_options: Any,
-) -> list[Path]:
+) -> StreamResult:
     """Stream process data and write directly to output.
 
     Args:
         config: TransmogConfig instance
-        data: Input data (dict, list, string, Path, bytes, or iterator)
+        data: Input data (dict, list, string, Path, bytes, stream,
+            DataFrame, or iterator)
         entity_name: Name of the entity being processed
-        output_format: Output format ("json", "csv", "parquet", "orc", etc)
+        output_format: Output format ("csv", "parquet", "orc", "avro"), or
+            several formats as a list or a dict of per-format options
         output_destination: File path or file-like object to write to
         extract_time: Optional extraction timestamp
         batch_size: Size of batches to process
         progress_callback: Optional callable invoked after each batch flush
         total_records: Total input record count (None when unknown)
+        max_batch_latency: Maximum seconds a record may wait in buffers before
+            its partial batch is flattened and the writer is flushed. None
+            flushes on batch size only.
+        partition_by: Main table columns for Hive-style partitioned output
+        checkpoint_path: File to save a checkpoint to every
+            ``checkpoint_interval`` batches and at the end of the input
+        checkpoint_interval: Batches between checkpoints
+        resume: Continue from the checkpoint in checkpoint_path, if any
+        parse_workers: Number of worker processes parsing a JSONL file in
+            parallel byte ranges (not supported with checkpoints)
+        collect_metrics: Attach stage-level metrics to the result
+        metrics_callback: Optional callable invoked with the BatchMetrics of
+            each batch (enables metrics collection)
+        trace_path: File to save a Chrome trace-event JSON of the run to
+        manifest: Attach a per-table manifest of the output to the result
+        write_manifest: Also save the manifest as ``_manifest.json`` in the
+            output directory
+        source_field: Field holding the source file path of each record
+        record_path: ijson-style path of the records inside each document
+        record_meta: Keys next to the records' array to add to each record
+        engine: "records" builds each input record before flattening it;
+            "events" flattens a JSON file or bytes from parse events, with
+            memory bounded by the largest array element
+        read_buffer_size: Bytes read at a time when parsing .json input with
+            ijson
+        use_decimal: Parse non-integer numbers of .json input streamed with
+            ijson as Decimal instead of float
+        parse_cache: Cache directory, or ParseCache, reusing the parsed
+            content of .json5 and .hjson files across runs
+        read_ahead: Bytes of file input to read ahead on a background
+            thread, so that disk reads overlap with flattening and writing.
+            None reads on the calling thread.
         **format_options: Format-specific options for the writer
 
     Returns:
-        List of file paths written by the writer.
+        List of file paths written by the writer, with metrics and manifest
+        attached when collected.
     """
-    # Pass stringify_mode to writer for optimization (skip type inference)
-    writer_options = dict(format_options)
-    if hasattr(config, "stringify_values") and config.stringify_values:
-        writer_options["stringify_mode"] = True
+    if checkpoint_path is not None and checkpoint_interval < 1:
+        raise ConfigurationError("checkpoint_interval must be at least 1")
+    if checkpoint_path is not None and parse_workers is not None:
+        raise ConfigurationError("parse_workers is not supported with checkpoints")
+    if checkpoint_path is not None and partition_by is not None:
+        raise ConfigurationError("partition_by is not supported with checkpoints")
+    if read_ahead is not None and read_ahead < 1:
+        raise ConfigurationError("read_ahead must be at least 1")
+    if engine == "events":
+        _check_events_input(
+            data,
+            config,
+            partition_by=partition_by,
+            checkpoint_path=checkpoint_path,
+            parse_workers=parse_workers,
+            record_path=record_path,
+            source_field=source_field,
+        )
+    elif engine != "records":
+        raise ConfigurationError(
+            f"engine must be 'records' or 'events', got {engine!r}"
+        )
 
-    writer = create_streaming_writer(
-        format_name=output_format,
-        destination=output_destination,
-        entity_name=entity_name,
-        **writer_options,
+    session = StreamSession(
+        output_destination,
+        name=entity_name,
+        output_format=output_format,
+        config=config,
+        progress_callback=progress_callback,
+        total_records=total_records,
+        extract_time=extract_time,
+        batch_size=batch_size,
+        flush_interval=max_batch_latency,
+        partition_by=partition_by,
+        checkpoint_path=checkpoint_path,
+        resume=resume,
+        collect_metrics=collect_metrics,
+        metrics_callback=metrics_callback,
+        trace_path=trace_path,
+        manifest=manifest,
+        write_manifest=write_manifest,
+        **format_options,
     )
+    with session:
+        if engine == "events":
+            for main_records, child_tables in iter_document_tables(
+                str(data) if isinstance(data, Path) else cast(str | BytesLike, data),
+                entity_name,
+                config,
+                session._context,
+                session.batch_size,
+                read_buffer_size,
+                use_decimal,
+                read_ahead,
+            ):
+                session.write_tables(main_records, child_tables, len(main_records))
+        elif checkpoint_path is None:
+            session.feed_many(
+                get_data_iterator(
+                    data,
+                    streaming=True,
+                    parse_workers=parse_workers,
+                    source_field=source_field,
+                    record_path=record_path,
+                    record_meta=record_meta,
+                    read_buffer_size=read_buffer_size,
+                    use_decimal=use_decimal,
+                    parse_cache=parse_cache,
+                    read_ahead=read_ahead,
+                )
+            )
+        else:
+            _feed_with_checkpoints(
+                session,
+                data,
+                checkpoint_interval,
+                source_field=source_field,
+                record_path=record_path,
+                record_meta=record_meta,
+                read_buffer_size=read_buffer_size,
+                use_decimal=use_decimal,
+                parse_cache=parse_cache,
+                read_ahead=read_ahead,
+            )
+    files = session.close()
+    metrics = session.metrics if collect_metrics or metrics_callback else None
+    return StreamResult(files, metrics, session.manifest)
+
+
+def _check_events_input(data: Any, config: TransmogConfig, **options: Any) -> None:
+    """Check that input and options can be used with engine="events".
+
+    Raises:
+        ConfigurationError: If the input is not a JSON file or JSON bytes,
+            or an option needs whole records
+    """
+    unsupported = [name for name, value in options.items() if value is not None]
+    if unsupported:
+        raise ConfigurationError(
+            f"engine='events' does not support {', '.join(unsupported)}"
+        )
+    if isinstance(data, Path):
+        data = str(data)
+    if not (
+        isinstance(data, (bytes, bytearray, memoryview))
+        or (isinstance(data, str) and os.path.isfile(data))
+    ):
+        raise ConfigurationError(
+            "engine='events' requires a JSON file path or JSON bytes as input"
+        )
+    check_event_config(config)
+
+
+def _feed_with_checkpoints(
+    session: StreamSession, data: Any, interval: int, **input_options: Any
+) -> None:
+    """Feed input batch by batch, checkpointing every ``interval`` batches."""
+    input_state = session.resume_state["input"] if session.resume_state else None
+    records, position = resumable_input(data, input_state, **input_options)
+    last_checkpoint = session.batch_count
+    while batch := _take_batch(records, session.batch_size):
+        session.feed_many(batch)
+        if session.batch_count - last_checkpoint >= interval:
+            session.checkpoint(position())
+            last_checkpoint = session.batch_count
+    session.checkpoint(position())
+
+
+def _take_batch(iterator: Iterator[dict[str, Any]], size: int) -> list[dict[str, Any]]:
+    """Pull up to ``size`` records from a synchronous iterator."""
+    return list(islice(iterator, size))
+
+
+async def stream_process_async(
+    config: Any,
+    data: (
+        AsyncIterable[dict[str, Any]]
+        | dict[str, Any]
+        | list[dict[str, Any]]
+        | str
+        | Path
+        | bytes
+        | Iterator[dict[str, Any]]
+    ),
+    entity_name: str,
+    output_format: OutputFormat,
+    output_destination: str | BinaryIO | None = None,
+    extract_time: str | None = None,
+    batch_size: int | None = None,
+    progress_callback: ProgressCallback | None = None,
+    total_records: int | None = None,
+    **format_options: Any,
+) -> list[Path]:
+    """Stream process data without blocking the running event loop.
+
+    Records from an async iterable are collected on the event loop, while
+    flattening and writer encoding run on a single worker thread so that
+    writes stay ordered. At most one batch is in flight: collecting the
+    next batch overlaps with writing the current one, and the producer
+    waits for the pending write before handing over another batch.
+    Synchronous inputs (files, strings, lists) are read on the worker
+    thread as well.
+
+    Args:
+        config: TransmogConfig instance
+        data: Async iterable of records, or any input accepted by
+            stream_process
+        entity_name: Name of the entity being processed
+        output_format: Output format ("csv", "parquet", "orc", "avro"), or
+            several formats as a list or a dict of per-format options
+        output_destination: File path or file-like object to write to
+        extract_time: Optional extraction timestamp
+        batch_size: Size of batches to process
+        progress_callback: Optional callable invoked after each batch flush
+        total_records: Total input record count (None when unknown)
+        **format_options: Format-specific options for the writer
 
-    logger.info("stream started, entity=%s, format=%s", entity_name, output_format)
+    Returns:
+        List of file paths written by the writer.
+    """
+    loop = asyncio.get_running_loop()
+    actual_batch_size = batch_size or config.batch_size
+    timestamp = extract_time if extract_time else get_current_timestamp()
+    context = ProcessingContext(extract_time=timestamp)
 
     batch_count = 0
     total_records_processed = 0
-    files_written: list[Path] = []
+    pending: asyncio.Future[None] | None = None
+    pending_records = 0
 
-    try:
-        data_iterator = get_data_iterator(data, streaming=True)
-        actual_batch_size = batch_size or config.batch_size
-        timestamp = extract_time if extract_time else get_current_timestamp()
-        context = ProcessingContext(extract_time=timestamp)
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="transmog-stream"
+    ) as executor:
+        writer = await loop.run_in_executor(
+            executor,
+            _create_writer,
+            config,
+            entity_name,
+            output_format,
+            output_destination,
+            format_options,
+        )
 
-        def flush_batch(buffer: list[dict[str, Any]]) -> None:
-            nonlocal batch_count, total_records_processed
-            main_records, child_tables = process_record_batch(
-                records=buffer,
-                entity_name=entity_name,
-                config=config,
-                _context=context,
-            )
-            writer.write_main_records(main_records)
-            for table_name, table_records in child_tables.items():
-                writer.write_child_records(table_name, table_records)
+        logger.info(
+            "async stream started, entity=%s, format=%s", entity_name, output_format
+        )
+
+        async def wait_pending() -> None:
+            nonlocal pending, batch_count, total_records_processed
+            if pending is None:
+                return
+            try:
+                await pending
+            finally:
+                pending = None
             batch_count += 1
-            total_records_processed += len(buffer)
+            total_records_processed += pending_records
             logger.info(
-                "stream batch %d processed, records_in_batch=%d, total_records=%d",
+                "async stream batch %d processed, records_in_batch=%d, "
+                "total_records=%d",
                 batch_count,
-                len(buffer),
+                pending_records,
                 total_records_processed,
             )
             if progress_callback is not None:
                 progress_callback(total_records_processed, total_records)
 
-        record_buffer = []
-        for record in data_iterator:
-            record_buffer.append(record)
-
-            if len(record_buffer) >= actual_batch_size:
-                flush_batch(record_buffer)
-                record_buffer = []
+        async def submit(buffer: list[dict[str, Any]]) -> None:
+            nonlocal pending, pending_records
+            await wait_pending()
+            pending_records = len(buffer)
+            pending = loop.run_in_executor(
+                executor, _write_batch, writer, buffer, entity_name, config, context
+            )
 
-        if record_buffer:
-            flush_batch(record_buffer)
+        try:
+            if isinstance(data, AsyncIterable):
+                record_buffer: list[dict[str, Any]] = []
+                async for record in data:
+                    record_buffer.append(record)
+                    if len(record_buffer) >= actual_batch_size:
+                        await submit(record_buffer)
+                        record_buffer = []
+                if record_buffer:
+                    await submit(record_buffer)
+            else:
+                iterator = await loop.run_in_executor(
+                    executor, lambda: get_data_iterator(data, streaming=True)
+                )
+                while True:
+                    batch = await loop.run_in_executor(
+                        executor, _take_batch, iterator, actual_batch_size
+                    )
+                    if not batch:
+                        break
+                    await submit(batch)
+            await wait_pending()
 
-        logger.info(
-            "stream completed, entity=%s, total_batches=%d, total_records=%d",
-            entity_name,
-            batch_count,
-            total_records_processed,
-        )
-    finally:
-        files_written = writer.close()
+            logger.info(
+                "async stream completed, entity=%s, total_batches=%d, total_records=%d",
+                entity_name,
+                batch_count,
+                total_records_processed,
+            )
+        finally:
+            if pending is not None:
+                await asyncio.wait([pending])
+            files_written = await loop.run_in_executor(executor, writer.close)
     return files_written
 
 
-__all__ = ["stream_process"]
+__all__ = ["StreamSession", "stream_process", "stream_process_async"]
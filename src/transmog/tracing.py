@@ -0,0 +1,189 @@
+"""Chrome trace-event export of the streaming batch lifecycle."""
+
+import gc
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from transmog.exceptions import OutputError
+
+
+def _microseconds(seconds: float) -> float:
+    return round(seconds * 1_000_000, 3)
+
+
+class Tracer:
+    """Recorder of spans in the Chrome trace-event format.
+
+    Spans are stored as complete ("X") events with ``time.perf_counter()``
+    timestamps, so traces of several worker processes on one machine share a
+    time axis. The saved JSON can be opened in Perfetto (ui.perfetto.dev) or
+    ``chrome://tracing``. While started, garbage collection passes are
+    recorded as ``gc`` spans on the thread that triggered them.
+
+    Examples:
+        >>> tracer = Tracer()
+        >>> tracer.start()
+        >>> with tracer.span("flatten", records=100):
+        ...     pass
+        >>> tracer.stop()
+        >>> tracer.save("trace.json")
+    """
+
+    def __init__(self, trace_gc: bool = True) -> None:
+        """Initialize an empty trace.
+
+        Args:
+            trace_gc: Record garbage collection passes while started
+        """
+        self.trace_gc = trace_gc
+        self.events: list[dict[str, Any]] = []
+        # Reentrant, as a collection can start while _append holds the lock
+        # and its gc callback appends a span on the same thread
+        self._lock = threading.RLock()
+        self._threads: set[tuple[int, int]] = set()
+        self._gc_started: dict[int, float] = {}
+        self._active = False
+
+    def start(self) -> None:
+        """Start recording garbage collection passes."""
+        if self._active:
+            return
+        self._active = True
+        if self.trace_gc:
+            gc.callbacks.append(self._on_gc)
+
+    def stop(self) -> None:
+        """Stop recording garbage collection passes."""
+        if not self._active:
+            return
+        self._active = False
+        if self.trace_gc and self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = "transmog", **args: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Record the duration of a block as a span.
+
+        Args:
+            name: Span name
+            category: Trace category
+            **args: Values shown with the span; more can be added to the
+                yielded dictionary inside the block
+
+        Yields:
+            The span's argument dictionary
+        """
+        started = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.add_span(name, started, time.perf_counter(), category, **args)
+
+    def add_span(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        category: str = "transmog",
+        **args: Any,
+    ) -> None:
+        """Record a span with known start and end times.
+
+        Args:
+            name: Span name
+            start: Start time from ``time.perf_counter()``
+            end: End time from ``time.perf_counter()``
+            category: Trace category
+            **args: Values shown with the span
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": _microseconds(start),
+            "dur": _microseconds(max(0.0, end - start)),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self._append(event)
+
+    def _append(self, event: dict[str, Any]) -> None:
+        """Store an event, naming its thread on first use."""
+        key = (event["pid"], event["tid"])
+        with self._lock:
+            if key not in self._threads:
+                self._threads.add(key)
+                self.events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": key[0],
+                        "tid": key[1],
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+            self.events.append(event)
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        """Turn garbage collector start and stop callbacks into spans."""
+        thread = threading.get_ident()
+        if phase == "start":
+            self._gc_started[thread] = time.perf_counter()
+            return
+        started = self._gc_started.pop(thread, None)
+        if started is not None:
+            self.add_span(
+                "gc",
+                started,
+                time.perf_counter(),
+                category="gc",
+                generation=info.get("generation"),
+                collected=info.get("collected"),
+            )
+
+    def extend(self, events: list[dict[str, Any]]) -> None:
+        """Add events recorded by another tracer, such as a worker's.
+
+        Args:
+            events: Trace events to add
+        """
+        with self._lock:
+            self.events.extend(events)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the trace as a Chrome trace-event document.
+
+        Returns:
+            Dictionary with the ``traceEvents`` list
+        """
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> None:
+        """Write the trace as JSON.
+
+        Args:
+            path: Output file path
+
+        Raises:
+            OutputError: If the file cannot be written
+        """
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+        except OSError as exc:
+            raise OutputError(f"Failed to write trace {path}: {exc}") from exc
+
+
+__all__ = ["Tracer"]
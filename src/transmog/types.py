@@ -7,6 +7,7 @@ from typing import Any
 
 JsonDict = dict[str, Any]
 ProgressCallback = Callable[[int, int | None], None]
+OutputFormat = str | list[str] | dict[str, dict[str, Any]]
 
 
 class ArrayMode(Enum):
@@ -52,6 +53,7 @@ class ProcessingContext:
 __all__ = [
     "JsonDict",
     "ProgressCallback",
+    "OutputFormat",
     "ArrayMode",
     "ProcessingContext",
 ]
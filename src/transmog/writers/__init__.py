@@ -25,6 +25,8 @@ from transmog.writers.parquet import (
     ParquetStreamingWriter,
     ParquetWriter,
 )
+from transmog.writers.partitioned import PartitionedStreamingWriter
+from transmog.writers.tee import TeeStreamingWriter
 
 # Registry of available writer formats
 FORMATS: dict[str, type[DataWriter]] = {"csv": CsvWriter}
@@ -82,28 +84,19 @@ def create_writer(format_name: str, **kwargs: Any) -> DataWriter:
     return writer_class(**kwargs)
 
 
-def create_streaming_writer(
-    format_name: str,
-    destination: str | BinaryIO | None = None,
-    entity_name: str = "entity",
-    **kwargs: Any,
-) -> StreamingWriter:
-    """Create a streaming writer for the given format.
+def _get_streaming_writer_class(format_name: str) -> type[StreamingWriter]:
+    """Look up the streaming writer class for a format.
 
     Args:
-        format_name: Format name (csv, parquet, orc, avro)
-        destination: File path or file-like object to write to
-        entity_name: Name of the entity being processed
-        **kwargs: Format-specific options
+        format_name: Lowercase format name
 
     Returns:
-        Streaming writer instance
+        Streaming writer class
 
     Raises:
         ConfigurationError: If the format is not supported
         MissingDependencyError: If a required dependency is missing
     """
-    format_name = format_name.lower()
     writer_class = STREAMING_FORMATS.get(format_name)
 
     if not writer_class:
@@ -127,9 +120,68 @@ def create_streaming_writer(
             f"Supported: {', '.join(STREAMING_FORMATS.keys())}"
         )
 
+    return writer_class
+
+
+def create_streaming_writer(
+    format_name: str,
+    destination: str | BinaryIO | None = None,
+    entity_name: str = "entity",
+    **kwargs: Any,
+) -> StreamingWriter:
+    """Create a streaming writer for the given format.
+
+    Args:
+        format_name: Format name (csv, parquet, orc, avro)
+        destination: File path or file-like object to write to
+        entity_name: Name of the entity being processed
+        **kwargs: Format-specific options
+
+    Returns:
+        Streaming writer instance
+
+    Raises:
+        ConfigurationError: If the format is not supported
+        MissingDependencyError: If a required dependency is missing
+    """
+    writer_class = _get_streaming_writer_class(format_name.lower())
     return writer_class(destination=destination, entity_name=entity_name, **kwargs)
 
 
+def create_partitioned_writer(
+    format_name: str,
+    destination: str,
+    partition_by: list[str],
+    entity_name: str = "entity",
+    **kwargs: Any,
+) -> PartitionedStreamingWriter:
+    """Create a Hive-style partitioned streaming writer.
+
+    Args:
+        format_name: Format of the part files (csv, parquet, orc, avro)
+        destination: Output directory
+        partition_by: Main table columns to partition by
+        entity_name: Name of the entity being processed
+        **kwargs: Partitioning and format-specific options
+
+    Returns:
+        Partitioned streaming writer instance
+
+    Raises:
+        ConfigurationError: If the format is not supported
+        MissingDependencyError: If a required dependency is missing
+    """
+    format_name = format_name.lower()
+    _get_streaming_writer_class(format_name)
+    return PartitionedStreamingWriter(
+        destination=destination,
+        entity_name=entity_name,
+        format_name=format_name,
+        partition_by=partition_by,
+        **kwargs,
+    )
+
+
 __all__ = [
     "DataWriter",
     "StreamingWriter",
@@ -141,6 +193,9 @@ __all__ = [
     "OrcStreamingWriter",
     "ParquetWriter",
     "ParquetStreamingWriter",
+    "PartitionedStreamingWriter",
+    "TeeStreamingWriter",
     "create_writer",
     "create_streaming_writer",
+    "create_partitioned_writer",
 ]
@@ -5,11 +5,16 @@ import math
 import os
 import pathlib
 from abc import abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, BinaryIO, TextIO
 
-from transmog.exceptions import MissingDependencyError, OutputError
+from transmog.exceptions import (
+    ConfigurationError,
+    MissingDependencyError,
+    OutputError,
+)
 from transmog.writers.base import DataWriter, StreamingWriter, _collect_field_names
 
 logger = logging.getLogger(__name__)
@@ -190,6 +195,9 @@ class PyArrowStreamingWriter(StreamingWriter):
         compression: str = "snappy",
         batch_size: int = 10000,
         stringify_mode: bool = False,
+        max_rows_per_file: int | None = None,
+        max_bytes_per_file: int | None = None,
+        max_open_files: int | None = None,
         **options: Any,
     ) -> None:
         """Initialize the PyArrow streaming writer.
@@ -200,9 +208,17 @@ class PyArrowStreamingWriter(StreamingWriter):
             compression: Compression algorithm
             batch_size: Number of records per batch
             stringify_mode: If True, all fields are strings (skip type inference)
+            max_rows_per_file: Roll to a new numbered file after this many rows
+            max_bytes_per_file: Roll to a new numbered file once a file reaches
+                approximately this size
+            max_open_files: Maximum number of tables with an open file or
+                buffered rows; the least recently written table is finalized
+                and continues in a new numbered file
             **options: Additional options for PyArrow
         """
         super().__init__(destination, entity_name, **options)
+        self._configure_rolling(max_rows_per_file, max_bytes_per_file)
+        self._configure_open_files(max_open_files)
 
         if pa is None:
             format_name = self._get_format_name()
@@ -220,11 +236,17 @@ class PyArrowStreamingWriter(StreamingWriter):
         self.buffers: dict[str, list[dict[str, Any]]] = {}
         self.base_dir: str | None = None
         self._column_buffers: dict[str, dict[str, list[Any]]] = {}
+        self._shared_schemas: dict[str, dict[str, Any]] = {}
         self.file_paths: dict[str, str] = {}
+        self._active_tables: OrderedDict[str, None] = OrderedDict()
 
         if isinstance(destination, str):
             self.base_dir = destination
             os.makedirs(self.base_dir, exist_ok=True)
+        elif self.rolls_files:
+            raise ConfigurationError(
+                "Rolling output files requires a directory path destination"
+            )
 
     @abstractmethod
     def _get_format_name(self) -> str:
@@ -263,12 +285,15 @@ class PyArrowStreamingWriter(StreamingWriter):
 
         extension = self._get_file_extension()
         if table_name == "main":
-            file_path = os.path.join(self.base_dir, f"{self.entity_name}{extension}")
+            stem = self.entity_name
         else:
-            safe_name = table_name.replace(".", "_").replace("/", "_")
-            file_path = os.path.join(self.base_dir, f"{safe_name}{extension}")
+            stem = table_name.replace(".", "_").replace("/", "_")
+        file_path = os.path.join(
+            self.base_dir, self._file_name(table_name, stem, extension)
+        )
 
         self.file_paths[table_name] = file_path
+        self._track_file(table_name, file_path)
         return file_path
 
     def _create_schema(
@@ -348,6 +373,41 @@ class PyArrowStreamingWriter(StreamingWriter):
         logger.debug("arrow schema created, fields=%d, types=%s", len(fields), types)
         return pa.schema(fields), converters
 
+    def share_schema(self, table_name: str, schema: dict[str, Any]) -> None:
+        """Use Arrow column types shared with other writers of the same table.
+
+        Values of a shared column are converted to its shared type, as they
+        are for later batches of a single file.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            schema: Arrow type names keyed by column name, updated in place
+        """
+        self._shared_schemas[table_name] = schema
+
+    def _apply_shared_schema(self, table_name: str, schema: Any) -> Any:
+        """Merge an inferred schema into the table's shared schema.
+
+        Args:
+            table_name: Name of the table
+            schema: Schema inferred from the table's first records
+
+        Returns:
+            Schema with every shared column, in shared order, followed by
+            the inferred columns that were not shared yet
+        """
+        shared = self._shared_schemas.get(table_name)
+        if shared is None:
+            return schema
+        for field in schema:
+            shared.setdefault(field.name, str(field.type))
+        return pa.schema(
+            [
+                pa.field(name, pa.type_for_alias(type_name))
+                for name, type_name in shared.items()
+            ]
+        )
+
     def _records_to_table(self, records: list[dict[str, Any]], table_name: str) -> Any:
         """Convert records to PyArrow table.
 
@@ -365,8 +425,16 @@ class PyArrowStreamingWriter(StreamingWriter):
             schema, converters = self._create_schema(
                 records, stringify_mode=self.stringify_mode
             )
+            if table_name in self._shared_schemas:
+                schema = self._apply_shared_schema(table_name, schema)
+                type_converters = _get_type_converters()
+                converters = {
+                    field.name: type_converters.get(field.type, _convert_str)
+                    for field in schema
+                }
             self.schemas[table_name] = schema
             self.converters[table_name] = converters
+            self._track_arrow_schema(table_name, schema)
 
         schema = self.schemas[table_name]
         converters = self.converters[table_name]
@@ -407,6 +475,18 @@ class PyArrowStreamingWriter(StreamingWriter):
         writer = self._create_writer(file_path, schema)
         self.writers[table_name] = writer
         self.schemas[table_name] = schema
+        self._track_arrow_schema(table_name, schema)
+
+    def _track_arrow_schema(self, table_name: str, schema: Any) -> None:
+        """Remember a table's Arrow column types.
+
+        Args:
+            table_name: Name of the table
+            schema: PyArrow schema
+        """
+        self._track_schema(
+            table_name, {field.name: str(field.type) for field in schema}
+        )
 
     def _write_buffer(self, table_name: str) -> None:
         """Write buffered records to file.
@@ -418,17 +498,85 @@ class PyArrowStreamingWriter(StreamingWriter):
             return
 
         records = self.buffers[table_name]
-        table = self._records_to_table(records, table_name)
+        with self._span("write_buffer", table=table_name, rows=len(records)):
+            table = self._records_to_table(records, table_name)
 
-        if table_name not in self.writers:
-            self._initialize_writer(table_name, table.schema)
+            if not self.rolls_files:
+                if table_name not in self.writers:
+                    self._initialize_writer(table_name, table.schema)
 
-        writer = self.writers.get(table_name)
-        if writer:
-            self._write_to_writer(writer, table)
+                writer = self.writers.get(table_name)
+                if writer:
+                    self._write_to_writer(writer, table)
+            else:
+                # Files are sized by the Arrow size of the rows written to
+                # them: ORC keeps stripes in memory and Parquet row groups
+                # only reach the disk when complete, so the file size on disk
+                # lags behind. Each chunk becomes its own row group or stripe.
+                row_bytes = table.nbytes / table.num_rows
+                for start, end in self._file_chunks(
+                    table_name, table.num_rows, row_bytes
+                ):
+                    if table_name not in self.writers:
+                        self._initialize_writer(table_name, table.schema)
+                    chunk = table.slice(start, end - start)
+                    self._write_to_writer(self.writers[table_name], chunk)
+                    size = self.bytes_in_file.get(table_name, 0) + chunk.nbytes
+                    if self._record_file_write(table_name, end - start, size):
+                        self._roll_file(table_name)
 
         self.buffers[table_name].clear()
 
+    def _roll_file(self, table_name: str) -> None:
+        """Finalize the current file of a table and start a numbered new one.
+
+        Args:
+            table_name: Name of the table
+        """
+        writer = self.writers.pop(table_name, None)
+        if writer is not None and hasattr(writer, "close"):
+            writer.close()
+        self._advance_file(table_name, self.file_paths.pop(table_name, None))
+
+    def buffered_rows(self) -> int:
+        """Get the number of rows buffered for the next row group or stripe.
+
+        Returns:
+            Buffered row count across all tables
+        """
+        return sum(len(buffer) for buffer in self.buffers.values())
+
+    def _touch_table(self, table_name: str) -> None:
+        """Mark a table as most recently used, suspending the least recent.
+
+        Args:
+            table_name: Name of the table about to receive records
+        """
+        if self.max_open_files is None:
+            return
+
+        if table_name in self._active_tables:
+            self._active_tables.move_to_end(table_name)
+            return
+
+        while len(self._active_tables) >= self.max_open_files:
+            self._suspend_table(next(iter(self._active_tables)))
+        self._active_tables[table_name] = None
+
+    def _suspend_table(self, table_name: str) -> None:
+        """Write out a table's buffer and finalize its current file.
+
+        Later records for the table are written to its next numbered file.
+
+        Args:
+            table_name: Name of the table
+        """
+        self._active_tables.pop(table_name, None)
+        self._write_buffer(table_name)
+        if table_name in self.writers:
+            logger.debug("arrow writer suspended, table=%s", table_name)
+            self._roll_file(table_name)
+
     def write_main_records(self, records: list[dict[str, Any]]) -> None:
         """Write a batch of main records.
 
@@ -439,6 +587,7 @@ class PyArrowStreamingWriter(StreamingWriter):
             return
 
         table_name = "main"
+        self._touch_table(table_name)
 
         if table_name not in self.buffers:
             self.buffers[table_name] = []
@@ -460,6 +609,8 @@ class PyArrowStreamingWriter(StreamingWriter):
         if not records:
             return
 
+        self._touch_table(table_name)
+
         if table_name not in self.buffers:
             self.buffers[table_name] = []
 
@@ -468,6 +619,77 @@ class PyArrowStreamingWriter(StreamingWriter):
         if len(self.buffers[table_name]) >= self.batch_size:
             self._write_buffer(table_name)
 
+    def flush(self) -> None:
+        """Write all buffered records, ending the current row group or stripe."""
+        for table_name in list(self.buffers.keys()):
+            if self.buffers[table_name]:
+                self._write_buffer(table_name)
+
+    def checkpoint_state(self) -> dict[str, Any]:
+        """Finalize every open file and describe the output state.
+
+        Buffered rows are written and each open file is closed, so every
+        file listed in the state is complete. Tables continue in their next
+        numbered file.
+
+        Returns:
+            Writer state for restore_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if self.base_dir is None:
+            format_name = self._get_format_name()
+            raise ConfigurationError(
+                f"{format_name} checkpoints require a directory destination"
+            )
+
+        for table_name in list(self.buffers):
+            self._write_buffer(table_name)
+        for table_name in list(self.writers):
+            self._roll_file(table_name)
+        self._active_tables.clear()
+
+        return {
+            **self._rolling_state(),
+            "schemas": {
+                table_name: [[field.name, str(field.type)] for field in schema]
+                for table_name, schema in self.schemas.items()
+            },
+            "files": list(self.finished_paths),
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Continue numbering files after the checkpointed ones.
+
+        Args:
+            state: State returned by checkpoint_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if self.base_dir is None:
+            format_name = self._get_format_name()
+            raise ConfigurationError(
+                f"{format_name} checkpoints require a directory destination"
+            )
+
+        self._restore_rolling_state(state)
+        type_converters = _get_type_converters()
+        for table_name, fields in state["schemas"].items():
+            schema = pa.schema(
+                [
+                    pa.field(name, pa.type_for_alias(type_name))
+                    for name, type_name in fields
+                ]
+            )
+            self.schemas[table_name] = schema
+            self._track_arrow_schema(table_name, schema)
+            self.converters[table_name] = {
+                field.name: type_converters.get(field.type, _convert_str)
+                for field in schema
+            }
+
     def close(self) -> list[Path]:
         """Finalize output, flush buffered data, and clean up resources.
 
@@ -477,11 +699,10 @@ class PyArrowStreamingWriter(StreamingWriter):
         if getattr(self, "_closed", False):
             return []
 
-        for table_name in list(self.buffers.keys()):
-            if self.buffers[table_name]:
-                self._write_buffer(table_name)
+        self.flush()
 
-        paths = [Path(p) for p in self.file_paths.values()]
+        paths = [Path(p) for p in self.finished_paths]
+        paths.extend(Path(p) for p in self.file_paths.values())
 
         for writer in self.writers.values():
             if hasattr(writer, "close"):
@@ -492,6 +713,7 @@ class PyArrowStreamingWriter(StreamingWriter):
         self.converters.clear()
         self.buffers.clear()
         self._column_buffers.clear()
+        self._active_tables.clear()
         self._closed = True
         return paths
 
@@ -6,7 +6,7 @@ import warnings
 from pathlib import Path
 from typing import Any, BinaryIO, TextIO
 
-from transmog.exceptions import OutputError
+from transmog.exceptions import ConfigurationError, OutputError
 from transmog.writers.base import (
     DataWriter,
     StreamingWriter,
@@ -371,6 +371,8 @@ class AvroStreamingWriter(StreamingWriter):
         entity_name: str = "entity",
         codec: str = "snappy",
         sync_interval: int = 16000,
+        max_rows_per_file: int | None = None,
+        max_bytes_per_file: int | None = None,
         **options: Any,
     ) -> None:
         """Initialize the Avro streaming writer.
@@ -380,6 +382,9 @@ class AvroStreamingWriter(StreamingWriter):
             entity_name: Name of the entity for output files
             codec: Compression codec (null, deflate, snappy, zstandard, lz4, bzip2, xz)
             sync_interval: Approximate size of sync blocks in bytes
+            max_rows_per_file: Roll to a new numbered file after this many rows
+            max_bytes_per_file: Roll to a new numbered file once a file reaches
+                approximately this size
             **options: Additional Avro writer options
         """
         if not AVRO_AVAILABLE:
@@ -389,6 +394,14 @@ class AvroStreamingWriter(StreamingWriter):
             )
 
         super().__init__(destination, entity_name, **options)
+        self._configure_rolling(max_rows_per_file, max_bytes_per_file)
+
+        if self.rolls_files and (
+            not isinstance(destination, str) or destination.endswith(".avro")
+        ):
+            raise ConfigurationError(
+                "Rolling output files requires a directory path destination"
+            )
 
         if codec not in AVRO_CODECS:
             raise OutputError(
@@ -404,6 +417,7 @@ class AvroStreamingWriter(StreamingWriter):
         self.schemas: dict[str, dict[str, Any]] = {}
         self.schema_field_sets: dict[str, set[str]] = {}
         self.initialized_tables: set[str] = set()
+        self._shared_schemas: dict[str, dict[str, Any]] = {}
         # For file-like object destinations (non-path based)
         self.file_object_dest: BinaryIO | None = None
 
@@ -412,6 +426,7 @@ class AvroStreamingWriter(StreamingWriter):
                 os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
                 self.single_file_path = destination
                 self.file_paths["main"] = destination
+                self._track_file("main", destination)
             else:
                 self.base_dir = destination
                 os.makedirs(self.base_dir, exist_ok=True)
@@ -449,8 +464,11 @@ class AvroStreamingWriter(StreamingWriter):
             else:
                 filename = _sanitize_filename(table_name)
 
-            file_path = os.path.join(self.base_dir, f"{filename}.avro")
+            file_path = os.path.join(
+                self.base_dir, self._file_name(table_name, filename, ".avro")
+            )
             self.file_paths[table_name] = file_path
+            self._track_file(table_name, file_path)
             return file_path
 
         # For file-like object destinations, only "main" table is supported
@@ -484,11 +502,36 @@ class AvroStreamingWriter(StreamingWriter):
             record_name = f"_{record_name}"
 
         schema = _infer_avro_schema(records, name=record_name or "Record")
+        shared = self._shared_schemas.get(table_name)
+        if shared is not None:
+            # Shared columns are nullable, as other writers' files may lack
+            # them or hold values that do not convert to their type
+            for field in schema["fields"]:
+                field_type = field["type"]
+                if not isinstance(field_type, list):
+                    field_type = ["null", field_type]
+                elif "null" not in field_type:
+                    field_type = ["null", *field_type]
+                shared.setdefault(field["name"], field_type)
+            schema["fields"] = [
+                {"name": name, "type": field_type}
+                for name, field_type in shared.items()
+            ]
         self.schemas[table_name] = schema
         self.schema_field_sets[table_name] = {f["name"] for f in schema["fields"]}
+        self._track_schema(table_name, {f["name"]: f["type"] for f in schema["fields"]})
 
         return schema
 
+    def share_schema(self, table_name: str, schema: dict[str, Any]) -> None:
+        """Use Avro field types shared with other writers of the same table.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            schema: Avro field types keyed by field name, updated in place
+        """
+        self._shared_schemas[table_name] = schema
+
     def _check_schema_drift(
         self, table_name: str, records: list[dict[str, Any]]
     ) -> None:
@@ -573,33 +616,72 @@ class AvroStreamingWriter(StreamingWriter):
                 "file-like object destination. Use a directory path instead."
             )
 
+        if self.rolls_files:
+            for start, end in self._file_chunks(table_name, len(prepared_records)):
+                file_path = self._append_block(
+                    table_name, parsed_schema, prepared_records[start:end]
+                )
+                if self._record_file_write(
+                    table_name, end - start, os.path.getsize(file_path)
+                ):
+                    self._roll_file(table_name)
+        else:
+            self._append_block(table_name, parsed_schema, prepared_records)
+
+    def _append_block(
+        self,
+        table_name: str,
+        parsed_schema: Any,
+        prepared_records: list[dict[str, Any]],
+    ) -> str:
+        """Write records as a block to the current file of a table.
+
+        Args:
+            table_name: Name of the table
+            parsed_schema: Parsed Avro schema
+            prepared_records: Records prepared to match the schema
+
+        Returns:
+            Path of the file written to
+        """
         # Get file path for this table
         file_path = self._get_file_path_for_table(table_name)
         if file_path is None:
             raise OutputError(f"Cannot determine file path for table {table_name}")
 
-        if table_name not in self.initialized_tables:
-            # First write - create new file with schema
-            with open(file_path, "wb") as f:
-                avro_writer(
-                    f,
-                    parsed_schema,
-                    prepared_records,
-                    codec=self.codec,
-                    sync_interval=self.sync_interval,
-                )
-            self.initialized_tables.add(table_name)
-        else:
-            # Subsequent writes - append to existing file using a+b mode
-            # fastavro reuses the schema from the existing file when schema=None
-            with open(file_path, "a+b") as f:
-                avro_writer(
-                    f,
-                    None,  # Schema is read from existing file
-                    prepared_records,
-                    codec=self.codec,
-                    sync_interval=self.sync_interval,
-                )
+        with self._span("write_block", table=table_name, rows=len(prepared_records)):
+            if table_name not in self.initialized_tables:
+                # First write - create new file with schema
+                with open(file_path, "wb") as f:
+                    avro_writer(
+                        f,
+                        parsed_schema,
+                        prepared_records,
+                        codec=self.codec,
+                        sync_interval=self.sync_interval,
+                    )
+                self.initialized_tables.add(table_name)
+            else:
+                # Subsequent writes - append to existing file using a+b mode
+                # fastavro reuses the schema from the existing file when schema=None
+                with open(file_path, "a+b") as f:
+                    avro_writer(
+                        f,
+                        None,  # Schema is read from existing file
+                        prepared_records,
+                        codec=self.codec,
+                        sync_interval=self.sync_interval,
+                    )
+        return file_path
+
+    def _roll_file(self, table_name: str) -> None:
+        """Start a numbered new file for a table.
+
+        Args:
+            table_name: Name of the table
+        """
+        self.initialized_tables.discard(table_name)
+        self._advance_file(table_name, self.file_paths.pop(table_name, None))
 
     def write_main_records(self, records: list[dict[str, Any]]) -> None:
         """Write a batch of main records.
@@ -620,6 +702,63 @@ class AvroStreamingWriter(StreamingWriter):
         """
         self._write_records(table_name, records)
 
+    def checkpoint_state(self) -> dict[str, Any]:
+        """Sync table files to disk and record their size and schema.
+
+        Blocks are appended and the file closed on every write, so each
+        recorded size ends on a block boundary. Closing does not make the
+        blocks durable, so each file is reopened and synced.
+
+        Returns:
+            Writer state for restore_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if not self.base_dir:
+            raise ConfigurationError("Avro checkpoints require a directory destination")
+
+        sizes: dict[str, int] = {}
+        for table_name, path in self.file_paths.items():
+            if table_name not in self.initialized_tables:
+                continue
+            with open(path, "ab") as file_obj:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+            sizes[table_name] = os.path.getsize(path)
+        return {
+            **self._rolling_state(),
+            "file_paths": {name: self.file_paths[name] for name in sizes},
+            "sizes": sizes,
+            "schemas": self.schemas,
+            "files": [*self.finished_paths, *(self.file_paths[n] for n in sizes)],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Truncate files to their checkpointed size and append from there.
+
+        Args:
+            state: State returned by checkpoint_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if not self.base_dir:
+            raise ConfigurationError("Avro checkpoints require a directory destination")
+
+        self._restore_rolling_state(state)
+        for table_name, path in state["file_paths"].items():
+            os.truncate(path, state["sizes"][table_name])
+            self.file_paths[table_name] = path
+            self._track_file(table_name, path)
+            self.initialized_tables.add(table_name)
+        for table_name, schema in state["schemas"].items():
+            self.schemas[table_name] = schema
+            self.schema_field_sets[table_name] = {f["name"] for f in schema["fields"]}
+            self._track_schema(
+                table_name, {f["name"]: f["type"] for f in schema["fields"]}
+            )
+
     def close(self) -> list[Path]:
         """Finalize output and clean up resources.
 
@@ -637,7 +776,8 @@ class AvroStreamingWriter(StreamingWriter):
             if hasattr(self.file_object_dest, "flush"):
                 self.file_object_dest.flush()
 
-        paths = [Path(p) for p in self.file_paths.values()]
+        paths = [Path(p) for p in self.finished_paths]
+        paths.extend(Path(p) for p in self.file_paths.values())
 
         # Clear metadata
         self.file_paths.clear()
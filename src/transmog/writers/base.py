@@ -1,11 +1,17 @@
 """Base classes for data writers."""
 
 import math
+import os
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import Any, BinaryIO, Literal, TextIO
 
+from transmog.exceptions import ConfigurationError, OutputError
+from transmog.tracing import Tracer
+
 
 def _normalize_special_floats(value: Any, null_replacement: Any = None) -> Any:
     """Normalize special float values (NaN, Inf) for output.
@@ -59,6 +65,20 @@ def _sanitize_filename(name: str) -> str:
     return sanitized.strip("_")
 
 
+def _numbered_file_name(stem: str, number: int, extension: str) -> str:
+    """Build the name of a rolled output file.
+
+    Args:
+        stem: Base file name without extension
+        number: 1-based file number
+        extension: File extension including the dot
+
+    Returns:
+        File name such as ``table-00001.parquet``
+    """
+    return f"{stem}-{number:05d}{extension}"
+
+
 class DataWriter(ABC):
     """Abstract base class for data writers."""
 
@@ -101,6 +121,252 @@ class StreamingWriter(ABC):
         self.destination = destination
         self.entity_name = entity_name
         self.options = options
+        self.max_rows_per_file: int | None = None
+        self.max_bytes_per_file: int | None = None
+        self.file_numbers: dict[str, int] = {}
+        self.rows_in_file: dict[str, int] = {}
+        self.bytes_in_file: dict[str, int] = {}
+        # Stem and extension of tables whose first file is not numbered
+        self._unnumbered_files: dict[str, tuple[str, str]] = {}
+        self.finished_paths: list[str] = []
+        self.max_open_files: int | None = None
+        self.table_paths: dict[str, list[str]] = {}
+        self.table_schemas: dict[str, dict[str, Any]] = {}
+        self.tracer: Tracer | None = None
+
+    def attach_tracer(self, tracer: Tracer | None) -> None:
+        """Record writer spans (table writes and buffer flushes) in a trace.
+
+        Args:
+            tracer: Tracer to record to, or None to stop tracing
+        """
+        self.tracer = tracer
+
+    def _span(self, name: str, **args: Any) -> AbstractContextManager[Any]:
+        """Get a trace span for a block, or a no-op when not tracing.
+
+        Args:
+            name: Span name
+            **args: Values shown with the span
+
+        Returns:
+            Context manager timing the block
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, category="writer", **args)
+
+    def _configure_rolling(
+        self, max_rows_per_file: int | None, max_bytes_per_file: int | None
+    ) -> None:
+        """Validate and store the limits for rolling to a new file.
+
+        Args:
+            max_rows_per_file: Maximum rows per output file
+            max_bytes_per_file: Approximate maximum bytes per output file
+
+        Raises:
+            ConfigurationError: If a limit is less than 1
+        """
+        if max_rows_per_file is not None and max_rows_per_file < 1:
+            raise ConfigurationError("max_rows_per_file must be at least 1")
+        if max_bytes_per_file is not None and max_bytes_per_file < 1:
+            raise ConfigurationError("max_bytes_per_file must be at least 1")
+        self.max_rows_per_file = max_rows_per_file
+        self.max_bytes_per_file = max_bytes_per_file
+
+    def _track_file(self, table_name: str, path: str) -> None:
+        """Remember that a file belongs to a table.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            path: Path of the table's output file
+        """
+        paths = self.table_paths.setdefault(table_name, [])
+        if path not in paths:
+            paths.append(path)
+
+    def _track_schema(self, table_name: str, schema: dict[str, Any]) -> None:
+        """Remember the column types of a table.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            schema: Column types keyed by column name
+        """
+        self.table_schemas[table_name] = schema
+
+    def share_schema(self, table_name: str, schema: dict[str, Any]) -> None:
+        """Use column types shared with other writers of the same table.
+
+        Writers of typed formats take the types of known columns from
+        ``schema`` instead of inferring them, include every known column in
+        their files and add the columns they see first to ``schema``. This
+        keeps the files of one table, such as partitions, on one schema.
+        Formats without column types ignore it.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            schema: Column types keyed by column name, updated in place
+        """
+        return
+
+    def get_table_schemas(self) -> dict[str, dict[str, Any]]:
+        """Get the column types of each table written, also after close.
+
+        Returns:
+            Column types keyed by column name, per table ("main" for the
+            main table)
+        """
+        return {name: dict(schema) for name, schema in self.table_schemas.items()}
+
+    def get_table_files(self) -> dict[str, list[Path]]:
+        """Get the output files written for each table.
+
+        Returns:
+            File paths keyed by table name ("main" for the main table)
+        """
+        return {
+            table_name: [Path(p) for p in paths]
+            for table_name, paths in self.table_paths.items()
+        }
+
+    def buffered_rows(self) -> int:
+        """Get the number of rows held in buffers and not yet written.
+
+        Returns:
+            Buffered row count (0 for writers without row buffers)
+        """
+        return 0
+
+    def _configure_open_files(self, max_open_files: int | None) -> None:
+        """Validate and store the limit on simultaneously open table files.
+
+        Args:
+            max_open_files: Maximum number of table files kept open
+
+        Raises:
+            ConfigurationError: If the limit is less than 1
+        """
+        if max_open_files is not None and max_open_files < 1:
+            raise ConfigurationError("max_open_files must be at least 1")
+        self.max_open_files = max_open_files
+
+    @property
+    def rolls_files(self) -> bool:
+        """Whether output files are rolled by row count or size."""
+        return self.max_rows_per_file is not None or self.max_bytes_per_file is not None
+
+    def _file_name(self, table_name: str, stem: str, extension: str) -> str:
+        """Get the file name for the current file of a table.
+
+        Args:
+            table_name: Name of the table
+            stem: Base file name without extension
+            extension: File extension including the dot
+
+        Returns:
+            ``stem + extension``, or a numbered name when rolling files or
+            once the table has moved on from its first file
+        """
+        if not self.rolls_files and table_name not in self.file_numbers:
+            self._unnumbered_files[table_name] = (stem, extension)
+            return f"{stem}{extension}"
+        number = self.file_numbers.setdefault(table_name, 1)
+        return _numbered_file_name(stem, number, extension)
+
+    def _file_chunks(
+        self, table_name: str, total: int, row_bytes: float | None = None
+    ) -> Iterator[tuple[int, int]]:
+        """Split rows into ranges that fit the current file of a table.
+
+        Each range is computed after the previous one has been written, so
+        writers must call _record_file_write() between ranges.
+
+        Args:
+            table_name: Name of the table
+            total: Number of rows to write
+            row_bytes: Average size of a row, to also keep ranges within
+                max_bytes_per_file
+
+        Yields:
+            (start, end) row ranges
+        """
+        start = 0
+        while start < total:
+            end = total
+            if self.max_rows_per_file is not None:
+                remaining = self.max_rows_per_file - self.rows_in_file.get(
+                    table_name, 0
+                )
+                end = min(total, start + max(remaining, 1))
+            if self.max_bytes_per_file is not None and row_bytes:
+                remaining_bytes = self.max_bytes_per_file - self.bytes_in_file.get(
+                    table_name, 0
+                )
+                end = min(end, start + max(int(remaining_bytes // row_bytes), 1))
+            yield start, end
+            start = end
+
+    def _record_file_write(
+        self, table_name: str, rows: int, size: int | None = None
+    ) -> bool:
+        """Account rows written to the current file of a table.
+
+        Args:
+            table_name: Name of the table
+            rows: Number of rows just written
+            size: Current size of the file in bytes, if known
+
+        Returns:
+            True when the file reached a limit and should be rolled
+        """
+        written = self.rows_in_file.get(table_name, 0) + rows
+        self.rows_in_file[table_name] = written
+        if size is not None:
+            self.bytes_in_file[table_name] = size
+        if self.max_rows_per_file is not None and written >= self.max_rows_per_file:
+            return True
+        return (
+            self.max_bytes_per_file is not None
+            and size is not None
+            and size >= self.max_bytes_per_file
+        )
+
+    def _advance_file(self, table_name: str, finished_path: str | None) -> None:
+        """Move a table on to its next numbered file.
+
+        A first file written under the plain table name is renamed to file
+        number 1, so all files of a table match one ``<stem>-*`` pattern.
+
+        Args:
+            table_name: Name of the table
+            finished_path: Path of the file that was just finalized
+
+        Raises:
+            OutputError: If the first file cannot be renamed
+        """
+        unnumbered = self._unnumbered_files.pop(table_name, None)
+        if finished_path is not None and unnumbered is not None:
+            stem, extension = unnumbered
+            numbered_path = os.path.join(
+                os.path.dirname(finished_path),
+                _numbered_file_name(stem, 1, extension),
+            )
+            try:
+                os.replace(finished_path, numbered_path)
+            except OSError as exc:
+                raise OutputError(
+                    f"Failed to rename {finished_path} to {numbered_path}: {exc}"
+                ) from exc
+            paths = self.table_paths.get(table_name, [])
+            if finished_path in paths:
+                paths[paths.index(finished_path)] = numbered_path
+            finished_path = numbered_path
+        if finished_path is not None:
+            self.finished_paths.append(finished_path)
+        self.file_numbers[table_name] = self.file_numbers.get(table_name, 1) + 1
+        self.rows_in_file[table_name] = 0
+        self.bytes_in_file[table_name] = 0
 
     @abstractmethod
     def write_main_records(self, records: list[dict[str, Any]]) -> None:
@@ -123,6 +389,85 @@ class StreamingWriter(ABC):
         """
         pass
 
+    def write_tables(
+        self,
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Write the main and child tables produced by one batch.
+
+        Args:
+            main_records: Main table records to write
+            child_tables: Child table records keyed by table name
+        """
+        with self._span("write_main_records", rows=len(main_records)):
+            self.write_main_records(main_records)
+        for table_name, records in child_tables.items():
+            with self._span("write_child_records", table=table_name, rows=len(records)):
+                self.write_child_records(table_name, records)
+
+    def flush(self) -> None:
+        """Write any buffered records to the output without closing it.
+
+        Writers that write every batch as soon as it arrives have nothing
+        to flush and keep this default.
+        """
+        return
+
+    def checkpoint_state(self) -> dict[str, Any]:
+        """Make all written rows durable and describe the output state.
+
+        Called at checkpoint boundaries, after every record consumed so far
+        has been handed to the writer. The returned state must be JSON
+        serializable and contain a ``files`` list of output files written
+        so far.
+
+        Returns:
+            Writer state to pass to restore_state() when resuming
+
+        Raises:
+            ConfigurationError: If the writer does not support checkpoints
+        """
+        raise ConfigurationError(f"{type(self).__name__} does not support checkpoints")
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Continue the output described by a checkpoint state.
+
+        Output written after the checkpoint is discarded or overwritten, so
+        a resumed run produces the same files as an uninterrupted one.
+
+        Args:
+            state: State returned by checkpoint_state()
+
+        Raises:
+            ConfigurationError: If the writer does not support checkpoints
+        """
+        raise ConfigurationError(f"{type(self).__name__} does not support checkpoints")
+
+    def _rolling_state(self) -> dict[str, Any]:
+        """Describe file numbering state for a checkpoint.
+
+        Returns:
+            File numbers, rows in the current files and finished files
+        """
+        return {
+            "file_numbers": dict(self.file_numbers),
+            "rows_in_file": dict(self.rows_in_file),
+            "finished_paths": list(self.finished_paths),
+            "table_paths": {k: list(v) for k, v in self.table_paths.items()},
+        }
+
+    def _restore_rolling_state(self, state: dict[str, Any]) -> None:
+        """Restore file numbering state from a checkpoint.
+
+        Args:
+            state: State returned by _rolling_state()
+        """
+        self.file_numbers = dict(state.get("file_numbers", {}))
+        self.rows_in_file = dict(state.get("rows_in_file", {}))
+        self.finished_paths = list(state.get("finished_paths", []))
+        self.table_paths = {k: list(v) for k, v in state.get("table_paths", {}).items()}
+
     @abstractmethod
     def close(self) -> list[Path]:
         """Finalize output, flush buffered data, and clean up resources.
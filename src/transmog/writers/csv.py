@@ -6,6 +6,7 @@ import logging
 import os
 import pathlib
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, BinaryIO, TextIO, cast
 
@@ -247,6 +248,9 @@ class CsvStreamingWriter(StreamingWriter):
         delimiter: str = ",",
         quotechar: str = '"',
         schema_drift: str = "strict",
+        max_rows_per_file: int | None = None,
+        max_bytes_per_file: int | None = None,
+        max_open_files: int | None = None,
         **options: Any,
     ):
         """Initialize the CSV streaming writer.
@@ -260,6 +264,12 @@ class CsvStreamingWriter(StreamingWriter):
             schema_drift: How to handle schema drift after header emission.
                 "strict" raises OutputError (default), "drop" silently
                 removes unexpected fields.
+            max_rows_per_file: Roll to a new numbered file after this many rows
+            max_bytes_per_file: Roll to a new numbered file once a file reaches
+                approximately this size
+            max_open_files: Maximum number of table files kept open; the
+                least recently written one is closed and reopened for
+                appending when needed again
             **options: Additional CSV writer options
         """
         valid_drift_modes = ("strict", "drop")
@@ -273,7 +283,7 @@ class CsvStreamingWriter(StreamingWriter):
         self.delimiter = delimiter
         self.quotechar = quotechar
         self.schema_drift = schema_drift
-        self.file_objects: dict[str, TextIO] = {}
+        self.file_objects: OrderedDict[str, TextIO] = OrderedDict()
         self.writers: dict[str, csv.DictWriter] = {}
         self.fieldnames: dict[str, list[str]] = {}
         self.fieldname_sets: dict[str, set[str]] = {}
@@ -287,6 +297,15 @@ class CsvStreamingWriter(StreamingWriter):
             )
 
         super().__init__(destination, entity_name, **options)
+        self._configure_rolling(max_rows_per_file, max_bytes_per_file)
+        self._configure_open_files(max_open_files)
+
+        if self.rolls_files and (
+            not isinstance(destination, str) or destination.endswith(".csv")
+        ):
+            raise ConfigurationError(
+                "Rolling output files requires a directory path destination"
+            )
 
         if destination is None:
             self.file_objects["main"] = cast(TextIO, sys.stdout)
@@ -299,6 +318,7 @@ class CsvStreamingWriter(StreamingWriter):
 
                 self.file_objects["main"] = file_obj
                 self.file_paths["main"] = destination
+                self._track_file("main", destination)
                 self.should_close_files = True
             else:
                 self.base_dir = destination
@@ -330,13 +350,28 @@ class CsvStreamingWriter(StreamingWriter):
             return self.file_objects[table_name]
 
         if self.base_dir:
+            if self.max_open_files is not None:
+                while len(self.file_objects) >= self.max_open_files:
+                    self._suspend_table(next(iter(self.file_objects)))
+
+            if table_name in self.file_paths:
+                # Resume a suspended table where it left off
+                file_obj = open(
+                    self.file_paths[table_name], "a", encoding="utf-8", newline=""
+                )
+                self.file_objects[table_name] = file_obj
+                return file_obj
+
             if table_name == "main":
                 filename = self.entity_name
             else:
                 filename = _sanitize_filename(table_name)
 
-            file_path = os.path.join(self.base_dir, f"{filename}.csv")
+            file_path = os.path.join(
+                self.base_dir, self._file_name(table_name, filename, ".csv")
+            )
             self.file_paths[table_name] = file_path
+            self._track_file(table_name, file_path)
             file_obj = open(file_path, "w", encoding="utf-8", newline="")
 
             self.file_objects[table_name] = file_obj
@@ -344,6 +379,16 @@ class CsvStreamingWriter(StreamingWriter):
         else:
             raise OutputError(f"Cannot create file for table {table_name}")
 
+    def _suspend_table(self, table_name: str) -> None:
+        """Close the file of a table until it receives records again.
+
+        Args:
+            table_name: Name of the table
+        """
+        logger.debug("csv file suspended, table=%s", table_name)
+        self.file_objects.pop(table_name).close()
+        self.writers.pop(table_name, None)
+
     def _ensure_writer(
         self, table_name: str, records: list[dict[str, Any]]
     ) -> csv.DictWriter:
@@ -357,9 +402,13 @@ class CsvStreamingWriter(StreamingWriter):
             CSV writer for the table
         """
         if table_name in self.writers:
+            self.file_objects.move_to_end(table_name)
             return self.writers[table_name]
 
-        fieldnames = _collect_field_names(records)
+        resuming = table_name not in self.file_objects and table_name in self.file_paths
+
+        # A rolled table keeps the columns of its first file
+        fieldnames = self.fieldnames.get(table_name) or _collect_field_names(records)
         file_obj = self._get_file_for_table(table_name)
 
         writer = csv.DictWriter(
@@ -370,14 +419,16 @@ class CsvStreamingWriter(StreamingWriter):
         )
 
         self.writers[table_name] = writer
-        self.fieldnames[table_name] = fieldnames
-        self.fieldname_sets[table_name] = set(fieldnames)
+        if table_name not in self.fieldnames:
+            self.fieldnames[table_name] = fieldnames
+            self.fieldname_sets[table_name] = set(fieldnames)
+            self._track_schema(table_name, dict.fromkeys(fieldnames, "string"))
 
-        logger.debug(
-            "csv schema created, table=%s, fields=%d", table_name, len(fieldnames)
-        )
+            logger.debug(
+                "csv schema created, table=%s, fields=%d", table_name, len(fieldnames)
+            )
 
-        if self.include_header and fieldnames:
+        if self.include_header and fieldnames and not resuming:
             writer.writeheader()
 
         return writer
@@ -393,26 +444,57 @@ class CsvStreamingWriter(StreamingWriter):
             return
 
         sanitized_records = [_sanitize_record(record) for record in records]
-        writer = self._ensure_writer(table_name, sanitized_records)
-        allowed_fields = self.fieldname_sets.get(table_name, set())
-
-        for record in sanitized_records:
-            unexpected_fields = set(record.keys()) - allowed_fields
-            if unexpected_fields:
-                logger.warning(
-                    "csv schema drift detected, table=%s, unexpected_fields=%s",
-                    table_name,
-                    sorted(unexpected_fields),
-                )
-                if self.schema_drift == "strict":
-                    raise OutputError(
-                        "CSV schema changed after header emission; "
-                        f"unexpected fields {sorted(unexpected_fields)} detected "
-                        f"in table '{table_name}'."
+
+        if self.rolls_files:
+            for start, end in self._file_chunks(table_name, len(sanitized_records)):
+                self._write_rows(table_name, sanitized_records[start:end])
+                file_obj = self.file_objects[table_name]
+                if self._record_file_write(table_name, end - start, file_obj.tell()):
+                    self._roll_file(table_name)
+        else:
+            self._write_rows(table_name, sanitized_records)
+
+    def _write_rows(
+        self, table_name: str, sanitized_records: list[dict[str, Any]]
+    ) -> None:
+        """Write sanitized records to the current file of a table.
+
+        Args:
+            table_name: Name of the table
+            sanitized_records: Records already sanitized for CSV output
+        """
+        with self._span("write_rows", table=table_name, rows=len(sanitized_records)):
+            writer = self._ensure_writer(table_name, sanitized_records)
+            allowed_fields = self.fieldname_sets.get(table_name, set())
+
+            for record in sanitized_records:
+                unexpected_fields = set(record.keys()) - allowed_fields
+                if unexpected_fields:
+                    logger.warning(
+                        "csv schema drift detected, table=%s, unexpected_fields=%s",
+                        table_name,
+                        sorted(unexpected_fields),
                     )
-                # "drop" mode: filter to known fields only
-                record = {k: v for k, v in record.items() if k in allowed_fields}
-            writer.writerow(record)
+                    if self.schema_drift == "strict":
+                        raise OutputError(
+                            "CSV schema changed after header emission; "
+                            f"unexpected fields {sorted(unexpected_fields)} detected "
+                            f"in table '{table_name}'."
+                        )
+                    # "drop" mode: filter to known fields only
+                    record = {k: v for k, v in record.items() if k in allowed_fields}
+                writer.writerow(record)
+
+    def _roll_file(self, table_name: str) -> None:
+        """Close the current file of a table and start a numbered new one.
+
+        Args:
+            table_name: Name of the table
+        """
+        file_obj = self.file_objects.pop(table_name)
+        file_obj.close()
+        self.writers.pop(table_name, None)
+        self._advance_file(table_name, self.file_paths.pop(table_name, None))
 
     def write_main_records(self, records: list[dict[str, Any]]) -> None:
         """Write a batch of main records.
@@ -433,6 +515,63 @@ class CsvStreamingWriter(StreamingWriter):
         """
         self._write_records(table_name, records)
 
+    def flush(self) -> None:
+        """Flush all open file objects."""
+        for file_obj in self.file_objects.values():
+            if hasattr(file_obj, "flush"):
+                file_obj.flush()
+
+    def checkpoint_state(self) -> dict[str, Any]:
+        """Sync open files to disk and record their sizes.
+
+        Returns:
+            Writer state for restore_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if not self.base_dir:
+            raise ConfigurationError("CSV checkpoints require a directory destination")
+
+        sizes: dict[str, int] = {}
+        for table_name, path in self.file_paths.items():
+            file_obj = self.file_objects.get(table_name)
+            if file_obj is not None:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+            sizes[table_name] = os.path.getsize(path)
+
+        return {
+            **self._rolling_state(),
+            "file_paths": dict(self.file_paths),
+            "sizes": sizes,
+            "fieldnames": {k: list(v) for k, v in self.fieldnames.items()},
+            "files": [*self.finished_paths, *self.file_paths.values()],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Truncate files to their checkpointed size and append from there.
+
+        Args:
+            state: State returned by checkpoint_state()
+
+        Raises:
+            ConfigurationError: If not writing to a directory
+        """
+        if not self.base_dir:
+            raise ConfigurationError("CSV checkpoints require a directory destination")
+
+        self._restore_rolling_state(state)
+        for table_name, path in state["file_paths"].items():
+            os.truncate(path, state["sizes"][table_name])
+            # Reopened for appending, without a header, on the next write
+            self.file_paths[table_name] = path
+            self._track_file(table_name, path)
+        for table_name, fieldnames in state["fieldnames"].items():
+            self.fieldnames[table_name] = list(fieldnames)
+            self.fieldname_sets[table_name] = set(fieldnames)
+            self._track_schema(table_name, dict.fromkeys(fieldnames, "string"))
+
     def close(self) -> list[Path]:
         """Finalize output, flush buffered data, and clean up resources.
 
@@ -442,11 +581,10 @@ class CsvStreamingWriter(StreamingWriter):
         if getattr(self, "_closed", False):
             return []
 
-        paths = [Path(p) for p in self.file_paths.values()]
+        paths = [Path(p) for p in self.finished_paths]
+        paths.extend(Path(p) for p in self.file_paths.values())
 
-        for file_obj in self.file_objects.values():
-            if hasattr(file_obj, "flush"):
-                file_obj.flush()
+        self.flush()
 
         if self.should_close_files:
             for file_obj in self.file_objects.values():
@@ -0,0 +1,295 @@
+"""Hive-style partitioned streaming writer."""
+
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from transmog.exceptions import ConfigurationError, OutputError
+from transmog.tracing import Tracer
+from transmog.writers.base import StreamingWriter, _sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _format_partition_value(value: Any) -> str:
+    """Format a partition value as a Hive directory name component.
+
+    Args:
+        value: Partition column value
+
+    Returns:
+        URL-escaped string, or the Hive default partition for null values
+    """
+    if value is None or value == "":
+        return HIVE_DEFAULT_PARTITION
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    else:
+        text = str(value)
+    return quote(text, safe="")
+
+
+class PartitionedStreamingWriter(StreamingWriter):
+    """Streaming writer producing Hive-style partitioned output.
+
+    Each table is written to ``<table>/<col>=<value>/.../part-<n>.<ext>``
+    below the destination directory, using one format writer per table and
+    partition. At most ``max_open_files`` of those writers are kept open;
+    the least recently used one is finalized when another is needed, and
+    later rows for its partition go to the next part file.
+
+    Partition columns are taken from the main table and omitted from the
+    written main table files, since their values are encoded in the path.
+    All part files of a table share one schema: column types are inferred
+    once per table, and later part files include every column seen so far.
+    """
+
+    def __init__(
+        self,
+        destination: str | None = None,
+        entity_name: str = "entity",
+        format_name: str = "parquet",
+        partition_by: list[str] | None = None,
+        max_open_files: int = 64,
+        part_start: int = 0,
+        part_step: int = 1,
+        **options: Any,
+    ) -> None:
+        """Initialize the partitioned streaming writer.
+
+        Args:
+            destination: Output directory
+            entity_name: Name of the entity (directory of the main table)
+            format_name: Format of the part files (csv, parquet, orc, avro)
+            partition_by: Main table columns to partition by
+            max_open_files: Maximum number of part files kept open at once
+            part_start: Number of the first part file in each partition
+            part_step: Increment between part file numbers
+            **options: Options for the per-partition format writers
+        """
+        if not isinstance(destination, str):
+            raise ConfigurationError(
+                "Partitioned output requires a directory path destination"
+            )
+        super().__init__(destination, entity_name, **options)
+        self._configure_open_files(max_open_files)
+
+        self.base_dir = destination
+        self.format_name = format_name
+        self.partition_by = list(partition_by or [])
+        self.part_start = part_start
+        self.part_step = part_step
+        # Keyed by table name and formatted partition values, so values that
+        # share a directory (1 and "1", True and "true") share a writer
+        self.writers: OrderedDict[tuple[str, tuple[str, ...]], StreamingWriter] = (
+            OrderedDict()
+        )
+        self.part_numbers: dict[tuple[str, tuple[str, ...]], int] = {}
+        # Column types per table, shared by all of its part files
+        self.shared_schemas: dict[str, dict[str, Any]] = {}
+        self.closed_paths: list[Path] = []
+
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    def _partition_dir(self, table_name: str, values: tuple[str, ...]) -> str:
+        """Get the directory for a table partition.
+
+        Args:
+            table_name: Name of the table ("main" for the main table)
+            values: Partition values formatted by _format_partition_value
+
+        Returns:
+            Directory path
+        """
+        if table_name == "main":
+            table_dir = _sanitize_filename(self.entity_name) or "main"
+        else:
+            table_dir = _sanitize_filename(table_name) or "table"
+
+        parts = [self.base_dir, table_dir]
+        parts.extend(
+            f"{quote(column, safe='')}={value}"
+            for column, value in zip(self.partition_by, values, strict=True)
+        )
+        return os.path.join(*parts)
+
+    def _get_writer(self, table_name: str, values: tuple[Any, ...]) -> StreamingWriter:
+        """Get or open the writer for a table partition.
+
+        Args:
+            table_name: Name of the table
+            values: Partition values
+
+        Returns:
+            Streaming writer for the partition's current part file
+        """
+        # Imported here to avoid a circular import with the writer registry
+        from transmog.writers import create_streaming_writer
+
+        formatted = tuple(_format_partition_value(value) for value in values)
+        key = (table_name, formatted)
+        writer = self.writers.get(key)
+        if writer is not None:
+            self.writers.move_to_end(key)
+            return writer
+
+        while (
+            self.max_open_files is not None and len(self.writers) >= self.max_open_files
+        ):
+            self._evict()
+
+        number = self.part_numbers.get(key, self.part_start)
+        self.part_numbers[key] = number + self.part_step
+
+        writer = create_streaming_writer(
+            self.format_name,
+            destination=self._partition_dir(table_name, formatted),
+            entity_name=f"part-{number}",
+            **self.options,
+        )
+        writer.share_schema("main", self.shared_schemas.setdefault(table_name, {}))
+        writer.attach_tracer(self.tracer)
+        self.writers[key] = writer
+        return writer
+
+    def attach_tracer(self, tracer: Tracer | None) -> None:
+        """Record the spans of every partition writer in a trace.
+
+        Args:
+            tracer: Tracer to record to, or None to stop tracing
+        """
+        super().attach_tracer(tracer)
+        for writer in self.writers.values():
+            writer.attach_tracer(tracer)
+
+    def _evict(self) -> None:
+        """Finalize the least recently used partition writer."""
+        (table_name, values), writer = self.writers.popitem(last=False)
+        logger.debug(
+            "partition writer evicted, table=%s, partition=%s", table_name, values
+        )
+        with self._span("close_partition", table=table_name):
+            paths = writer.close()
+        schema = self.table_schemas.setdefault(table_name, {})
+        for columns in writer.get_table_schemas().values():
+            for column, column_type in columns.items():
+                schema.setdefault(column, column_type)
+        for path in paths:
+            self._track_file(table_name, str(path))
+        self.closed_paths.extend(paths)
+
+    def write_partition(
+        self,
+        values: tuple[Any, ...],
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Write the tables produced by root records of one partition.
+
+        Args:
+            values: Partition values, in partition_by order
+            main_records: Main table records of the partition
+            child_tables: Child table records extracted from those roots
+        """
+        if main_records:
+            if self.partition_by:
+                columns = set(self.partition_by)
+                main_records = [
+                    {k: v for k, v in record.items() if k not in columns}
+                    for record in main_records
+                ]
+            writer = self._get_writer("main", values)
+            with self._span("write_main_records", rows=len(main_records)):
+                writer.write_main_records(main_records)
+
+        for table_name, records in child_tables.items():
+            if records:
+                writer = self._get_writer(table_name, values)
+                with self._span(
+                    "write_child_records", table=table_name, rows=len(records)
+                ):
+                    writer.write_main_records(records)
+
+    def write_main_records(self, records: list[dict[str, Any]]) -> None:
+        """Write a batch of main records, partitioned by their own values.
+
+        Args:
+            records: Main table records to write
+        """
+        # Grouped by directory, as True and 1 are equal dict keys
+        groups: dict[tuple[str, ...], tuple[tuple[Any, ...], list[dict[str, Any]]]] = {}
+        for record in records:
+            values = tuple(record.get(column) for column in self.partition_by)
+            key = tuple(_format_partition_value(value) for value in values)
+            groups.setdefault(key, (values, []))[1].append(record)
+        for values, group in groups.values():
+            self.write_partition(values, group, {})
+
+    def write_tables(
+        self,
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Write a batch's tables when there are no partition columns.
+
+        Args:
+            main_records: Main table records to write
+            child_tables: Child table records keyed by table name
+        """
+        if self.partition_by:
+            super().write_tables(main_records, child_tables)
+        else:
+            self.write_partition((), main_records, child_tables)
+
+    def write_child_records(
+        self, table_name: str, records: list[dict[str, Any]]
+    ) -> None:
+        """Reject child records that arrive without their root's partition.
+
+        Args:
+            table_name: Name of the child table
+            records: Child records to write
+
+        Raises:
+            OutputError: Always, child rows must be routed with write_partition()
+        """
+        raise OutputError(
+            f"Cannot route child table '{table_name}' without partition values; "
+            "use write_partition() with the root records' partition"
+        )
+
+    def buffered_rows(self) -> int:
+        """Get the number of rows buffered by open partition writers.
+
+        Returns:
+            Buffered row count across all partitions
+        """
+        return sum(writer.buffered_rows() for writer in self.writers.values())
+
+    def flush(self) -> None:
+        """Flush all open partition writers."""
+        for writer in self.writers.values():
+            writer.flush()
+
+    def close(self) -> list[Path]:
+        """Finalize all partition writers.
+
+        Returns:
+            List of all part files written.
+        """
+        if getattr(self, "_closed", False):
+            return []
+
+        while self.writers:
+            self._evict()
+
+        self._closed = True
+        return list(self.closed_paths)
+
+
+__all__ = ["PartitionedStreamingWriter", "HIVE_DEFAULT_PARTITION"]
@@ -0,0 +1,261 @@
+"""Streaming writer fanning each batch out to several format writers."""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, cast
+
+from transmog.exceptions import ConfigurationError, OutputError
+from transmog.tracing import Tracer
+from transmog.writers.base import StreamingWriter
+from transmog.writers.partitioned import PartitionedStreamingWriter
+
+logger = logging.getLogger(__name__)
+
+
+class TeeStreamingWriter(StreamingWriter):
+    """Streaming writer that writes every batch to several writers.
+
+    Batches are flattened once and handed to each writer on its own worker
+    thread, so encoders that release the GIL (PyArrow's Parquet and ORC
+    writers) run concurrently. Each call waits for all writers before
+    returning, so no writer is ever used from two threads at once and every
+    output receives batches in the same order.
+    """
+
+    def __init__(self, writers: dict[str, StreamingWriter]) -> None:
+        """Initialize the tee writer.
+
+        Args:
+            writers: Writers to fan out to, keyed by a label used in errors
+        """
+        if not writers:
+            raise ConfigurationError("At least one output format is required")
+
+        super().__init__()
+        self.writers = dict(writers)
+        # Seconds spent per writer, accumulated when set to a dict
+        self.timings: dict[str, float] | None = None
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(
+                max_workers=len(self.writers), thread_name_prefix="transmog-tee"
+            )
+            if len(self.writers) > 1
+            else None
+        )
+
+    def _fan_out(self, method: str, *args: Any) -> None:
+        """Call a method on every writer, concurrently where possible.
+
+        Args:
+            method: Name of the StreamingWriter method to call
+            *args: Arguments for the method
+
+        Raises:
+            Exception: The first error raised by a writer, after all writers
+                have finished the call
+        """
+        call = self._call if self.timings is None else self._timed_call
+        if self._executor is None:
+            for label, writer in self.writers.items():
+                call(label, writer, method, args)
+            return
+
+        futures: dict[str, Future] = {
+            label: self._executor.submit(call, label, writer, method, args)
+            for label, writer in self.writers.items()
+        }
+        first_error: BaseException | None = None
+        for label, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.error("tee writer failed, output=%s, error=%s", label, error)
+                if first_error is None:
+                    first_error = error
+        if first_error is not None:
+            raise first_error
+
+    @staticmethod
+    def _call(
+        _label: str, writer: StreamingWriter, method: str, args: tuple[Any, ...]
+    ) -> None:
+        """Call a writer method."""
+        getattr(writer, method)(*args)
+
+    def _timed_call(
+        self, label: str, writer: StreamingWriter, method: str, args: tuple[Any, ...]
+    ) -> None:
+        """Call a writer method and add its duration to the timings."""
+        started = time.perf_counter()
+        try:
+            getattr(writer, method)(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            timings = cast(dict[str, float], self.timings)
+            # Each label is only updated by its own task, so no lock is needed
+            timings[label] = timings.get(label, 0.0) + elapsed
+
+    def attach_tracer(self, tracer: Tracer | None) -> None:
+        """Record the spans of every writer in a trace.
+
+        Args:
+            tracer: Tracer to record to, or None to stop tracing
+        """
+        super().attach_tracer(tracer)
+        for writer in self.writers.values():
+            writer.attach_tracer(tracer)
+
+    def get_table_files(self) -> dict[str, list[Path]]:
+        """Get the output files of every writer for each table.
+
+        Returns:
+            File paths keyed by table name, in writer order
+        """
+        files: dict[str, list[Path]] = {}
+        for writer in self.writers.values():
+            for table_name, paths in writer.get_table_files().items():
+                files.setdefault(table_name, []).extend(paths)
+        return files
+
+    def get_table_schemas(self) -> dict[str, dict[str, Any]]:
+        """Get the column types of each table from the first format writing it.
+
+        Returns:
+            Column types keyed by column name, per table
+        """
+        schemas: dict[str, dict[str, Any]] = {}
+        for writer in self.writers.values():
+            for table_name, schema in writer.get_table_schemas().items():
+                schemas.setdefault(table_name, schema)
+        return schemas
+
+    def buffered_rows(self) -> int:
+        """Get the number of rows buffered across all writers.
+
+        Returns:
+            Buffered row count
+        """
+        return sum(writer.buffered_rows() for writer in self.writers.values())
+
+    def write_main_records(self, records: list[dict[str, Any]]) -> None:
+        """Write a batch of main records to every writer.
+
+        Args:
+            records: Main table records to write
+        """
+        self._fan_out("write_main_records", records)
+
+    def write_child_records(
+        self, table_name: str, records: list[dict[str, Any]]
+    ) -> None:
+        """Write a batch of child records to every writer.
+
+        Args:
+            table_name: Name of the child table
+            records: Child records to write
+        """
+        self._fan_out("write_child_records", table_name, records)
+
+    def write_tables(
+        self,
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Write all tables of a batch to every writer in one task each.
+
+        Args:
+            main_records: Main table records to write
+            child_tables: Child table records keyed by table name
+        """
+        self._fan_out("write_tables", main_records, child_tables)
+
+    def write_partition(
+        self,
+        values: tuple[Any, ...],
+        main_records: list[dict[str, Any]],
+        child_tables: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Write one partition's tables to every partitioned writer.
+
+        Args:
+            values: Partition values, in partition_by order
+            main_records: Main table records of the partition
+            child_tables: Child table records extracted from those roots
+
+        Raises:
+            OutputError: If a writer is not a partitioned writer
+        """
+        for label, writer in self.writers.items():
+            if not isinstance(writer, PartitionedStreamingWriter):
+                raise OutputError(f"Output '{label}' is not a partitioned writer")
+        self._fan_out("write_partition", values, main_records, child_tables)
+
+    def flush(self) -> None:
+        """Flush every writer."""
+        self._fan_out("flush")
+
+    def checkpoint_state(self) -> dict[str, Any]:
+        """Checkpoint every writer.
+
+        Returns:
+            Writer states keyed by output label, and all files written
+        """
+        states = {
+            label: writer.checkpoint_state() for label, writer in self.writers.items()
+        }
+        return {
+            "writers": states,
+            "files": [path for state in states.values() for path in state["files"]],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restore every writer from a checkpoint.
+
+        Args:
+            state: State returned by checkpoint_state()
+
+        Raises:
+            ConfigurationError: If the outputs differ from the checkpoint
+        """
+        states = state["writers"]
+        if set(states) != set(self.writers):
+            raise ConfigurationError(
+                "Checkpoint outputs do not match: "
+                f"{sorted(states)} != {sorted(self.writers)}"
+            )
+        for label, writer in self.writers.items():
+            writer.restore_state(states[label])
+
+    def close(self) -> list[Path]:
+        """Finalize every writer.
+
+        All writers are closed even if one of them fails.
+
+        Returns:
+            Files written by all writers, in writer order.
+        """
+        if getattr(self, "_closed", False):
+            return []
+        self._closed = True
+
+        paths: list[Path] = []
+        first_error: BaseException | None = None
+        try:
+            for label, writer in self.writers.items():
+                try:
+                    paths.extend(writer.close())
+                except Exception as exc:
+                    logger.error("tee writer failed, output=%s, error=%s", label, exc)
+                    if first_error is None:
+                        first_error = exc
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+        if first_error is not None:
+            raise first_error
+        return paths
+
+
+__all__ = ["TeeStreamingWriter"]
@@ -273,6 +273,52 @@ class TestFlattenFile:
         with pytest.raises(Exception):
             tm.flatten("nonexistent.csv")
 
+    def test_flatten_directory_with_source_field(self, tmp_path):
+        """Test flattening every file of a directory into one result."""
+        for index in range(3):
+            records = [{"id": index, "tags": [{"t": index}]}]
+            (tmp_path / f"part-{index}.json").write_text(json.dumps(records))
+
+        result = tm.flatten(tmp_path, name="parts", source_field="_source_file")
+
+        assert [r["id"] for r in result.main] == [0, 1, 2]
+        assert result.main[2]["_source_file"] == str(tmp_path / "part-2.json")
+        assert len(result.tables["parts_tags"]) == 3
+
+    def test_flatten_stream_record_path(self, tmp_path):
+        """Test streaming records nested inside a wrapper object."""
+        path = tmp_path / "export.json"
+        document = {"meta": {"run": 7}, "data": [{"id": 1}, {"id": 2}]}
+        path.write_text(json.dumps(document))
+
+        files = tm.flatten_stream(
+            path,
+            tmp_path / "out",
+            name="export",
+            output_format="csv",
+            record_path="data.item",
+            record_meta=["meta"],
+        )
+
+        lines = Path(files[0]).read_text().splitlines()
+        assert len(lines) == 3
+        assert "meta_run" in lines[0]
+
+    def test_flatten_stream_path_list(self, tmp_path):
+        """Test streaming a list of files into one output set."""
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"part-{index}.jsonl"
+            path.write_text(json.dumps({"id": index}) + "\n")
+            paths.append(path)
+
+        files = tm.flatten_stream(
+            paths, tmp_path / "out", name="parts", output_format="csv"
+        )
+
+        assert [Path(f).name for f in files] == ["parts.csv"]
+        assert len(Path(files[0]).read_text().splitlines()) == 4
+
 
 class TestFlattenStream:
     """Test flatten_stream() function."""
@@ -225,6 +225,37 @@ class TestColumnBufferReuse:
             assert writer.buffers["main"] is buffer_ref
 
 
+class TestStreamingWriterFlush:
+    """Test explicit flush() of buffered records."""
+
+    def test_flush_writes_row_group(self, tmp_path):
+        """Test each flush() ends a row group even below row_group_size."""
+        import pyarrow.parquet as pq
+
+        from transmog.writers.parquet import ParquetStreamingWriter
+
+        with ParquetStreamingWriter(
+            destination=str(tmp_path), entity_name="test", row_group_size=1000
+        ) as writer:
+            writer.write_main_records([{"id": 1}])
+            writer.flush()
+            assert writer.buffers["main"] == []
+            writer.write_main_records([{"id": 2}])
+            writer.flush()
+
+        metadata = pq.ParquetFile(tmp_path / "test.parquet").metadata
+        assert metadata.num_row_groups == 2
+
+    def test_flush_without_buffered_records_is_noop(self, tmp_path):
+        """Test flush() before any write does not create files."""
+        from transmog.writers.parquet import ParquetStreamingWriter
+
+        writer = ParquetStreamingWriter(destination=str(tmp_path), entity_name="test")
+        writer.flush()
+
+        assert writer.close() == []
+
+
 class TestPyArrowWriterExceptionHandling:
     """Test narrowed exception handling in PyArrowWriter.write()."""
 
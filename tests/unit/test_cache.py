@@ -0,0 +1,168 @@
+"""Tests for the parsed-input cache."""
+
+import json
+import os
+
+import pytest
+
+import transmog as tm
+from transmog.cache import CACHE_SUFFIX, ParseCache
+from transmog.exceptions import ConfigurationError
+from transmog.iterators import get_data_iterator
+
+JSON5_DOCUMENT = """
+// exported settings
+[
+  {id: 1, name: 'alpha', tags: ['a', 'b'],},
+  {id: 2, name: 'beta', ratio: 0.5},
+]
+"""
+
+
+def _entries(directory):
+    return sorted(p for p in os.listdir(directory) if p.endswith(CACHE_SUFFIX))
+
+
+def _counting_parser(calls):
+    def parse(content):
+        calls.append(content)
+        return json.loads(content)
+
+    return parse
+
+
+class TestParseCache:
+    """Test cache hits, invalidation and eviction."""
+
+    def test_second_load_skips_parser(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"id": 1}')
+        cache = ParseCache(tmp_path / "cache")
+        calls = []
+
+        first = cache.load(str(path), "json", _counting_parser(calls))
+        second = cache.load(str(path), "json", _counting_parser(calls))
+
+        assert first == second == {"id": 1}
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"id": 1}')
+        cache = ParseCache(tmp_path / "cache")
+        cache.load(str(path), "json", json.loads)
+
+        path.write_text('{"id": 22}')
+
+        assert cache.load(str(path), "json", json.loads) == {"id": 22}
+        assert cache.misses == 2
+
+    def test_content_digest_checked(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"id": 1}')
+        stat = path.stat()
+        cache = ParseCache(tmp_path / "cache")
+        cache.load(str(path), "json", json.loads)
+
+        # Same size and modification time, different content
+        path.write_text('{"id": 2}')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.load(str(path), "json", json.loads) == {"id": 2}
+        assert cache.hits == 0
+
+    def test_parser_is_part_of_key(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"id": 1}')
+        cache = ParseCache(tmp_path / "cache")
+        cache.load(str(path), "json", json.loads)
+        cache.load(str(path), "other", json.loads)
+
+        assert len(_entries(tmp_path / "cache")) == 2
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = ParseCache(cache_dir, max_size=150)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"data{i}.json"
+            path.write_text(json.dumps({"value": "x" * 20, "i": i}))
+            paths.append(str(path))
+
+        cache.load(paths[0], "json", json.loads)
+        cache.load(paths[1], "json", json.loads)
+        # The second entry was used longer ago than the first
+        second = cache._entry_path(paths[1], "json", os.stat(paths[1]))
+        os.utime(second, (0, 0))
+        cache.load(paths[2], "json", json.loads)
+
+        assert not os.path.exists(second)
+        assert len(_entries(cache_dir)) == 2
+        cache.load(paths[0], "json", json.loads)
+        assert cache.hits == 1
+
+    def test_non_round_trip_payload_not_stored(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("[NaN]")
+        cache = ParseCache(tmp_path / "cache")
+
+        value = cache.load(str(path), "json", json.loads)
+
+        assert value[0] != value[0]
+        assert not (tmp_path / "cache").exists()
+
+    def test_clear(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("{}")
+        cache = ParseCache(tmp_path / "cache")
+        cache.load(str(path), "json", json.loads)
+
+        cache.clear()
+
+        assert _entries(tmp_path / "cache") == []
+
+    def test_invalid_max_size(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            ParseCache(tmp_path, max_size=0)
+
+
+class TestCachedInput:
+    """Test the cache with JSON5 and HJSON input."""
+
+    def test_json5(self, tmp_path):
+        pytest.importorskip("json5")
+        path = tmp_path / "settings.json5"
+        path.write_text(JSON5_DOCUMENT)
+        cache = ParseCache(tmp_path / "cache")
+
+        first = list(get_data_iterator(str(path), parse_cache=cache))
+        second = list(get_data_iterator(str(path), parse_cache=cache))
+
+        assert first == second
+        assert first[1] == {"id": 2, "name": "beta", "ratio": 0.5}
+        assert cache.hits == 1
+
+    def test_hjson(self, tmp_path):
+        pytest.importorskip("hjson")
+        path = tmp_path / "settings.hjson"
+        path.write_text("{\n  name: alpha\n  size: 3\n}\n")
+        cache = ParseCache(tmp_path / "cache")
+
+        list(get_data_iterator(str(path), parse_cache=cache))
+        records = list(get_data_iterator(str(path), parse_cache=cache))
+
+        assert records == [{"name": "alpha", "size": 3}]
+        assert cache.hits == 1
+
+    def test_flatten_with_cache_directory(self, tmp_path):
+        pytest.importorskip("json5")
+        path = tmp_path / "settings.json5"
+        path.write_text(JSON5_DOCUMENT)
+        cache_dir = tmp_path / "cache"
+
+        first = tm.flatten(str(path), name="s", parse_cache=cache_dir)
+        second = tm.flatten(str(path), name="s", parse_cache=str(cache_dir))
+
+        assert len(_entries(cache_dir)) == 1
+        assert [r["name"] for r in second.main] == [r["name"] for r in first.main]
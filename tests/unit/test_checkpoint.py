@@ -0,0 +1,273 @@
+"""Tests for checkpointing and resuming stream processing."""
+
+import json
+
+import pytest
+
+import transmog as tm
+from transmog.checkpoint import load_checkpoint, resumable_input, save_checkpoint
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.streaming import StreamSession
+
+
+class _CrashError(Exception):
+    pass
+
+
+def _config():
+    return TransmogConfig(batch_size=3, id_generation="hash")
+
+
+def _write_jsonl(path, count):
+    lines = [
+        json.dumps({"id": i, "name": f"n{i}", "tags": [{"t": i}, {"t": -i}]})
+        for i in range(count)
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _crash_after(records: int):
+    def callback(processed, _total):
+        if processed >= records:
+            raise _CrashError
+
+    return callback
+
+
+def _snapshot(directory, output_format):
+    snapshot = {}
+    for path in sorted(directory.glob(f"*.{output_format}")):
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(path)
+            snapshot[path.name] = table.drop_columns(["_timestamp"]).to_pylist()
+        else:
+            snapshot[path.name] = path.read_bytes()
+    return snapshot
+
+
+class TestResume:
+    """Test that a resumed run matches an uninterrupted run."""
+
+    @pytest.mark.parametrize("output_format", ["csv", "parquet", "avro"])
+    def test_resume_matches_uninterrupted_run(self, tmp_path, output_format):
+        source = _write_jsonl(tmp_path / "input.jsonl", 40)
+        options = {"output_format": output_format, "checkpoint_interval": 2}
+
+        baseline = tm.flatten_stream(
+            source,
+            tmp_path / "baseline",
+            config=_config(),
+            checkpoint_path=tmp_path / "baseline.ckpt",
+            **options,
+        )
+
+        resumed_dir = tmp_path / "resumed"
+        checkpoint = tmp_path / "resumed.ckpt"
+        with pytest.raises(_CrashError):
+            tm.flatten_stream(
+                source,
+                resumed_dir,
+                config=_config(),
+                checkpoint_path=checkpoint,
+                progress_callback=_crash_after(25),
+                **options,
+            )
+        state = load_checkpoint(checkpoint)
+        assert state["records_processed"] == 24
+        assert state["input"]["line"] == 24
+
+        resumed = tm.flatten_stream(
+            source,
+            resumed_dir,
+            config=_config(),
+            checkpoint_path=checkpoint,
+            resume=True,
+            **options,
+        )
+
+        assert sorted(p.name for p in resumed) == sorted(p.name for p in baseline)
+        if output_format == "parquet":
+            assert _snapshot(resumed_dir, "parquet") == _snapshot(
+                tmp_path / "baseline", "parquet"
+            )
+        else:
+            # Timestamps come from the checkpoint, so compare all but that column
+            for path in baseline:
+                expected = _strip_timestamps(path, output_format)
+                actual = _strip_timestamps(resumed_dir / path.name, output_format)
+                assert actual == expected
+
+    def test_resumed_manifest_covers_whole_run(self, tmp_path):
+        source = _write_jsonl(tmp_path / "input.jsonl", 40)
+        options = {"checkpoint_interval": 2, "manifest": True}
+        baseline = tm.flatten_stream(
+            source, tmp_path / "baseline", config=_config(), **options
+        )
+
+        checkpoint = tmp_path / "run.ckpt"
+        with pytest.raises(_CrashError):
+            tm.flatten_stream(
+                source,
+                tmp_path / "resumed",
+                config=_config(),
+                checkpoint_path=checkpoint,
+                progress_callback=_crash_after(25),
+                **options,
+            )
+        resumed = tm.flatten_stream(
+            source,
+            tmp_path / "resumed",
+            config=_config(),
+            checkpoint_path=checkpoint,
+            resume=True,
+            **options,
+        )
+
+        expected, actual = baseline.manifest, resumed.manifest
+        assert actual.records == expected.records == 40
+        for name, table in expected.tables.items():
+            assert actual.tables[name].rows == table.rows
+            assert actual.tables[name].min_id == table.min_id
+            assert actual.tables[name].max_id == table.max_id
+
+    def test_resume_list_input_skips_processed_records(self, tmp_path):
+        records = [{"id": i} for i in range(10)]
+        checkpoint = tmp_path / "run.ckpt"
+
+        with pytest.raises(_CrashError):
+            tm.flatten_stream(
+                records,
+                tmp_path,
+                config=_config(),
+                checkpoint_path=checkpoint,
+                checkpoint_interval=1,
+                progress_callback=_crash_after(7),
+            )
+        tm.flatten_stream(
+            records,
+            tmp_path,
+            config=_config(),
+            checkpoint_path=checkpoint,
+            resume=True,
+        )
+
+        rows = (tmp_path / "data.csv").read_text().splitlines()
+        assert [row.split(",")[-1] for row in rows[1:]] == [str(i) for i in range(10)]
+
+    def test_resume_without_checkpoint_starts_fresh(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": 1}],
+            tmp_path,
+            checkpoint_path=tmp_path / "missing.ckpt",
+            resume=True,
+        )
+
+        assert [p.name for p in files] == ["data.csv"]
+
+    def test_parquet_parts_finalized_at_checkpoints(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": i} for i in range(9)],
+            tmp_path,
+            output_format="parquet",
+            config=_config(),
+            checkpoint_path=tmp_path / "run.ckpt",
+            checkpoint_interval=2,
+        )
+
+        assert sorted(p.name for p in files) == [
+            "data-00001.parquet",
+            "data-00002.parquet",
+        ]
+        state = load_checkpoint(tmp_path / "run.ckpt")
+        assert sorted(state["files"]) == sorted(str(p) for p in files)
+
+
+def _strip_timestamps(path, output_format):
+    if output_format == "csv":
+        import csv
+
+        with open(path) as f:
+            return [
+                {k: v for k, v in row.items() if k != "_timestamp"}
+                for row in csv.DictReader(f)
+            ]
+    import fastavro
+
+    with open(path, "rb") as f:
+        return [
+            {k: v for k, v in row.items() if k != "_timestamp"}
+            for row in fastavro.reader(f)
+        ]
+
+
+class TestCheckpointFiles:
+    """Test checkpoint file handling."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "nested" / "run.ckpt"
+        save_checkpoint(path, {"batch_count": 3})
+
+        assert load_checkpoint(path) == {"version": 1, "batch_count": 3}
+        assert not (tmp_path / "nested" / "run.ckpt.tmp").exists()
+
+    def test_missing_file(self, tmp_path):
+        assert load_checkpoint(tmp_path / "missing.ckpt") is None
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "run.ckpt"
+        path.write_text("{not json")
+
+        with pytest.raises(ConfigurationError):
+            load_checkpoint(path)
+
+    def test_jsonl_input_resumes_at_offset(self, tmp_path):
+        source = _write_jsonl(tmp_path / "input.jsonl", 5)
+        records, position = resumable_input(str(source))
+        first_two = [next(records)["id"], next(records)["id"]]
+
+        rest, _ = resumable_input(str(source), position())
+
+        assert first_two == [0, 1]
+        assert [r["id"] for r in rest] == [2, 3, 4]
+
+
+class TestSessionCheckpoints:
+    """Test checkpoint support in StreamSession."""
+
+    def test_resume_requires_checkpoint_path(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            StreamSession(tmp_path, resume=True)
+
+    def test_partitioned_output_not_supported(self, tmp_path):
+        with StreamSession(tmp_path, partition_by=["id"]) as session:
+            session.feed({"id": 1})
+            with pytest.raises(ConfigurationError):
+                session.checkpoint()
+
+    def test_partitioned_output_rejected_before_writing(self, tmp_path):
+        output = tmp_path / "out"
+
+        with pytest.raises(ConfigurationError, match="partition_by"):
+            tm.flatten_stream(
+                [{"id": i} for i in range(10)],
+                output,
+                config=_config(),
+                partition_by=["id"],
+                checkpoint_path=tmp_path / "run.ckpt",
+            )
+
+        assert list(output.iterdir()) == []
+        assert not (tmp_path / "run.ckpt").exists()
+
+    def test_entity_mismatch(self, tmp_path):
+        checkpoint = tmp_path / "run.ckpt"
+        with StreamSession(tmp_path, name="a", checkpoint_path=checkpoint) as session:
+            session.feed({"id": 1})
+            session.checkpoint()
+
+        with pytest.raises(ConfigurationError, match="entity"):
+            StreamSession(tmp_path, name="b", checkpoint_path=checkpoint, resume=True)
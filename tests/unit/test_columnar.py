@@ -0,0 +1,390 @@
+"""Tests for Parquet, ORC, Avro and Arrow IPC files and DataFrames as input."""
+
+import csv
+import datetime
+import decimal
+import gzip
+import io
+import sys
+import types
+
+import pytest
+
+import transmog as tm
+from transmog.columnar import (
+    dataframe_kind,
+    get_columnar_file_iterator,
+    get_dataframe_iterator,
+)
+from transmog.exceptions import ValidationError
+from transmog.iterators import get_data_iterator
+
+pa = pytest.importorskip("pyarrow")
+
+ROWS = [
+    {
+        "id": 1,
+        "customer": {"name": "alpha", "address": {"city": "Oslo"}},
+        "items": [{"sku": "a", "qty": 2}, {"sku": "b", "qty": 1}],
+        "tags": ["x", "y"],
+    },
+    {"id": 2, "customer": {"name": "beta", "address": None}, "items": [], "tags": None},
+]
+
+
+def _table():
+    return pa.Table.from_pylist(ROWS)
+
+
+class TestArrowFormats:
+    """Test files read with pyarrow."""
+
+    def test_parquet(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "orders.parquet"
+        pq.write_table(_table(), path)
+
+        assert list(get_data_iterator(str(path))) == ROWS
+
+    def test_parquet_read_in_batches(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "orders.parquet"
+        pq.write_table(pa.table({"id": list(range(25))}), path, row_group_size=10)
+
+        records = list(get_columnar_file_iterator(str(path), batch_size=4))
+
+        assert [r["id"] for r in records] == list(range(25))
+
+    def test_orc(self, tmp_path):
+        orc = pytest.importorskip("pyarrow.orc")
+        path = tmp_path / "orders.orc"
+        orc.write_table(_table(), str(path))
+
+        records = list(get_columnar_file_iterator(str(path), batch_size=1))
+
+        assert records == ROWS
+
+    @pytest.mark.parametrize("stream_format", [False, True])
+    def test_arrow_ipc(self, tmp_path, stream_format):
+        import pyarrow.ipc as ipc
+
+        path = tmp_path / "orders.arrow"
+        table = _table()
+        open_writer = ipc.new_stream if stream_format else ipc.new_file
+        with open_writer(str(path), table.schema) as writer:
+            writer.write_table(table, max_chunksize=1)
+
+        assert list(get_data_iterator(str(path))) == ROWS
+
+    def test_map_and_logical_types(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "values.parquet"
+        table = pa.table(
+            {
+                "attributes": pa.array(
+                    [[("color", "red")]], pa.map_(pa.string(), pa.string())
+                ),
+                "amount": pa.array([decimal.Decimal("1.50")], pa.decimal128(5, 2)),
+                "seen": pa.array([datetime.datetime(2024, 1, 2)]),
+            }
+        )
+        pq.write_table(table, path)
+
+        assert list(get_data_iterator(str(path))) == [
+            {
+                "attributes": {"color": "red"},
+                "amount": decimal.Decimal("1.50"),
+                "seen": datetime.datetime(2024, 1, 2),
+            }
+        ]
+
+    def test_compressed_file_rejected(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        buffer = io.BytesIO()
+        pq.write_table(_table(), buffer)
+        path = tmp_path / "orders.parquet.gz"
+        path.write_bytes(gzip.compress(buffer.getvalue()))
+
+        with pytest.raises(ValidationError, match="Compressed Parquet"):
+            list(get_data_iterator(str(path)))
+
+    def test_corrupt_file(self, tmp_path):
+        path = tmp_path / "orders.parquet"
+        path.write_bytes(b"not parquet")
+
+        with pytest.raises(ValidationError, match="Error reading Parquet file"):
+            list(get_data_iterator(str(path)))
+
+
+class TestAvro:
+    """Test Avro object container files."""
+
+    SCHEMA = {
+        "type": "record",
+        "name": "Order",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {
+                "name": "items",
+                "type": {
+                    "type": "array",
+                    "items": {
+                        "type": "record",
+                        "name": "Item",
+                        "fields": [{"name": "sku", "type": "string"}],
+                    },
+                },
+            },
+        ],
+    }
+
+    def _write(self, records):
+        fastavro = pytest.importorskip("fastavro")
+        buffer = io.BytesIO()
+        fastavro.writer(buffer, self.SCHEMA, records)
+        return buffer.getvalue()
+
+    def test_avro(self, tmp_path):
+        records = [{"id": 1, "items": [{"sku": "a"}]}, {"id": 2, "items": []}]
+        path = tmp_path / "orders.avro"
+        path.write_bytes(self._write(records))
+
+        assert list(get_data_iterator(str(path))) == records
+
+    def test_compressed_avro(self, tmp_path):
+        records = [{"id": 1, "items": []}]
+        path = tmp_path / "orders.avro.gz"
+        path.write_bytes(gzip.compress(self._write(records)))
+
+        assert list(get_data_iterator(str(path))) == records
+
+
+class TestFlattenColumnar:
+    """Test columnar files as flatten input."""
+
+    def test_flatten_parquet(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "orders.parquet"
+        pq.write_table(_table(), path)
+
+        result = tm.flatten(str(path), name="orders")
+
+        assert result.main[0]["customer_address_city"] == "Oslo"
+        assert [row["sku"] for row in result.tables["orders_items"]] == ["a", "b"]
+
+    def test_directory_of_parquet_files(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        source = tmp_path / "landed"
+        source.mkdir()
+        pq.write_table(_table(), source / "part-0.parquet")
+        pq.write_table(_table(), source / "part-1.parquet")
+
+        tm.flatten_stream(source, tmp_path / "out", name="orders", output_format="csv")
+
+        rows = (tmp_path / "out" / "orders_items.csv").read_text().splitlines()
+        assert len(rows) == 5
+
+
+class TestDeterministicIds:
+    """Test hash and field-list IDs on values JSON has no type for."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "typed.parquet"
+        table = pa.table(
+            {
+                "id": [1, 2],
+                "ts": [datetime.datetime(2024, 1, 2), datetime.datetime(2024, 1, 3)],
+                "amount": pa.array(
+                    [decimal.Decimal("1.50"), decimal.Decimal("2.25")],
+                    pa.decimal128(5, 2),
+                ),
+                "raw": [b"\x00\x01", b"\x02"],
+                "items": [[{"seen": datetime.date(2024, 1, 2)}], []],
+            }
+        )
+        pq.write_table(table, path)
+        return path
+
+    @pytest.mark.parametrize(
+        "id_generation", ["hash", ["ts"], ["amount"], ["raw"], ["id", "ts"]]
+    )
+    def test_ids_are_deterministic(self, path, id_generation):
+        config = tm.TransmogConfig(id_generation=id_generation)
+
+        first = tm.flatten(str(path), name="t", config=config)
+        second = tm.flatten(str(path), name="t", config=config)
+
+        ids = [row["_id"] for row in first.main]
+        assert ids == [row["_id"] for row in second.main]
+        assert len(set(ids)) == 2
+
+    def test_checkpointed_stream_with_hash_ids(self, tmp_path, path):
+        config = tm.TransmogConfig(id_generation="hash", batch_size=1)
+        options = {"name": "t", "config": config, "output_format": "csv"}
+
+        tm.flatten_stream(path, tmp_path / "a", **options)
+        tm.flatten_stream(
+            path,
+            tmp_path / "b",
+            checkpoint_path=tmp_path / "run.ckpt",
+            resume=True,
+            **options,
+        )
+
+        def ids(directory):
+            with open(directory / "t.csv") as f:
+                return [row["_id"] for row in csv.DictReader(f)]
+
+        assert ids(tmp_path / "a") == ids(tmp_path / "b")
+
+
+class TestDataFrameInput:
+    """Test pandas and polars DataFrames as input."""
+
+    def test_pandas_nested_cells(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(ROWS)
+
+        records = list(get_data_iterator(frame))
+
+        assert records[0]["customer"] == ROWS[0]["customer"]
+        assert records[0]["items"] == ROWS[0]["items"]
+        assert records[1]["tags"] is None
+
+    def test_pandas_arrow_backed(self):
+        pd = pytest.importorskip("pandas")
+        frame = _table().to_pandas(types_mapper=pd.ArrowDtype)
+
+        assert list(get_dataframe_iterator(frame, batch_size=1)) == ROWS
+
+    def test_pandas_missing_values(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(
+            {
+                "score": [0.5, float("nan")],
+                "seen": pd.to_datetime(["2024-01-02", None]),
+                "count": pd.array([1, None], dtype="Int64"),
+            }
+        )
+
+        records = list(get_data_iterator(frame))
+
+        assert records[1] == {"score": None, "seen": None, "count": None}
+        assert records[0]["count"] == 1
+
+    def test_pandas_mixed_cells(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(
+            {"id": [1, 2, 3], "value": [{"a": 1}, "text", None]}, dtype=object
+        )
+
+        records = list(get_dataframe_iterator(frame, batch_size=2))
+
+        assert [r["value"] for r in records] == [{"a": 1}, "text", None]
+
+    def test_pandas_slices(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame({"id": range(25)}, index=range(100, 125))
+
+        records = list(get_dataframe_iterator(frame, batch_size=4))
+
+        assert records == [{"id": i} for i in range(25)]
+
+    def test_polars(self):
+        pl = pytest.importorskip("polars")
+        frame = pl.DataFrame(ROWS)
+
+        assert list(get_dataframe_iterator(frame, batch_size=1)) == ROWS
+
+    def test_flatten_pandas(self):
+        pd = pytest.importorskip("pandas")
+        calls = []
+
+        result = tm.flatten(
+            pd.DataFrame(ROWS),
+            name="orders",
+            progress_callback=lambda done, total: calls.append(total),
+        )
+
+        assert result.main[0]["customer_address_city"] == "Oslo"
+        assert len(result.tables["orders_items"]) == 2
+        assert calls[-1] == 2
+
+    def test_flatten_stream_polars(self, tmp_path):
+        pl = pytest.importorskip("polars")
+
+        tm.flatten_stream(pl.DataFrame(ROWS), tmp_path, name="orders")
+
+        rows = (tmp_path / "orders_items.csv").read_text().splitlines()
+        assert len(rows) == 3
+
+    def test_typed_cells_with_hash_ids(self):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(
+            {
+                "id": [1, 2],
+                "ts": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                "amount": [decimal.Decimal("1.50"), decimal.Decimal("2.25")],
+                "raw": [b"\x00", b"\x01"],
+            }
+        )
+
+        for id_generation in ("hash", ["ts", "amount", "raw"]):
+            config = tm.TransmogConfig(id_generation=id_generation)
+            result = tm.flatten(frame, name="t", config=config)
+            assert len({row["_id"] for row in result.main}) == 2
+
+    def test_arrow_frame_with_hash_ids(self, monkeypatch):
+        # Stands in for polars, which converts frames through Arrow, so the
+        # DataFrame path runs without pandas or polars installed
+        class DataFrame:
+            def __init__(self, table):
+                self.table = table
+                self.columns = table.column_names
+
+            def __len__(self):
+                return self.table.num_rows
+
+            def to_arrow(self):
+                return self.table
+
+        monkeypatch.setitem(
+            sys.modules, "polars", types.SimpleNamespace(DataFrame=DataFrame)
+        )
+        frame = DataFrame(
+            pa.table(
+                {
+                    "ts": [
+                        datetime.datetime(2024, 1, 2),
+                        datetime.datetime(2024, 1, 3),
+                    ],
+                    "amount": pa.array(
+                        [decimal.Decimal("1.50"), decimal.Decimal("2.25")],
+                        pa.decimal128(5, 2),
+                    ),
+                    "raw": [b"\x00", b"\x01"],
+                }
+            )
+        )
+        config = tm.TransmogConfig(id_generation="hash")
+
+        first = tm.flatten(frame, name="t", config=config)
+        second = tm.flatten(frame, name="t", config=config)
+
+        ids = [row["_id"] for row in first.main]
+        assert ids == [row["_id"] for row in second.main]
+        assert len(set(ids)) == 2
+
+    def test_not_a_dataframe(self):
+        assert dataframe_kind([{"id": 1}]) is None
+        with pytest.raises(ValidationError, match="Unsupported DataFrame"):
+            list(get_dataframe_iterator([{"id": 1}]))
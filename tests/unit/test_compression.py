@@ -0,0 +1,316 @@
+"""Tests for compressed input decoding."""
+
+import bz2
+import gzip
+import json
+import lzma
+import threading
+
+import pytest
+
+import transmog as tm
+from transmog import compression
+from transmog.compression import (
+    content_extension,
+    detect_compression,
+    open_decompressed,
+)
+from transmog.exceptions import ConfigurationError, ValidationError
+from transmog.iterators import (
+    get_data_iterator,
+    get_jsonl_range_iterator,
+    split_jsonl_file,
+)
+
+COMPRESSORS = {"gz": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+def _records(count):
+    return [{"id": i, "items": [{"n": j} for j in range(2)]} for i in range(count)]
+
+
+def _jsonl(records):
+    return "".join(json.dumps(r) + "\n" for r in records).encode()
+
+
+class TestDetection:
+    """Test codec detection."""
+
+    @pytest.mark.parametrize(
+        "name, codec",
+        [
+            ("data.jsonl.gz", "gzip"),
+            ("data.json.bz2", "bz2"),
+            ("data.jsonl.xz", "xz"),
+            ("data.jsonl.zst", "zstd"),
+        ],
+    )
+    def test_by_extension(self, tmp_path, name, codec):
+        path = tmp_path / name
+        path.write_bytes(b"")
+
+        assert detect_compression(str(path)) == codec
+
+    def test_by_magic_bytes(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(gzip.compress(b"{}"))
+
+        assert detect_compression(str(path)) == "gzip"
+
+    def test_uncompressed(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"id": 1}\n')
+
+        assert detect_compression(str(path)) is None
+
+    def test_content_extension(self):
+        assert content_extension("events.JSONL.gz") == ".jsonl"
+        assert content_extension("events.json") == ".json"
+        assert content_extension("events.zst") == ""
+
+
+class TestOpenDecompressed:
+    """Test the decompressing reader."""
+
+    @pytest.mark.parametrize("suffix", sorted(COMPRESSORS))
+    def test_round_trip(self, tmp_path, suffix):
+        payload = _jsonl(_records(500))
+        path = tmp_path / f"data.jsonl.{suffix}"
+        path.write_bytes(COMPRESSORS[suffix](payload))
+
+        with open_decompressed(str(path)) as handle:
+            assert handle.read() == payload
+
+    def test_multi_member_gzip(self, tmp_path):
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(b"first\n") + gzip.compress(b"second\n"))
+
+        with open_decompressed(str(path)) as handle:
+            assert handle.read() == b"first\nsecond\n"
+
+    def test_corrupt_input(self, tmp_path):
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(b"payload")[:-12] + b"garbage-bytes")
+
+        with pytest.raises(ValidationError, match="Error decompressing"):
+            with open_decompressed(str(path)) as handle:
+                handle.read()
+
+    def test_close_before_end(self, tmp_path):
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(_jsonl(_records(50000))))
+
+        handle = open_decompressed(str(path), buffer_size=16)
+        handle.readline()
+        handle.close()
+
+        assert handle.closed
+
+    def test_zstd(self, tmp_path):
+        cramjam = pytest.importorskip("cramjam")
+        payload = _jsonl(_records(100))
+        path = tmp_path / "data.jsonl.zst"
+        path.write_bytes(bytes(cramjam.zstd.compress(payload)))
+
+        with open_decompressed(str(path)) as handle:
+            assert handle.read() == payload
+
+
+class TestCompressedInput:
+    """Test compressed files as flatten input."""
+
+    @pytest.mark.parametrize("suffix", sorted(COMPRESSORS))
+    def test_jsonl(self, tmp_path, suffix):
+        records = _records(20)
+        path = tmp_path / f"data.jsonl.{suffix}"
+        path.write_bytes(COMPRESSORS[suffix](_jsonl(records)))
+
+        assert list(get_data_iterator(str(path))) == records
+
+    def test_json(self, tmp_path):
+        records = _records(5)
+        path = tmp_path / "data.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(records).encode()))
+
+        assert list(get_data_iterator(str(path))) == records
+
+    def test_json_streaming(self, tmp_path):
+        pytest.importorskip("ijson")
+        records = _records(5)
+        path = tmp_path / "data.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(records).encode()))
+
+        assert list(get_data_iterator(str(path), streaming=True)) == records
+
+    def test_parse_workers_read_sequentially(self, tmp_path):
+        records = _records(20)
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(_jsonl(records)))
+
+        assert list(get_data_iterator(str(path), parse_workers=2)) == records
+
+    def test_flatten(self, tmp_path):
+        path = tmp_path / "data.jsonl.bz2"
+        path.write_bytes(bz2.compress(_jsonl(_records(10))))
+
+        result = tm.flatten(str(path), name="data")
+
+        assert len(result.main) == 10
+        assert len(result.tables["data_items"]) == 20
+
+    def test_flatten_stream_checkpoint(self, tmp_path):
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(_jsonl(_records(10))))
+
+        tm.flatten_stream(
+            str(path),
+            str(tmp_path / "out"),
+            name="data",
+            output_format="csv",
+            checkpoint_path=str(tmp_path / "run.ckpt"),
+        )
+
+        rows = (tmp_path / "out" / "data.csv").read_text().splitlines()
+        assert len(rows) == 11
+
+
+class TestReadAhead:
+    """Test reading uncompressed files on a background thread."""
+
+    def test_round_trip(self, tmp_path):
+        payload = _jsonl(_records(2000))
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(payload)
+
+        with open_decompressed(str(path), read_ahead=4096) as handle:
+            assert handle.read() == payload
+
+    def test_offset(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"0123456789")
+
+        with open_decompressed(str(path), read_ahead=4, offset=6) as handle:
+            assert handle.read() == b"6789"
+        with open_decompressed(str(path), offset=6) as handle:
+            assert handle.read() == b"6789"
+
+    def test_compressed_file(self, tmp_path):
+        payload = _jsonl(_records(500))
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(payload))
+
+        with open_decompressed(str(path), read_ahead=64 * 1024) as handle:
+            assert handle.read() == payload
+
+    def test_offset_in_compressed_file(self, tmp_path):
+        path = tmp_path / "data.jsonl.gz"
+        path.write_bytes(gzip.compress(b"payload"))
+
+        with pytest.raises(ValidationError, match="Cannot seek"):
+            open_decompressed(str(path), offset=3)
+
+    def test_invalid_size(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"{}")
+
+        with pytest.raises(ConfigurationError, match="read_ahead"):
+            open_decompressed(str(path), read_ahead=0)
+
+    def test_close_before_end(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(_jsonl(_records(50000)))
+
+        handle = open_decompressed(str(path), buffer_size=16, read_ahead=1024)
+        handle.readline()
+        handle.close()
+
+        assert handle.closed
+        assert not any(
+            thread.name == "transmog-read-ahead" for thread in threading.enumerate()
+        )
+
+    def test_decoder_error_leaves_no_open_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "data.jsonl.zst"
+        path.write_bytes(b"payload")
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            handle = open(*args, **kwargs)
+            opened.append(handle)
+            return handle
+
+        def missing_codec(codec):
+            raise ValidationError(f"{codec} support is not installed")
+
+        monkeypatch.setattr(compression, "open", tracking_open, raising=False)
+        monkeypatch.setattr(compression, "_create_decoder", missing_codec)
+
+        with pytest.raises(ValidationError, match="not installed"):
+            open_decompressed(str(path), read_ahead=1024)
+
+        assert all(handle.closed for handle in opened)
+
+    def test_json_streaming(self, tmp_path):
+        pytest.importorskip("ijson")
+        records = _records(200)
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(records))
+
+        iterator = get_data_iterator(str(path), streaming=True, read_ahead=512)
+        assert list(iterator) == records
+
+    def test_jsonl_range(self, tmp_path):
+        records = _records(100)
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(_jsonl(records))
+        ranges = split_jsonl_file(str(path), 3)
+
+        parsed = [
+            record
+            for start, end in ranges
+            for record in get_jsonl_range_iterator(str(path), start, end, 256)
+        ]
+        assert parsed == records
+
+    def test_flatten_stream(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(_jsonl(_records(300)))
+
+        tm.flatten_stream(str(path), tmp_path / "out", name="data", read_ahead=1024)
+
+        rows = (tmp_path / "out" / "data_items.csv").read_text().splitlines()
+        assert len(rows) == 601
+
+    def test_flatten_stream_checkpoint_resume(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(_jsonl(_records(30)))
+        options = {
+            "name": "data",
+            "config": tm.TransmogConfig(batch_size=10),
+            "checkpoint_path": str(tmp_path / "run.ckpt"),
+            "checkpoint_interval": 1,
+            "read_ahead": 64,
+        }
+
+        with pytest.raises(RuntimeError):
+
+            def fail(processed, total):
+                if processed >= 20:
+                    raise RuntimeError("interrupted")
+
+            tm.flatten_stream(
+                str(path), tmp_path / "out", progress_callback=fail, **options
+            )
+        tm.flatten_stream(str(path), tmp_path / "out", resume=True, **options)
+
+        ids = [
+            row.split(",")[0]
+            for output in sorted((tmp_path / "out").glob("data*.csv"))
+            if "items" not in output.name
+            for row in output.read_text().splitlines()[1:]
+        ]
+        assert len(ids) == 30
+
+    def test_invalid_option(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="read_ahead"):
+            tm.flatten_stream([{"id": 1}], tmp_path, read_ahead=0)
@@ -0,0 +1,212 @@
+"""Tests for event-driven flattening of large JSON documents."""
+
+import csv
+import json
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError, ValidationError
+from transmog.flattening import process_record_batch
+from transmog.types import ArrayMode, ProcessingContext
+
+pytest.importorskip("ijson")
+
+from transmog.events import iter_document_tables  # noqa: E402
+
+DOCUMENT = {
+    "name": "export",
+    "empty": "",
+    "meta": {"version": 2, "tags": ["a", "b"], "owner": {"id": 7}},
+    "orders": [
+        {"id": 1, "total": 9.5, "items": [{"sku": "x"}, {"sku": "y"}]},
+        {"id": 2, "total": None, "items": []},
+        3,
+        None,
+    ],
+    "scores": [1, 2, None],
+    "nothing": [],
+}
+
+
+def _tables(chunks):
+    main, children = [], {}
+    for main_records, child_tables in chunks:
+        main.extend(main_records)
+        for name, rows in child_tables.items():
+            children.setdefault(name, []).extend(rows)
+    return main, children
+
+
+def _strip_ids(rows):
+    return sorted(
+        (
+            {k: v for k, v in row.items() if k not in ("_id", "_parent_id")}
+            for row in rows
+        ),
+        key=json.dumps,
+    )
+
+
+def _flatten_both(config, document=DOCUMENT):
+    context = ProcessingContext(extract_time="2024-01-01 00:00:00.000000")
+    expected = process_record_batch([document], "data", config, context)
+    actual = _tables(
+        iter_document_tables(json.dumps(document).encode(), "data", config, context)
+    )
+    return expected, actual
+
+
+class TestEquivalence:
+    """Test that event flattening matches record flattening."""
+
+    @pytest.mark.parametrize("mode", list(ArrayMode))
+    def test_array_modes(self, mode):
+        config = TransmogConfig(array_mode=mode, time_field=None)
+        (exp_main, exp_children), (main, children) = _flatten_both(config)
+
+        assert _strip_ids(main) == _strip_ids(exp_main)
+        assert children.keys() == exp_children.keys()
+        for name, rows in exp_children.items():
+            assert _strip_ids(children[name]) == _strip_ids(rows)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"include_nulls": True},
+            {"stringify_values": True},
+            {"max_depth": 2},
+        ],
+    )
+    def test_options(self, options):
+        config = TransmogConfig(time_field=None, **options)
+        (exp_main, exp_children), (main, children) = _flatten_both(config)
+
+        assert _strip_ids(main) == _strip_ids(exp_main)
+        for name, rows in exp_children.items():
+            assert _strip_ids(children[name]) == _strip_ids(rows)
+
+    def test_children_reference_root_id(self):
+        config = TransmogConfig()
+        _, (main, children) = _flatten_both(config)
+
+        root_id = main[0]["_id"]
+        assert {row["_parent_id"] for rows in children.values() for row in rows} == {
+            root_id
+        }
+        assert main[0]["_timestamp"] == "2024-01-01 00:00:00.000000"
+
+
+class TestChunks:
+    """Test incremental emission of child rows."""
+
+    def test_child_rows_emitted_before_root(self):
+        document = {"id": 1, "rows": [{"n": i} for i in range(10)]}
+        chunks = list(
+            iter_document_tables(
+                json.dumps(document).encode(),
+                "data",
+                TransmogConfig(),
+                ProcessingContext(),
+                chunk_rows=3,
+            )
+        )
+
+        assert [len(main) for main, _ in chunks] == [0, 0, 0, 1]
+        assert [len(c.get("data_rows", [])) for _, c in chunks] == [3, 3, 3, 1]
+
+    def test_top_level_array_of_documents(self):
+        data = json.dumps([{"id": 1, "rows": [{"n": 1}]}, {"id": 2}]).encode()
+        main, children = _tables(
+            iter_document_tables(data, "data", TransmogConfig(), ProcessingContext())
+        )
+
+        assert [row["id"] for row in main] == [1, 2]
+        assert children["data_rows"][0]["_parent_id"] == main[0]["_id"]
+
+    def test_compressed_file(self, tmp_path):
+        import gzip
+
+        path = tmp_path / "doc.json.gz"
+        path.write_bytes(gzip.compress(json.dumps(DOCUMENT).encode()))
+        main, children = _tables(
+            iter_document_tables(
+                str(path), "data", TransmogConfig(), ProcessingContext()
+            )
+        )
+
+        assert main[0]["name"] == "export"
+        assert len(children["data_orders"]) == 3
+
+
+class TestErrors:
+    """Test rejected inputs and options."""
+
+    def test_requires_random_ids(self):
+        with pytest.raises(ConfigurationError, match="random"):
+            list(
+                iter_document_tables(
+                    b"{}",
+                    "data",
+                    TransmogConfig(id_generation="hash"),
+                    ProcessingContext(),
+                )
+            )
+
+    def test_scalar_root(self):
+        with pytest.raises(ValidationError, match="Expected JSON object"):
+            list(
+                iter_document_tables(
+                    b"[1]", "data", TransmogConfig(), ProcessingContext()
+                )
+            )
+
+    def test_invalid_json(self):
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            list(
+                iter_document_tables(
+                    b'{"a": [1, ', "data", TransmogConfig(), ProcessingContext()
+                )
+            )
+
+
+class TestFlattenStreamEvents:
+    """Test flatten_stream(engine="events")."""
+
+    def test_writes_tables(self, tmp_path):
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps({**DOCUMENT, "orders": DOCUMENT["orders"][:2]}))
+
+        files = tm.flatten_stream(
+            path,
+            tmp_path / "out",
+            name="data",
+            output_format="csv",
+            engine="events",
+            config=TransmogConfig(batch_size=1),
+            manifest=True,
+        )
+
+        with open(tmp_path / "out" / "data_orders.csv") as f:
+            orders = list(csv.DictReader(f))
+        assert [row["id"] for row in orders] == ["1", "2"]
+        assert files.manifest.tables["data"].rows == 1
+        assert files.manifest.tables["data_items"].rows == 2
+
+    def test_in_memory_input_rejected(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="JSON file path"):
+            tm.flatten_stream(DOCUMENT, tmp_path, engine="events")
+
+    def test_partition_by_rejected(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="partition_by"):
+            tm.flatten_stream(
+                json.dumps(DOCUMENT).encode(),
+                tmp_path,
+                engine="events",
+                partition_by=["name"],
+            )
+
+    def test_unknown_engine(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="engine"):
+            tm.flatten_stream([{"id": 1}], tmp_path, engine="columns")
@@ -4,15 +4,19 @@ Tests for data iteration utilities.
 Tests data iteration functionality, batch processing, and streaming operations.
 """
 
+import io
 import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from transmog.exceptions import ValidationError
+from transmog.exceptions import ConfigurationError, ValidationError
 from transmog.iterators import (
     IJSON_AVAILABLE,
+    IJSON_BACKEND,
+    IJSON_BACKENDS,
+    PEEK_SIZE,
     _detect_string_format,
     get_data_iterator,
     get_hjson_file_iterator,
@@ -21,6 +25,10 @@ from transmog.iterators import (
     get_json_file_iterator_streaming,
     get_jsonl_data_iterator,
     get_jsonl_file_iterator,
+    get_jsonl_parallel_iterator,
+    get_multi_file_iterator,
+    resolve_input_paths,
+    select_records,
 )
 
 try:
@@ -261,6 +269,35 @@ class TestJSONLFileIterator:
         assert records[0]["value"] == "item_0"
         assert records[999]["value"] == "item_999"
 
+    def test_blank_and_crlf_lines_skipped(self, tmp_path):
+        """Test that blank, whitespace-only and CRLF lines are skipped."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b'{"id": 1}\r\n\r\n   \n\t{"id": 2}  \n\n{"id": 3}')
+
+        records = list(get_jsonl_file_iterator(str(path)))
+        assert [r["id"] for r in records] == [1, 2, 3]
+
+    def test_non_ascii_content(self, tmp_path):
+        """Test that UTF-8 content is parsed without decoding lines first."""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"name": "测试"}\n{"name": "🌍"}\n', encoding="utf-8")
+
+        records = list(get_jsonl_file_iterator(str(path)))
+        assert [r["name"] for r in records] == ["测试", "🌍"]
+
+    def test_invalid_line_reports_line_number(self, tmp_path):
+        """Test that parse errors name the offending line."""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"id": 1}\n\n{"id": \n')
+
+        with pytest.raises(ValidationError, match="line 3"):
+            list(get_jsonl_file_iterator(str(path)))
+
+    def test_jsonl_bytes_data(self):
+        """Test JSONL content given as bytes."""
+        records = list(get_jsonl_data_iterator(b'{"id": 1}\n\n{"id": 2}\n'))
+        assert [r["id"] for r in records] == [1, 2]
+
 
 class TestDataIteratorEdgeCases:
     """Test edge cases in data iteration."""
@@ -403,6 +440,72 @@ class TestDetectStringFormat:
         assert _detect_string_format('  {"a":1}\n  {"b":2}') == "jsonl"
 
 
+class TestBytesLikeInput:
+    """Test bytes, bytearray and memoryview content."""
+
+    JSONL = b'{"id": 1}\n{"id": 2}\r\n\n{"id": 3}\n'
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_jsonl(self, wrap):
+        records = list(get_data_iterator(wrap(self.JSONL)))
+        assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_json(self, wrap):
+        records = list(get_data_iterator(wrap(b' [{"id": 1}, {"id": 2}] ')))
+        assert records == [{"id": 1}, {"id": 2}]
+
+    def test_memoryview_slice(self):
+        body = b"HEADER" + self.JSONL + b"TRAILER"
+        view = memoryview(body)[6:-7]
+        assert len(list(get_data_iterator(view))) == 3
+
+    def test_whitespace_only_rejected(self):
+        with pytest.raises(ValidationError, match="No JSON content"):
+            get_data_iterator(memoryview(b" \n\t "))
+
+    def test_lines_span_split_blocks(self, monkeypatch):
+        """Lines crossing the block boundary are split intact."""
+        monkeypatch.setattr("transmog.iterators.JSONL_READ_BUFFER", 7)
+        records = [{"id": i, "name": "x" * i} for i in range(30)]
+        data = "\n".join(json.dumps(r) for r in records).encode()
+        assert list(get_data_iterator(bytearray(data))) == records
+
+    def test_error_line_numbers(self):
+        """Line numbers count lines read during format detection."""
+        data = b'{"id": 1}\n{"id": 2}\n[3]\n{"id": 4}\n{bad\n'
+        records = get_data_iterator(data)
+        assert next(records) == {"id": 1}
+        assert next(records) == {"id": 2}
+        with pytest.raises(ValidationError, match="line 3"):
+            next(records)
+
+        records = get_data_iterator(data.replace(b"[3]", b'{"id": 3}'))
+        with pytest.raises(ValidationError, match="line 5"):
+            list(records)
+
+    def test_detected_lines_parsed_once(self, monkeypatch):
+        """Lines parsed by format detection are not parsed again."""
+        import transmog.iterators as iterators
+
+        calls = []
+        real_loads = iterators._loads
+
+        def counting_loads(value):
+            calls.append(bytes(value))
+            return real_loads(value)
+
+        monkeypatch.setattr(iterators, "_loads", counting_loads)
+        records = list(get_data_iterator(b'{"id": 1}\n{"id": 2}\n'))
+
+        assert len(records) == 2
+        assert calls == [b'{"id": 1}', b'{"id": 2}']
+
+    def test_jsonl_data_iterator_memoryview(self):
+        records = list(get_jsonl_data_iterator(memoryview(self.JSONL)))
+        assert [r["id"] for r in records] == [1, 2, 3]
+
+
 @pytest.mark.skipif(not JSON5_AVAILABLE, reason="json5 not available")
 class TestJSON5FileIterator:
     """Test the JSON5 file iterator function."""
@@ -801,6 +904,57 @@ class TestJsonFileIteratorStreaming:
         assert len(records) == 1
         assert records[0] == {"id": 1}
 
+    def test_stream_whitespace_beyond_peek_size(self, temp_file):
+        """Leading whitespace longer than one peek read is skipped."""
+        path = temp_file(" " * (PEEK_SIZE + 10) + json.dumps([{"id": 1}]), ".json")
+        assert list(get_json_file_iterator_streaming(path)) == [{"id": 1}]
+
+    def test_stream_whitespace_only_file_raises(self, temp_file):
+        """A whitespace-only file is reported as empty."""
+        path = temp_file(" \n" * PEEK_SIZE, ".json")
+        with pytest.raises(ValidationError, match="empty"):
+            list(get_json_file_iterator_streaming(path))
+
+    def test_preferred_backend_selected(self):
+        """The most preferred installed ijson backend is used."""
+        import ijson
+
+        available = []
+        for name in IJSON_BACKENDS:
+            try:
+                ijson.get_backend(name)
+            except ImportError:
+                continue
+            available.append(name)
+        assert IJSON_BACKEND == available[0]
+
+    def test_numbers_parsed_as_float(self, temp_file):
+        """Non-integer numbers are floats, as with non-streaming parsing."""
+        path = temp_file('[{"price": 1.10, "qty": 2}]', ".json")
+        records = list(get_json_file_iterator_streaming(path))
+        assert records == [{"price": 1.1, "qty": 2}]
+        assert type(records[0]["price"]) is float
+
+    def test_use_decimal(self, temp_file):
+        """use_decimal keeps the exact digits of non-integer numbers."""
+        from decimal import Decimal
+
+        path = temp_file('{"data": [{"price": 1.10}]}', ".json")
+        records = list(
+            get_json_file_iterator_streaming(
+                path, record_path="data.item", use_decimal=True
+            )
+        )
+        assert records == [{"price": Decimal("1.10")}]
+        assert str(records[0]["price"]) == "1.10"
+
+    def test_small_read_buffer(self, temp_file):
+        """Records spanning many reads are parsed intact."""
+        data = [{"id": i, "value": "x" * 50} for i in range(100)]
+        path = temp_file(json.dumps(data), ".json")
+        records = list(get_data_iterator(path, streaming=True, read_buffer_size=16))
+        assert records == data
+
     def test_stream_large_array(self, temp_file):
         """1000-item array streams correctly."""
         data = [{"id": i, "value": f"item_{i}"} for i in range(1000)]
@@ -880,3 +1034,328 @@ class TestStreamingWithoutIjson:
         records = list(get_data_iterator(path, streaming=True))
         assert len(records) == 1
         assert records[0] == {"id": 1}
+
+
+class TestJsonlParallelIterator:
+    """Test parsing JSONL byte ranges in worker processes."""
+
+    @pytest.fixture
+    def jsonl_path(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(500)))
+        return str(path)
+
+    def test_ordered_matches_sequential(self, jsonl_path):
+        """Ordered parallel parsing yields records in file order."""
+        records = list(get_jsonl_parallel_iterator(jsonl_path, 2, chunk_size=512))
+        assert [r["id"] for r in records] == list(range(500))
+
+    def test_unordered_yields_every_record(self, jsonl_path):
+        """Unordered parsing yields each record exactly once."""
+        records = get_data_iterator(jsonl_path, parse_workers=2, ordered=False)
+        assert sorted(r["id"] for r in records) == list(range(500))
+
+    def test_worker_errors_propagate(self, tmp_path):
+        """Parse errors in a worker are raised to the caller."""
+        path = tmp_path / "bad.jsonl"
+        lines = [json.dumps({"id": i}) for i in range(200)] + ["{bad"]
+        path.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            list(get_jsonl_parallel_iterator(str(path), 2, chunk_size=256))
+
+    def test_single_worker_parses_in_process(self, jsonl_path):
+        """One worker falls back to the sequential reader."""
+        records = list(get_jsonl_parallel_iterator(jsonl_path, 1))
+        assert len(records) == 500
+
+    def test_invalid_worker_count(self, jsonl_path):
+        """A worker count below one is rejected."""
+        with pytest.raises(ConfigurationError):
+            list(get_jsonl_parallel_iterator(jsonl_path, 0))
+
+
+class TestMultiFileInput:
+    """Test directories, glob patterns and path lists as input."""
+
+    @pytest.fixture
+    def input_dir(self, tmp_path):
+        directory = tmp_path / "input"
+        (directory / "2024" / "01").mkdir(parents=True)
+        for index in range(3):
+            path = directory / "2024" / "01" / f"part-{index}.json"
+            path.write_text(json.dumps([{"id": index * 2}, {"id": index * 2 + 1}]))
+        (directory / "extra.jsonl").write_text('{"id": 6}\n{"id": 7}\n')
+        (directory / "_SUCCESS").write_text("")
+        (directory / ".hidden.json").write_text("not json")
+        return directory
+
+    def test_directory(self, input_dir):
+        """Files below a directory are read in sorted path order."""
+        records = list(get_data_iterator(input_dir))
+        assert [r["id"] for r in records] == list(range(8))
+
+    def test_directory_skips_hidden_and_marker_files(self, input_dir):
+        """Names starting with "." or "_" are not inputs."""
+        paths = resolve_input_paths(str(input_dir))
+        assert [Path(p).name for p in paths] == [
+            "part-0.json",
+            "part-1.json",
+            "part-2.json",
+            "extra.jsonl",
+        ]
+
+    def test_glob_pattern(self, input_dir):
+        """A glob pattern reads the matching files."""
+        records = list(get_data_iterator(str(input_dir / "**" / "part-*.json")))
+        assert [r["id"] for r in records] == list(range(6))
+
+    def test_path_list(self, input_dir):
+        """A list of paths is read in the given order."""
+        paths = [input_dir / "extra.jsonl", input_dir / "2024/01/part-0.json"]
+        records = list(get_data_iterator(paths))
+        assert [r["id"] for r in records] == [6, 7, 0, 1]
+
+    def test_source_field(self, input_dir):
+        """The source field holds one shared path string per file."""
+        records = list(get_data_iterator(input_dir, source_field="_source_file"))
+        assert records[0]["_source_file"].endswith("part-0.json")
+        assert records[0]["_source_file"] is records[1]["_source_file"]
+        assert records[-1]["_source_file"].endswith("extra.jsonl")
+
+    def test_source_field_single_file(self, input_dir):
+        """A single file path is tagged with its path too."""
+        path = str(input_dir / "extra.jsonl")
+        records = list(get_data_iterator(path, source_field="_source_file"))
+        assert {r["_source_file"] for r in records} == {path}
+
+    def test_large_files_streamed(self, input_dir, monkeypatch):
+        """Files over the prefetch size limit are read by the consumer."""
+        import transmog.iterators as mod
+
+        monkeypatch.setattr(mod, "MULTI_FILE_PREFETCH_MAX_SIZE", 0)
+        records = list(get_data_iterator(input_dir, source_field="src"))
+        assert [r["id"] for r in records] == list(range(8))
+        assert records[-1]["src"].endswith("extra.jsonl")
+
+    def test_small_prefetch_window(self, input_dir):
+        """Records keep file order with a single reader and one file ahead."""
+        paths = resolve_input_paths(input_dir)
+        records = get_multi_file_iterator(paths, read_workers=1, prefetch=1)
+        assert [r["id"] for r in records] == list(range(8))
+
+    def test_errors_propagate(self, input_dir):
+        """Parse errors in a reader thread are raised to the caller."""
+        (input_dir / "bad.json").write_text("{bad")
+        with pytest.raises(ValidationError, match="bad.json"):
+            list(get_data_iterator(input_dir))
+
+    def test_missing_listed_file(self, tmp_path):
+        """A missing file in a path list is reported."""
+        with pytest.raises(ValidationError, match="File not found"):
+            get_data_iterator([str(tmp_path / "missing.json")])
+
+    def test_unmatched_pattern(self, tmp_path):
+        """A glob pattern without matches is reported."""
+        with pytest.raises(ValidationError, match="No files match"):
+            get_data_iterator(str(tmp_path / "*.json"))
+
+    def test_empty_directory(self, tmp_path):
+        """A directory without input files is reported."""
+        with pytest.raises(ValidationError, match="No files found"):
+            get_data_iterator(tmp_path)
+
+    def test_inline_json_with_wildcards(self):
+        """JSON strings containing glob characters are parsed as JSON."""
+        records = list(get_data_iterator('[{"pattern": "*.json"}]'))
+        assert records == [{"pattern": "*.json"}]
+
+    def test_invalid_read_workers(self, input_dir):
+        """A reader count below one is rejected."""
+        with pytest.raises(ConfigurationError):
+            list(
+                get_multi_file_iterator(
+                    [str(input_dir / "extra.jsonl")], read_workers=0
+                )
+            )
+
+
+class TestRecordPath:
+    """Test selecting records nested inside wrapper documents."""
+
+    @pytest.fixture
+    def wrapped(self):
+        return {
+            "meta": {"source": "api", "page": 1},
+            "data": [{"id": 1}, {"id": 2, "meta": "own"}],
+            "count": 2,
+        }
+
+    @pytest.fixture
+    def wrapped_file(self, tmp_path, wrapped):
+        path = tmp_path / "wrapped.json"
+        path.write_text(json.dumps(wrapped))
+        return str(path)
+
+    def test_in_memory_document(self, wrapped):
+        """Records are selected from a dict input."""
+        records = list(get_data_iterator(wrapped, record_path="data.item"))
+        assert [r["id"] for r in records] == [1, 2]
+
+    def test_path_ending_at_array(self, wrapped):
+        """A path naming the array selects its elements."""
+        records = list(get_data_iterator(wrapped, record_path="data"))
+        assert [r["id"] for r in records] == [1, 2]
+
+    def test_record_meta(self, wrapped):
+        """Sibling values are added without replacing record fields."""
+        records = list(
+            get_data_iterator(wrapped, record_path="data.item", record_meta=["meta"])
+        )
+        assert records[0]["meta"] == {"source": "api", "page": 1}
+        assert records[1]["meta"] == "own"
+
+    def test_nested_arrays(self):
+        """Each element of an intermediate array is searched."""
+        document = {"pages": [{"rows": [{"id": 1}]}, {"rows": [{"id": 2}]}]}
+        records = select_records([document], "pages.item.rows.item")
+        assert [r["id"] for r in records] == [1, 2]
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_json_file(self, wrapped_file, streaming):
+        """Wrapped .json files yield their nested records."""
+        records = list(
+            get_data_iterator(
+                wrapped_file,
+                streaming=streaming,
+                record_path="data.item",
+                record_meta=["meta", "count"],
+            )
+        )
+        assert [r["id"] for r in records] == [1, 2]
+        assert records[0]["count"] == 2
+        assert records[0]["meta"]["source"] == "api"
+
+    @pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson not installed")
+    def test_streaming_does_not_load_document(self, wrapped_file, monkeypatch):
+        """Streaming selection never loads the whole file."""
+        import transmog.iterators as mod
+
+        def fail(path):
+            raise AssertionError("document loaded")
+
+        monkeypatch.setattr(mod, "_load_json_file", fail)
+        records = list(
+            get_data_iterator(wrapped_file, streaming=True, record_path="data.item")
+        )
+        assert len(records) == 2
+
+    def test_jsonl_lines_are_documents(self, tmp_path):
+        """The path is applied to each line of a JSONL file."""
+        path = tmp_path / "pages.jsonl"
+        path.write_text(
+            '{"page": 1, "data": [{"id": 1}]}\n{"page": 2, "data": [{"id": 2}]}\n'
+        )
+        records = list(
+            get_data_iterator(str(path), record_path="data.item", record_meta=["page"])
+        )
+        assert records == [{"id": 1, "page": 1}, {"id": 2, "page": 2}]
+
+    def test_non_object_records_rejected(self):
+        """Selected values must be JSON objects."""
+        with pytest.raises(ValidationError, match="Expected JSON object"):
+            list(get_data_iterator({"data": [1, 2]}, record_path="data.item"))
+
+    @pytest.mark.parametrize("path", ["", "data..item"])
+    def test_invalid_path(self, path):
+        """Malformed paths are rejected."""
+        with pytest.raises(ConfigurationError):
+            get_data_iterator({"data": []}, record_path=path)
+
+    def test_meta_below_array_rejected(self):
+        """Metadata needs a single holder object per document."""
+        with pytest.raises(ConfigurationError):
+            select_records([{}], "pages.item.rows.item", ["meta"])
+
+
+class _ChunkedStream(io.RawIOBase):
+    """Binary stream returning one chunk per read, like a pipe."""
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        self.reads += 1
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestStreamInput:
+    """Test readable streams as input."""
+
+    def test_binary_jsonl(self):
+        stream = io.BytesIO(b'{"id": 1}\n{"id": 2}\n\n{"id": 3}\n')
+        records = list(get_data_iterator(stream))
+        assert [r["id"] for r in records] == [1, 2, 3]
+        assert not stream.closed
+
+    def test_text_stream_without_buffer(self):
+        stream = io.StringIO('[{"name": "é"}, {"name": "b"}]')
+        assert list(get_data_iterator(stream)) == [{"name": "é"}, {"name": "b"}]
+
+    def test_text_stream_read_through_buffer(self):
+        stream = io.TextIOWrapper(io.BytesIO(b'{"id": 1}\n{"id": 2}\n'))
+        assert len(list(get_data_iterator(stream))) == 2
+
+    def test_pretty_printed_object(self):
+        stream = io.BytesIO(json.dumps({"a": {"b": 1}, "c": [1]}, indent=2).encode())
+        assert list(get_data_iterator(stream)) == [{"a": {"b": 1}, "c": [1]}]
+
+    @pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson not available")
+    def test_array_streamed_incrementally(self):
+        chunks = [b"[", b'{"id": 1},', b'{"id": 2}', b"]"]
+        stream = _ChunkedStream(chunks)
+        records = get_data_iterator(stream, streaming=True, read_buffer_size=4)
+
+        assert next(records) == {"id": 1}
+        assert stream.chunks
+        assert list(records) == [{"id": 2}]
+
+    def test_jsonl_with_long_first_lines(self, monkeypatch):
+        monkeypatch.setattr("transmog.iterators.STREAM_PEEK_SIZE", 8)
+        lines = [{"id": i, "text": "x" * 40} for i in range(8)]
+        chunks = [json.dumps(r).encode() + b"\n" for r in lines]
+        assert list(get_data_iterator(_ChunkedStream(chunks))) == lines
+
+    def test_invalid_line_reports_stream_name(self):
+        stream = io.BytesIO(b'{"id": 1}\n{"id": 2}\n{bad\n')
+        stream.name = "<stdin>"
+        with pytest.raises(ValidationError, match="line 3 in <stdin>"):
+            list(get_data_iterator(stream))
+
+    def test_empty_stream(self):
+        with pytest.raises(ValidationError, match="No JSON content"):
+            list(get_data_iterator(io.BytesIO(b"  \n")))
+
+    def test_subprocess_pipe(self, tmp_path):
+        import subprocess
+        import sys
+
+        import transmog as tm
+
+        script = 'for i in range(500): print(\'{"id": %d, "tags": [{"t": 1}]}\' % i)'
+        with subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", script], stdout=subprocess.PIPE
+        ) as process:
+            tm.flatten_stream(process.stdout, tmp_path, name="data")
+
+        rows = (tmp_path / "data.csv").read_text().splitlines()
+        assert len(rows) == 501
@@ -0,0 +1,150 @@
+"""Tests for per-table manifests of streaming output."""
+
+import json
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.manifest import StreamManifest, TableManifest, update_id_ranges
+
+
+def _records(count):
+    return [
+        {"id": i, "name": f"n{i}", "items": [{"n": j} for j in range(2)]}
+        for i in range(count)
+    ]
+
+
+class TestIdRanges:
+    """Test ID range tracking."""
+
+    def test_ranges_extend_across_batches(self):
+        ranges = {}
+
+        update_id_ranges(ranges, "data", [{"id": 5}, {"id": 3}], {}, "id")
+        update_id_ranges(ranges, "data", [{"id": 9}, {"id": None}], {}, "id")
+
+        assert ranges == {"data": (3, 9)}
+
+    def test_mixed_types_compare_as_strings(self):
+        ranges = {}
+
+        update_id_ranges(ranges, "data", [{"id": 5}, {"id": "a"}], {}, "id")
+
+        assert ranges["data"] == (5, "a")
+
+
+class TestManifestMerge:
+    """Test combining manifests of several runs."""
+
+    def test_tables_are_combined(self):
+        first = StreamManifest(
+            "data",
+            records=2,
+            tables={"data": TableManifest(rows=2, files=["a"], min_id=1, max_id=2)},
+        )
+        second = StreamManifest(
+            "data",
+            records=3,
+            tables={"data": TableManifest(rows=3, files=["b"], min_id=0, max_id=1)},
+        )
+
+        first.merge(second)
+
+        table = first.tables["data"]
+        assert first.records == 5
+        assert (table.rows, table.files) == (5, ["a", "b"])
+        assert (table.min_id, table.max_id) == (0, 2)
+
+
+class TestStreamManifest:
+    """Test manifests built by streaming runs."""
+
+    def test_disabled_by_default(self, tmp_path):
+        files = tm.flatten_stream(_records(3), str(tmp_path))
+
+        assert files.manifest is None
+        assert not (tmp_path / "_manifest.json").exists()
+
+    def test_tables_rows_files_and_schema(self, tmp_path):
+        config = TransmogConfig(id_generation="hash", batch_size=4)
+
+        files = tm.flatten_stream(
+            _records(10), str(tmp_path), name="data", config=config, manifest=True
+        )
+
+        manifest = files.manifest
+        assert files.metrics is None
+        assert manifest.records == 10
+        assert list(manifest.tables) == ["data", "data_items"]
+        main = manifest.tables["data"]
+        assert main.rows == 10
+        assert main.files == [str(tmp_path / "data.csv")]
+        assert main.bytes == (tmp_path / "data.csv").stat().st_size
+        assert {"id", "name", "_id"} <= set(main.schema)
+        assert manifest.tables["data_items"].rows == 20
+        assert main.min_id is not None and main.min_id <= main.max_id
+        assert set(manifest.stages) >= {"read_seconds", "write_seconds"}
+
+    def test_arrow_schema_types(self, tmp_path):
+        pytest.importorskip("pyarrow")
+
+        files = tm.flatten_stream(
+            _records(5),
+            str(tmp_path),
+            name="data",
+            output_format="parquet",
+            manifest=True,
+        )
+
+        schema = files.manifest.tables["data"].schema
+        assert schema["id"] == "int64"
+        assert schema["name"] == "string"
+
+    def test_write_manifest(self, tmp_path):
+        files = tm.flatten_stream(
+            _records(4), str(tmp_path), name="data", write_manifest=True
+        )
+
+        data = json.loads((tmp_path / "_manifest.json").read_text())
+        assert data == json.loads(json.dumps(files.manifest.to_dict()))
+        assert data["tables"]["data"]["rows"] == 4
+        assert tmp_path / "_manifest.json" not in files
+
+    def test_partitioned_manifest(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": i, "region": "eu" if i % 2 else "us"} for i in range(6)],
+            str(tmp_path),
+            name="data",
+            partition_by=["region"],
+            manifest=True,
+        )
+
+        main = files.manifest.tables["data"]
+        assert main.rows == 6
+        assert len(main.files) == 2
+        assert "region" not in main.schema
+
+    def test_sharded_manifest(self, tmp_path):
+        source = tmp_path / "in.jsonl"
+        source.write_text("".join(json.dumps(r) + "\n" for r in _records(20)))
+
+        files = tm.flatten_stream(
+            str(source),
+            str(tmp_path / "out"),
+            name="data",
+            shards=2,
+            write_manifest=True,
+        )
+
+        manifest = files.manifest
+        assert manifest.records == 20
+        assert manifest.tables["data_items"].rows == 40
+        assert len(manifest.tables["data"].files) == 2
+        assert (tmp_path / "out" / "_manifest.json").exists()
+
+    def test_write_manifest_requires_path(self):
+        with pytest.raises(ConfigurationError, match="write_manifest"):
+            tm.StreamSession(None, write_manifest=True)
@@ -0,0 +1,189 @@
+"""Tests for stage-level metrics collection."""
+
+import json
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.iterators import IJSON_BACKEND
+from transmog.metrics import BatchMetrics, StreamMetrics, TableMetrics
+
+
+def _records(count):
+    return [
+        {"id": i, "items": [{"n": j} for j in range(3)], "tags": [{"t": i}]}
+        for i in range(count)
+    ]
+
+
+class TestStreamMetrics:
+    """Test metrics accumulation."""
+
+    def test_add_batch_accumulates(self):
+        metrics = StreamMetrics()
+        metrics.add_batch(
+            BatchMetrics(batch=1, records=2, flatten_seconds=0.5, rows={"a": 2})
+        )
+        metrics.add_batch(
+            BatchMetrics(batch=2, records=3, flatten_seconds=0.25, rows={"a": 3})
+        )
+
+        assert metrics.records == 5
+        assert metrics.batches == 2
+        assert metrics.flatten_seconds == pytest.approx(0.75)
+        assert metrics.tables["a"].rows == 5
+
+    def test_merge_adds_rows_and_bytes(self):
+        first = StreamMetrics(records=2, tables={"a": TableMetrics(rows=2, bytes=10)})
+        second = StreamMetrics(records=4, tables={"a": TableMetrics(rows=4, bytes=5)})
+
+        first.merge(second)
+
+        assert first.records == 6
+        assert first.tables["a"] == TableMetrics(rows=6, bytes=15)
+
+    def test_to_dict_is_json_serializable(self):
+        metrics = StreamMetrics(records=4, tables={"a": TableMetrics(rows=8)})
+
+        data = json.loads(json.dumps(metrics.to_dict()))
+
+        assert data["tables"]["a"]["fan_out"] == 2.0
+
+
+class TestFlattenMetrics:
+    """Test metrics of in-memory flattening."""
+
+    def test_disabled_by_default(self):
+        result = tm.flatten(_records(3), name="data")
+
+        assert result.metrics is None
+
+    def test_rows_per_table(self):
+        result = tm.flatten(_records(10), name="data", collect_metrics=True)
+
+        metrics = result.metrics
+        assert metrics is not None
+        assert metrics.records == 10
+        assert metrics.tables["data"].rows == 10
+        assert metrics.tables["data_items"].rows == 30
+        assert metrics.fan_out["data_items"] == 3.0
+        assert metrics.flatten_seconds > 0
+
+    def test_callback_per_batch(self):
+        batches = []
+        config = TransmogConfig(batch_size=4)
+
+        tm.flatten(
+            _records(10), name="data", config=config, metrics_callback=batches.append
+        )
+
+        assert [batch.records for batch in batches] == [4, 4, 2]
+        assert [batch.batch for batch in batches] == [1, 2, 3]
+        assert batches[0].rows["data_items"] == 12
+        assert batches[0].child_rows == 16
+
+
+class TestStreamingMetrics:
+    """Test metrics of streaming runs."""
+
+    def test_disabled_by_default(self, tmp_path):
+        files = tm.flatten_stream(_records(3), str(tmp_path), name="data")
+
+        assert isinstance(files, tm.StreamResult)
+        assert files.metrics is None
+
+    def test_rows_and_bytes_per_table(self, tmp_path):
+        files = tm.flatten_stream(
+            _records(10), str(tmp_path), name="data", collect_metrics=True
+        )
+
+        metrics = files.metrics
+        assert metrics is not None
+        assert metrics.records == 10
+        assert metrics.tables["data"].rows == 10
+        assert metrics.tables["data_items"].rows == 30
+        assert metrics.tables["data"].bytes == (tmp_path / "data.csv").stat().st_size
+        assert metrics.write_seconds > 0
+        assert metrics.elapsed_seconds >= metrics.write_seconds
+
+    def test_json_backend_reported(self, tmp_path):
+        files = tm.flatten_stream(
+            _records(2), str(tmp_path), name="data", collect_metrics=True
+        )
+
+        assert files.metrics.json_backend == IJSON_BACKEND
+        assert files.metrics.to_dict()["json_backend"] == IJSON_BACKEND
+
+    def test_callback_reports_buffered_rows(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        batches = []
+        config = TransmogConfig(batch_size=5)
+
+        tm.flatten_stream(
+            _records(10),
+            str(tmp_path),
+            name="data",
+            output_format="parquet",
+            config=config,
+            metrics_callback=batches.append,
+        )
+
+        assert len(batches) == 2
+        assert all(batch.write_seconds > 0 for batch in batches)
+        assert batches[-1].buffered_rows > 0
+
+    def test_writer_seconds_per_format(self, tmp_path):
+        pytest.importorskip("pyarrow")
+
+        files = tm.flatten_stream(
+            _records(10),
+            str(tmp_path),
+            name="data",
+            output_format=["csv", "parquet"],
+            collect_metrics=True,
+        )
+
+        assert set(files.metrics.writer_seconds) == {"csv", "parquet"}
+        assert files.metrics.tables["data"].bytes > (
+            (tmp_path / "data.csv").stat().st_size
+        )
+
+    def test_session_metrics(self, tmp_path):
+        session = tm.StreamSession(str(tmp_path), name="data", collect_metrics=True)
+        session.feed_many(_records(5))
+        session.close()
+
+        assert session.metrics is not None
+        assert session.metrics.records == 5
+        assert session.metrics.close_seconds >= 0
+
+
+class TestShardedMetrics:
+    """Test metrics merged across worker shards."""
+
+    def test_shard_metrics_are_merged(self, tmp_path):
+        source = tmp_path / "in.jsonl"
+        source.write_text("".join(json.dumps(r) + "\n" for r in _records(20)))
+
+        files = tm.flatten_stream(
+            str(source),
+            str(tmp_path / "out"),
+            name="data",
+            shards=2,
+            collect_metrics=True,
+        )
+
+        assert files.metrics.records == 20
+        assert files.metrics.tables["data_items"].rows == 60
+        assert files.metrics.tables["data"].bytes > 0
+
+    def test_callback_with_shards_rejected(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="metrics_callback"):
+            tm.flatten_stream(
+                _records(2),
+                str(tmp_path),
+                shards=2,
+                metrics_callback=lambda batch: None,
+            )
@@ -0,0 +1,176 @@
+"""Tests for multi-process sharded streaming."""
+
+import csv
+import json
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.iterators import get_jsonl_range_iterator, split_jsonl_file
+from transmog.sharding import plan_shards
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+def _write_jsonl(path, ids):
+    path.write_text(
+        "".join(json.dumps({"id": i, "tags": [{"t": i}]}) + "\n" for i in ids)
+    )
+    return path
+
+
+class TestJsonlSplitting:
+    """Test byte-range splitting of JSONL files."""
+
+    @pytest.mark.parametrize("parts", [1, 2, 3, 7, 50])
+    def test_ranges_cover_every_record_once(self, tmp_path, parts):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(23))
+
+        ranges = split_jsonl_file(str(source), parts)
+        ids = [
+            record["id"]
+            for start, end in ranges
+            for record in get_jsonl_range_iterator(str(source), start, end)
+        ]
+
+        assert len(ranges) <= parts
+        assert ids == list(range(23))
+
+    def test_ranges_start_on_line_boundaries(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(10))
+        content = source.read_bytes()
+
+        for start, _end in split_jsonl_file(str(source), 4):
+            assert start == 0 or content[start - 1 : start] == b"\n"
+
+
+class TestShardPlanning:
+    """Test assignment of inputs to shards."""
+
+    def test_files_balanced_by_size(self, tmp_path):
+        big = _write_jsonl(tmp_path / "big.jsonl", range(100))
+        small = [_write_jsonl(tmp_path / f"s{n}.jsonl", range(10)) for n in range(3)]
+
+        plan = plan_shards([big, *small], 2)
+
+        assert [task[0] for task in plan[0]] == [str(big)]
+        assert len(plan[1]) == 3
+
+    def test_directory_input(self, tmp_path):
+        for n in range(3):
+            _write_jsonl(tmp_path / f"s{n}.jsonl", range(10))
+
+        plan = plan_shards(tmp_path, 2)
+
+        assert sorted(task[0] for tasks in plan for task in tasks) == [
+            str(tmp_path / f"s{n}.jsonl") for n in range(3)
+        ]
+
+    def test_in_memory_input_rejected(self):
+        with pytest.raises(ConfigurationError):
+            plan_shards([{"id": 1}], 2)
+
+
+class TestFlattenStreamShards:
+    """Test flatten_stream(shards=N)."""
+
+    def test_jsonl_file_sharded(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(40))
+        out = tmp_path / "out"
+
+        files = tm.flatten_stream(
+            source,
+            out,
+            name="events",
+            shards=2,
+            config=TransmogConfig(batch_size=5),
+        )
+
+        relative = sorted(str(p.relative_to(out)) for p in files)
+        assert relative == [
+            "events/part-0.csv",
+            "events/part-1.csv",
+            "events_tags/part-0.csv",
+            "events_tags/part-1.csv",
+        ]
+        ids = sorted(
+            int(row["id"])
+            for part in ("part-0.csv", "part-1.csv")
+            for row in _read_csv(out / "events" / part)
+        )
+        assert ids == list(range(40))
+
+    def test_file_list_with_partitions(self, tmp_path):
+        sources = [
+            _write_jsonl(tmp_path / "a.jsonl", range(0, 5)),
+            _write_jsonl(tmp_path / "b.jsonl", range(5, 10)),
+        ]
+        progress: list[int] = []
+
+        files = tm.flatten_stream(
+            sources,
+            tmp_path / "out",
+            name="events",
+            output_format="parquet",
+            shards=2,
+            partition_by=["id"],
+            progress_callback=lambda processed, _total: progress.append(processed),
+        )
+
+        assert len([p for p in files if p.parts[-3] == "events"]) == 10
+        assert {p.name for p in files} == {"part-0.parquet", "part-1.parquet"}
+        assert sorted(progress) == [5, 10]
+
+    def test_worker_errors_propagate(self, tmp_path):
+        source = tmp_path / "bad.jsonl"
+        source.write_text('{"id": 1}\nnot json\n')
+
+        with pytest.raises(tm.ValidationError):
+            tm.flatten_stream(source, tmp_path / "out", shards=1)
+
+    def test_checkpoints_not_supported(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(3))
+
+        with pytest.raises(ConfigurationError):
+            tm.flatten_stream(
+                source,
+                tmp_path / "out",
+                shards=2,
+                checkpoint_path=tmp_path / "run.ckpt",
+            )
+
+
+class TestParseWorkers:
+    """Test parallel parsing with flattening in the calling process."""
+
+    def test_output_matches_sequential_run(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(50))
+        config = TransmogConfig(id_generation="hash", batch_size=7, time_field=None)
+
+        tm.flatten_stream(source, tmp_path / "seq", name="events", config=config)
+        tm.flatten_stream(
+            source, tmp_path / "par", name="events", config=config, parse_workers=2
+        )
+
+        for table in ("events.csv", "events_tags.csv"):
+            assert _read_csv(tmp_path / "par" / table) == _read_csv(
+                tmp_path / "seq" / table
+            )
+
+    def test_flatten_with_parse_workers(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(20))
+
+        result = tm.flatten(str(source), name="events", parse_workers=2)
+
+        assert [row["id"] for row in result.main] == list(range(20))
+
+    def test_not_combined_with_shards(self, tmp_path):
+        source = _write_jsonl(tmp_path / "in.jsonl", range(3))
+
+        with pytest.raises(ConfigurationError, match="parse_workers"):
+            tm.flatten_stream(source, tmp_path / "out", shards=2, parse_workers=2)
@@ -0,0 +1,140 @@
+"""Tests for the push-based StreamSession."""
+
+import csv
+import threading
+import time
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError, OutputError
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+class TestStreamSessionFeeding:
+    """Test feeding records through a session."""
+
+    def test_feed_and_close(self, tmp_path):
+        session = tm.StreamSession(tmp_path, name="events")
+        for i in range(5):
+            session.feed({"id": i, "items": [{"sku": f"s{i}"}]})
+        files = session.close()
+
+        assert sorted(p.name for p in files) == ["events.csv", "events_items.csv"]
+        assert len(_read_csv(tmp_path / "events.csv")) == 5
+        assert len(_read_csv(tmp_path / "events_items.csv")) == 5
+        assert session.closed
+
+    def test_feed_many(self, tmp_path):
+        with tm.StreamSession(tmp_path, name="rows") as session:
+            session.feed_many({"id": i} for i in range(12))
+
+        assert len(_read_csv(tmp_path / "rows.csv")) == 12
+        assert session.records_processed == 12
+
+    def test_size_based_auto_flush(self, tmp_path):
+        calls = []
+        session = tm.StreamSession(
+            tmp_path,
+            config=TransmogConfig(batch_size=3),
+            progress_callback=lambda p, t: calls.append(p),
+        )
+        session.feed_many({"id": i} for i in range(7))
+
+        assert calls == [3, 6]
+        assert session.batch_count == 2
+        session.close()
+        assert calls == [3, 6, 7]
+
+    def test_explicit_flush(self, tmp_path):
+        session = tm.StreamSession(tmp_path, config=TransmogConfig(batch_size=100))
+        session.feed({"id": 1})
+        assert session.records_processed == 0
+
+        session.flush()
+
+        assert session.records_processed == 1
+        session.close()
+
+    def test_time_based_auto_flush(self, tmp_path):
+        flushed = threading.Event()
+        session = tm.StreamSession(
+            tmp_path,
+            config=TransmogConfig(batch_size=1000),
+            flush_interval=0.05,
+            progress_callback=lambda p, t: flushed.set(),
+        )
+        session.feed({"id": 1})
+
+        assert flushed.wait(2.0)
+        assert session.records_processed == 1
+        session.close()
+
+    def test_expired_batch_flushed_on_feed(self, tmp_path):
+        session = tm.StreamSession(
+            tmp_path, config=TransmogConfig(batch_size=1000), flush_interval=60
+        )
+        session.feed({"id": 1})
+        session._oldest -= 120
+        session.feed({"id": 2})
+
+        assert session.records_processed == 2
+        session.close()
+
+    def test_timestamp_shared_across_batches(self, tmp_path):
+        session = tm.StreamSession(
+            tmp_path, name="rows", config=TransmogConfig(batch_size=1)
+        )
+        session.feed({"id": 1})
+        time.sleep(0.01)
+        session.feed({"id": 2})
+        session.close()
+
+        rows = _read_csv(tmp_path / "rows.csv")
+        assert rows[0]["_timestamp"] == rows[1]["_timestamp"]
+
+
+class TestStreamSessionLifecycle:
+    """Test session lifecycle and validation."""
+
+    def test_feed_after_close_raises(self, tmp_path):
+        session = tm.StreamSession(tmp_path)
+        session.close()
+
+        with pytest.raises(OutputError):
+            session.feed({"id": 1})
+
+    def test_close_is_idempotent(self, tmp_path):
+        session = tm.StreamSession(tmp_path)
+        session.feed({"id": 1})
+        first = session.close()
+
+        assert session.close() == first
+
+    def test_context_manager_discards_buffer_on_error(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with tm.StreamSession(tmp_path, name="rows") as session:
+                session.feed({"id": 1})
+                raise RuntimeError("boom")
+
+        assert session.closed
+        assert session.records_processed == 0
+
+    def test_invalid_flush_interval(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            tm.StreamSession(tmp_path, flush_interval=0)
+
+    def test_timer_errors_surface_on_next_call(self, tmp_path):
+        config = TransmogConfig(batch_size=1000, id_generation="natural")
+        session = tm.StreamSession(tmp_path, config=config, flush_interval=0.02)
+        session.feed({"name": "missing natural id"})
+        time.sleep(0.2)
+
+        with pytest.raises(tm.ValidationError):
+            session.feed({"id": 2})
+        session._abort()
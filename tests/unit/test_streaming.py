@@ -710,3 +710,83 @@ class TestStreamProcessingAvro:
         assert len(records) == 3
         names = {r["name"] for r in records}
         assert names == {"Alice", "Bob", "Charlie"}
+
+
+class TestMaxBatchLatency:
+    """Test time-bounded flushing in stream_process."""
+
+    def test_partial_batch_flushed_during_slow_input(self, tmp_path):
+        """A trickle of records is flushed before the batch fills up."""
+        import threading
+
+        flushed = threading.Event()
+        observed: list[bool] = []
+
+        def trickle():
+            yield {"id": 1}
+            observed.append(flushed.wait(2.0))
+            yield {"id": 2}
+
+        stream_process(
+            config=TransmogConfig(batch_size=1000),
+            data=trickle(),
+            entity_name="events",
+            output_format="csv",
+            output_destination=str(tmp_path),
+            progress_callback=lambda p, t: flushed.set(),
+            max_batch_latency=0.05,
+        )
+
+        assert observed == [True]
+        with open(tmp_path / "events.csv") as f:
+            assert len(list(csv.DictReader(f))) == 2
+
+    def test_latency_flush_starts_new_row_group(self, tmp_path):
+        """Writer buffers are flushed, producing a row group per flush."""
+        import time
+
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        def trickle():
+            for i in range(3):
+                yield {"id": i}
+                time.sleep(0.2)
+
+        stream_process(
+            config=TransmogConfig(batch_size=1000),
+            data=trickle(),
+            entity_name="events",
+            output_format="parquet",
+            output_destination=str(tmp_path),
+            max_batch_latency=0.05,
+        )
+
+        metadata = pq.ParquetFile(tmp_path / "events.parquet").metadata
+        assert metadata.num_rows == 3
+        assert metadata.num_row_groups == 3
+
+    def test_without_latency_single_row_group(self, tmp_path):
+        """Default behavior buffers until batch size or close."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        stream_process(
+            config=TransmogConfig(batch_size=1),
+            data=[{"id": i} for i in range(3)],
+            entity_name="events",
+            output_format="parquet",
+            output_destination=str(tmp_path),
+        )
+
+        metadata = pq.ParquetFile(tmp_path / "events.parquet").metadata
+        assert metadata.num_row_groups == 1
+
+    def test_invalid_latency(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            stream_process(
+                config=TransmogConfig(),
+                data=[{"id": 1}],
+                entity_name="events",
+                output_format="csv",
+                output_destination=str(tmp_path),
+                max_batch_latency=0,
+            )
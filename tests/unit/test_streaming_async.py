@@ -0,0 +1,130 @@
+"""Tests for asyncio streaming via flatten_stream_async()."""
+
+import asyncio
+import csv
+import json
+import threading
+import time
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.streaming import stream_process_async
+
+
+async def _agen(records, delay: float = 0.0):
+    for record in records:
+        if delay:
+            await asyncio.sleep(delay)
+        yield record
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+class TestFlattenStreamAsync:
+    """Test flatten_stream_async() with async and sync inputs."""
+
+    def test_async_iterable_input(self, tmp_path):
+        records = [{"id": i, "tags": [{"t": i}]} for i in range(25)]
+        config = TransmogConfig(batch_size=4)
+
+        files = asyncio.run(
+            tm.flatten_stream_async(
+                _agen(records), tmp_path, name="events", config=config
+            )
+        )
+
+        names = sorted(p.name for p in files)
+        assert names == ["events.csv", "events_tags.csv"]
+        main = _read_csv(tmp_path / "events.csv")
+        assert [row["id"] for row in main] == [str(i) for i in range(25)]
+        assert len(_read_csv(tmp_path / "events_tags.csv")) == 25
+
+    def test_sync_inputs_are_accepted(self, tmp_path):
+        data_file = tmp_path / "input.jsonl"
+        data_file.write_text("\n".join(json.dumps({"id": i}) for i in range(7)))
+
+        files = asyncio.run(
+            tm.flatten_stream_async(str(data_file), tmp_path / "out", name="rows")
+        )
+
+        assert len(_read_csv(files[0])) == 7
+
+    def test_progress_callback_per_batch(self, tmp_path):
+        calls: list[tuple[int, int | None]] = []
+        config = TransmogConfig(batch_size=3)
+
+        asyncio.run(
+            tm.flatten_stream_async(
+                _agen([{"id": i} for i in range(10)]),
+                tmp_path,
+                config=config,
+                progress_callback=lambda p, t: calls.append((p, t)),
+            )
+        )
+
+        assert calls == [(3, None), (6, None), (9, None), (10, None)]
+
+    def test_progress_callback_runs_on_loop_thread(self, tmp_path):
+        loop_thread = threading.get_ident()
+        callback_threads: set[int] = set()
+
+        async def main():
+            records = [{"id": i} for i in range(6)]
+            return await stream_process_async(
+                config=TransmogConfig(batch_size=2),
+                data=_agen(records),
+                entity_name="rows",
+                output_format="csv",
+                output_destination=str(tmp_path),
+                progress_callback=lambda p, t: callback_threads.add(
+                    threading.get_ident()
+                ),
+            )
+
+        asyncio.run(main())
+
+        assert callback_threads == {loop_thread}
+        assert len(_read_csv(tmp_path / "rows.csv")) == 6
+
+    def test_event_loop_stays_responsive(self, tmp_path):
+        ticks: list[float] = []
+
+        async def heartbeat(stop: asyncio.Event):
+            while not stop.is_set():
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        async def main():
+            stop = asyncio.Event()
+            beat = asyncio.create_task(heartbeat(stop))
+            records = [{"id": i, "payload": {"x": "y" * 50}} for i in range(20000)]
+            await tm.flatten_stream_async(
+                records,
+                tmp_path,
+                config=TransmogConfig(batch_size=2000),
+            )
+            stop.set()
+            await beat
+
+        asyncio.run(main())
+
+        gaps = [b - a for a, b in zip(ticks, ticks[1:], strict=False)]
+        assert len(ticks) > 2
+        assert max(gaps) < 1.0
+
+    def test_writer_errors_propagate(self, tmp_path):
+        records = [{"id": 1}, {"id": 2, "extra": "field"}]
+
+        with pytest.raises(tm.TransmogError):
+            asyncio.run(
+                tm.flatten_stream_async(
+                    _agen(records),
+                    tmp_path,
+                    config=TransmogConfig(batch_size=1),
+                )
+            )
@@ -0,0 +1,196 @@
+"""Tests for Chrome trace-event export."""
+
+import gc
+import json
+import threading
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.tracing import Tracer
+
+
+def _records(count):
+    return [{"id": i, "items": [{"n": j} for j in range(2)]} for i in range(count)]
+
+
+def _spans(trace, name=None):
+    return [
+        event
+        for event in trace["traceEvents"]
+        if event["ph"] == "X" and (name is None or event["name"] == name)
+    ]
+
+
+class TestTracer:
+    """Test the span recorder."""
+
+    def test_span_records_complete_event(self):
+        tracer = Tracer()
+
+        with tracer.span("work", rows=3) as args:
+            args["extra"] = True
+
+        (event,) = _spans(tracer.to_dict())
+        assert event["name"] == "work"
+        assert event["dur"] >= 0
+        assert event["args"] == {"rows": 3, "extra": True}
+
+    def test_thread_is_named_once(self):
+        tracer = Tracer()
+
+        with tracer.span("a"):
+            pass
+        with tracer.span("b"):
+            pass
+
+        metadata = [e for e in tracer.events if e["ph"] == "M"]
+        assert len(metadata) == 1
+        assert metadata[0]["name"] == "thread_name"
+
+    def test_gc_passes_recorded_while_started(self):
+        tracer = Tracer()
+        tracer.start()
+        try:
+            gc.collect()
+        finally:
+            tracer.stop()
+        gc.collect()
+
+        assert len(_spans(tracer.to_dict(), "gc")) == 1
+        assert tracer._on_gc not in gc.callbacks
+
+    def test_gc_during_append_does_not_deadlock(self):
+        tracer = Tracer()
+        tracer.start()
+        done = threading.Event()
+
+        def collect_under_lock():
+            with tracer._lock:
+                gc.collect()
+            done.set()
+
+        thread = threading.Thread(target=collect_under_lock, daemon=True)
+        try:
+            thread.start()
+            assert done.wait(timeout=5)
+        finally:
+            tracer.stop()
+
+        assert len(_spans(tracer.to_dict(), "gc")) == 1
+
+    def test_save_writes_json(self, tmp_path):
+        tracer = Tracer()
+        with tracer.span("work"):
+            pass
+
+        tracer.save(tmp_path / "trace.json")
+
+        data = json.loads((tmp_path / "trace.json").read_text())
+        assert data["displayTimeUnit"] == "ms"
+        assert len(_spans(data, "work")) == 1
+
+
+class TestStreamTracing:
+    """Test traces of streaming runs."""
+
+    def test_batch_lifecycle_spans(self, tmp_path):
+        trace_path = tmp_path / "trace.json"
+
+        tm.flatten_stream(
+            _records(10),
+            str(tmp_path / "out"),
+            name="data",
+            config=TransmogConfig(batch_size=4),
+            trace_path=str(trace_path),
+        )
+
+        trace = json.loads(trace_path.read_text())
+        assert len(_spans(trace, "read")) == 3
+        assert len(_spans(trace, "process_record_batch")) == 3
+        assert len(_spans(trace, "write_main_records")) == 3
+        child_writes = _spans(trace, "write_child_records")
+        assert {e["args"]["table"] for e in child_writes} == {"data_items"}
+        assert len(_spans(trace, "write_rows")) == 6
+        assert len(_spans(trace, "close")) == 1
+
+    def test_arrow_buffer_writes_traced(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        trace_path = tmp_path / "trace.json"
+
+        tm.flatten_stream(
+            _records(10),
+            str(tmp_path / "out"),
+            name="data",
+            output_format="parquet",
+            trace_path=trace_path,
+        )
+
+        trace = json.loads(trace_path.read_text())
+        tables = {e["args"]["table"] for e in _spans(trace, "write_buffer")}
+        assert tables == {"main", "data_items"}
+
+    def test_avro_block_writes_traced(self, tmp_path):
+        pytest.importorskip("fastavro")
+        trace_path = tmp_path / "trace.json"
+
+        tm.flatten_stream(
+            _records(10),
+            str(tmp_path / "out"),
+            name="data",
+            output_format="avro",
+            trace_path=trace_path,
+        )
+
+        trace = json.loads(trace_path.read_text())
+        assert len(_spans(trace, "write_block")) == 2
+
+    def test_tee_writers_traced_on_worker_threads(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        trace_path = tmp_path / "trace.json"
+
+        tm.flatten_stream(
+            _records(10),
+            str(tmp_path / "out"),
+            name="data",
+            output_format=["csv", "parquet"],
+            trace_path=trace_path,
+        )
+
+        trace = json.loads(trace_path.read_text())
+        threads = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+        assert any(name.startswith("transmog-tee") for name in threads)
+        assert _spans(trace, "write_rows")
+        assert _spans(trace, "write_buffer")
+
+    def test_trace_saved_when_run_fails(self, tmp_path):
+        trace_path = tmp_path / "trace.json"
+
+        def records():
+            yield {"id": 1}
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            tm.flatten_stream(
+                records(), str(tmp_path / "out"), trace_path=str(trace_path)
+            )
+
+        assert trace_path.exists()
+
+    def test_sharded_trace_has_track_per_worker(self, tmp_path):
+        source = tmp_path / "in.jsonl"
+        source.write_text("".join(json.dumps(r) + "\n" for r in _records(20)))
+        trace_path = tmp_path / "trace.json"
+
+        tm.flatten_stream(
+            str(source),
+            str(tmp_path / "out"),
+            name="data",
+            shards=2,
+            trace_path=str(trace_path),
+        )
+
+        trace = json.loads(trace_path.read_text())
+        pids = {e["pid"] for e in _spans(trace, "process_record_batch")}
+        assert len(pids) == 2
@@ -706,6 +706,19 @@ class TestAvroStreamingWriter:
         assert "file-like object" in str(exc_info.value).lower()
         writer.close()
 
+    def test_checkpoint_syncs_files(self, avro_temp_dir):
+        """Checkpoint state syncs every table file before recording sizes."""
+        writer = AvroStreamingWriter(destination=str(avro_temp_dir), entity_name="e")
+        writer.write_main_records([{"id": "1"}])
+        writer.write_child_records("e_items", [{"id": "c1", "parent_id": "1"}])
+
+        with patch("transmog.writers.avro.os.fsync") as fsync:
+            state = writer.checkpoint_state()
+        writer.close()
+
+        assert fsync.call_count == 2
+        assert state["sizes"]["main"] == (avro_temp_dir / "e.avro").stat().st_size
+
 
 @pytest.mark.skipif(not AVRO_AVAILABLE, reason="fastavro not available")
 class TestAvroWriterErrorHandling:
@@ -0,0 +1,148 @@
+"""Tests for bounding the number of open table files in streaming writers."""
+
+import csv
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.writers import create_streaming_writer
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+def _data_columns(rows):
+    return [{k: v for k, v in row.items() if not k.startswith("_")} for row in rows]
+
+
+def _wide_records(count: int, tables: int):
+    return [
+        {"id": i, **{f"t{n}": [{"v": i * tables + n}] for n in range(tables)}}
+        for i in range(count)
+    ]
+
+
+class TestCsvOpenFileLimit:
+    """Test max_open_files for the CSV streaming writer."""
+
+    def test_open_files_stay_bounded(self, tmp_path):
+        writer = create_streaming_writer(
+            "csv", destination=str(tmp_path), max_open_files=2
+        )
+        peak = 0
+        for batch in range(3):
+            for n in range(5):
+                writer.write_child_records(f"table_{n}", [{"batch": batch, "n": n}])
+                peak = max(peak, len(writer.file_objects))
+        files = writer.close()
+
+        assert peak == 2
+        assert len(files) == 5
+
+    def test_suspended_tables_append_without_header(self, tmp_path):
+        writer = create_streaming_writer(
+            "csv", destination=str(tmp_path), max_open_files=1
+        )
+        for batch in range(3):
+            writer.write_child_records("a", [{"batch": batch}])
+            writer.write_child_records("b", [{"batch": batch}])
+        writer.close()
+
+        assert [row["batch"] for row in _read_csv(tmp_path / "a.csv")] == [
+            "0",
+            "1",
+            "2",
+        ]
+        assert (tmp_path / "b.csv").read_text().count("batch") == 1
+
+    def test_flatten_stream_output_unchanged(self, tmp_path):
+        records = _wide_records(12, tables=6)
+        config = TransmogConfig(batch_size=4)
+
+        bounded = tm.flatten_stream(
+            records, tmp_path / "bounded", config=config, max_open_files=2
+        )
+        unbounded = tm.flatten_stream(records, tmp_path / "unbounded", config=config)
+
+        assert sorted(p.name for p in bounded) == sorted(p.name for p in unbounded)
+        for path in bounded:
+            expected = _read_csv(tmp_path / "unbounded" / path.name)
+            assert _data_columns(_read_csv(path)) == _data_columns(expected)
+
+
+class TestArrowOpenFileLimit:
+    """Test max_open_files for the Parquet and ORC streaming writers."""
+
+    @pytest.mark.parametrize("output_format", ["parquet", "orc"])
+    def test_suspended_tables_resume_in_new_files(self, tmp_path, output_format):
+        writer = create_streaming_writer(
+            output_format, destination=str(tmp_path), max_open_files=2
+        )
+        peak = 0
+        for batch in range(2):
+            for n in range(3):
+                writer.write_child_records(f"table_{n}", [{"batch": batch, "n": n}])
+                peak = max(peak, len(writer.writers) + len(writer._active_tables))
+        files = writer.close()
+
+        assert peak <= 4
+        ext = f".{output_format}"
+        names = sorted(p.name for p in files)
+        assert names == sorted(
+            [f"table_{n}-00001{ext}" for n in range(3)]
+            + [f"table_{n}-00002{ext}" for n in range(3)]
+        )
+
+    def test_all_rows_written(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        files = tm.flatten_stream(
+            _wide_records(20, tables=5),
+            tmp_path,
+            output_format="parquet",
+            config=TransmogConfig(batch_size=5),
+            max_open_files=2,
+        )
+
+        def rows(prefix):
+            return sum(
+                pq.read_table(p).num_rows
+                for p in files
+                if p.name.split(".")[0].split("-")[0] == prefix
+            )
+
+        main_rows = rows("data")
+        child_rows = rows("data_t0")
+        assert main_rows == 20
+        assert child_rows == 20
+        assert all(pq.read_table(p).num_rows for p in files)
+
+    def test_all_files_match_numbered_pattern(self, tmp_path):
+        writer = create_streaming_writer(
+            "parquet", destination=str(tmp_path), max_open_files=1
+        )
+        for batch in range(2):
+            writer.write_child_records("a", [{"v": batch}])
+            writer.write_child_records("b", [{"v": batch}])
+        files = writer.close()
+
+        assert sorted(files) == sorted(tmp_path.glob("a-*.parquet")) + sorted(
+            tmp_path.glob("b-*.parquet")
+        )
+        assert len(files) == 4
+        assert writer.get_table_files()["a"] == sorted(tmp_path.glob("a-*.parquet"))
+
+
+class TestOpenFileLimitConfiguration:
+    """Test max_open_files validation."""
+
+    @pytest.mark.parametrize("output_format", ["csv", "parquet"])
+    def test_invalid_limit(self, tmp_path, output_format):
+        with pytest.raises(ConfigurationError):
+            create_streaming_writer(
+                output_format, destination=str(tmp_path), max_open_files=0
+            )
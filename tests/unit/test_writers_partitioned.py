@@ -0,0 +1,252 @@
+"""Tests for Hive-style partitioned streaming output."""
+
+import csv
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError, OutputError, ValidationError
+from transmog.writers import PartitionedStreamingWriter, create_partitioned_writer
+from transmog.writers.partitioned import (
+    HIVE_DEFAULT_PARTITION,
+    _format_partition_value,
+)
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def orders():
+    return [
+        {"id": 1, "region": "eu", "items": [{"sku": "a"}, {"sku": "b"}]},
+        {"id": 2, "region": "us", "items": [{"sku": "c"}]},
+        {"id": 3, "region": "eu", "items": [{"sku": "d"}]},
+        {"id": 4, "items": [{"sku": "e"}]},
+    ]
+
+
+class TestPartitionValueFormatting:
+    """Test partition directory value encoding."""
+
+    def test_plain_values(self):
+        assert _format_partition_value("eu") == "eu"
+        assert _format_partition_value(2024) == "2024"
+        assert _format_partition_value(True) == "true"
+
+    def test_null_values_use_default_partition(self):
+        assert _format_partition_value(None) == HIVE_DEFAULT_PARTITION
+        assert _format_partition_value("") == HIVE_DEFAULT_PARTITION
+
+    def test_path_characters_are_escaped(self):
+        assert _format_partition_value("a/b=c") == "a%2Fb%3Dc"
+
+
+class TestFlattenStreamPartitioning:
+    """Test partition_by in flatten_stream()."""
+
+    def test_layout_and_child_routing(self, tmp_path, orders):
+        files = tm.flatten_stream(
+            orders,
+            tmp_path,
+            name="orders",
+            partition_by=["region"],
+            config=TransmogConfig(batch_size=2),
+        )
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == [
+            f"orders/region={HIVE_DEFAULT_PARTITION}/part-0.csv",
+            "orders/region=eu/part-0.csv",
+            "orders/region=us/part-0.csv",
+            f"orders_items/region={HIVE_DEFAULT_PARTITION}/part-0.csv",
+            "orders_items/region=eu/part-0.csv",
+            "orders_items/region=us/part-0.csv",
+        ]
+
+        eu_main = _read_csv(tmp_path / "orders/region=eu/part-0.csv")
+        eu_items = _read_csv(tmp_path / "orders_items/region=eu/part-0.csv")
+        assert [row["id"] for row in eu_main] == ["1", "3"]
+        assert "region" not in eu_main[0]
+        assert {row["sku"] for row in eu_items} == {"a", "b", "d"}
+        eu_ids = {row["_id"] for row in eu_main}
+        assert {row["_parent_id"] for row in eu_items} <= eu_ids
+
+    def test_multiple_partition_columns(self, tmp_path):
+        data = [
+            {"year": 2024, "region": "eu", "v": 1},
+            {"year": 2025, "region": "eu", "v": 2},
+        ]
+
+        tm.flatten_stream(data, tmp_path, name="t", partition_by=["year", "region"])
+
+        assert (tmp_path / "t/year=2024/region=eu/part-0.csv").exists()
+        assert (tmp_path / "t/year=2025/region=eu/part-0.csv").exists()
+
+    def test_nested_partition_column(self, tmp_path):
+        data = [{"meta": {"region": "eu"}, "v": 1}]
+
+        tm.flatten_stream(data, tmp_path, name="t", partition_by=["meta_region"])
+
+        rows = _read_csv(tmp_path / "t/meta_region=eu/part-0.csv")
+        assert rows[0]["v"] == "1"
+
+    def test_parquet_partitions_readable_as_dataset(self, tmp_path, orders):
+        ds = pytest.importorskip("pyarrow.dataset")
+
+        tm.flatten_stream(
+            orders,
+            tmp_path,
+            name="orders",
+            output_format="parquet",
+            partition_by=["region"],
+        )
+
+        dataset = ds.dataset(tmp_path / "orders", format="parquet", partitioning="hive")
+        table = dataset.to_table(filter=ds.field("region") == "eu")
+        assert sorted(table.column("id").to_pylist()) == [1, 3]
+
+    def test_mixed_type_values(self, tmp_path):
+        data = [{"k": 1, "v": 1}, {"k": "1", "v": 2}, {"k": True, "v": 3}]
+
+        files = tm.flatten_stream(data, tmp_path, name="t", partition_by=["k"])
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == ["t/k=1/part-0.csv", "t/k=true/part-0.csv"]
+        assert [r["v"] for r in _read_csv(tmp_path / "t/k=1/part-0.csv")] == ["1", "2"]
+
+    @pytest.mark.parametrize("output_format", ["parquet", "orc"])
+    def test_partitions_share_one_schema(self, tmp_path, output_format):
+        ds = pytest.importorskip("pyarrow.dataset")
+        data = [
+            {"region": "eu", "v": "abc", "f": 1.5},
+            {"region": "us", "v": 5, "f": 5},
+            {"region": "ap", "f": None, "extra": True},
+            {"region": "eu", "v": "def", "f": 2},
+        ]
+
+        tm.flatten_stream(
+            data,
+            tmp_path,
+            name="t",
+            output_format=output_format,
+            partition_by=["region"],
+            config=TransmogConfig(batch_size=1),
+            max_open_files=1,
+        )
+
+        dataset = ds.dataset(tmp_path / "t", format=output_format, partitioning="hive")
+        schemas = {
+            str(ds.dataset(path, format=output_format).schema.field("v").type)
+            for path in dataset.files
+        }
+        assert schemas == {"string"}
+        table = dataset.to_table(columns=["region", "v", "f"])
+        rows = sorted(table.to_pylist(), key=lambda row: (row["region"], row["f"] or 0))
+        assert rows == [
+            {"region": "ap", "v": None, "f": None},
+            {"region": "eu", "v": "abc", "f": 1.5},
+            {"region": "eu", "v": "def", "f": 2.0},
+            {"region": "us", "v": "5", "f": 5.0},
+        ]
+        assert len(dataset.files) == 4
+
+    def test_avro_partitions_share_one_schema(self, tmp_path):
+        fastavro = pytest.importorskip("fastavro")
+        data = [{"region": "eu", "v": "abc"}, {"region": "us", "v": 5, "w": 1}]
+
+        files = tm.flatten_stream(
+            data, tmp_path, name="t", output_format="avro", partition_by=["region"]
+        )
+
+        fields = []
+        for path in files:
+            with open(path, "rb") as f:
+                reader = fastavro.reader(f)
+                schema = reader.writer_schema
+                fields.append([f for f in schema["fields"] if f["name"] == "v"])
+                records = list(reader)
+        assert fields[0] == fields[1] == [{"name": "v", "type": ["null", "string"]}]
+        assert records[0]["v"] == "5"
+
+    def test_non_scalar_partition_value_rejected(self, tmp_path):
+        with pytest.raises(ValidationError, match="scalar"):
+            tm.flatten_stream([{"tags": ["a", "b"]}], tmp_path, partition_by=["tags"])
+
+
+class TestPartitionedStreamingWriter:
+    """Test the partitioned writer directly."""
+
+    def test_bounded_open_writers_roll_part_files(self, tmp_path):
+        writer = create_partitioned_writer(
+            "csv", str(tmp_path), ["k"], entity_name="t", max_open_files=1
+        )
+        writer.write_partition(("a",), [{"k": "a", "v": 1}], {})
+        writer.write_partition(("b",), [{"k": "b", "v": 2}], {})
+        assert len(writer.writers) == 1
+        writer.write_partition(("a",), [{"k": "a", "v": 3}], {})
+        files = writer.close()
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == ["t/k=a/part-0.csv", "t/k=a/part-1.csv", "t/k=b/part-0.csv"]
+
+    def test_mixed_type_values_share_directory(self, tmp_path):
+        writer = create_partitioned_writer("csv", str(tmp_path), ["k"], entity_name="t")
+        writer.write_partition((1,), [{"k": 1, "v": 1}], {})
+        writer.write_partition(("1",), [{"k": "1", "v": 2}], {})
+        files = writer.close()
+
+        assert [str(p.relative_to(tmp_path)) for p in files] == ["t/k=1/part-0.csv"]
+        assert len(files[0].read_text().splitlines()) == 3
+
+    def test_bool_and_int_values_kept_apart(self, tmp_path):
+        writer = create_partitioned_writer("csv", str(tmp_path), ["k"], entity_name="t")
+        writer.write_main_records([{"k": True, "v": 1}, {"k": 1, "v": 2}])
+        files = writer.close()
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == ["t/k=1/part-0.csv", "t/k=true/part-0.csv"]
+
+    def test_column_names_escaped(self, tmp_path):
+        writer = create_partitioned_writer(
+            "csv", str(tmp_path), ["a/b"], entity_name="t"
+        )
+        writer.write_main_records([{"a/b": "x", "v": 1}])
+        files = writer.close()
+
+        assert [str(p.relative_to(tmp_path)) for p in files] == ["t/a%2Fb=x/part-0.csv"]
+
+    def test_part_numbering_start_and_step(self, tmp_path):
+        writer = PartitionedStreamingWriter(
+            str(tmp_path),
+            entity_name="t",
+            format_name="csv",
+            max_open_files=1,
+            part_start=3,
+            part_step=4,
+        )
+        writer.write_main_records([{"v": 1}])
+        writer.write_partition((), [], {"t_items": [{"v": 2}]})
+        writer.write_main_records([{"v": 3}])
+        files = writer.close()
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == ["t/part-3.csv", "t/part-7.csv", "t_items/part-3.csv"]
+
+    def test_child_records_require_partition(self, tmp_path):
+        writer = create_partitioned_writer("csv", str(tmp_path), ["k"])
+
+        with pytest.raises(OutputError):
+            writer.write_child_records("items", [{"v": 1}])
+        writer.close()
+
+    def test_requires_directory_destination(self):
+        with pytest.raises(ConfigurationError):
+            PartitionedStreamingWriter(None, partition_by=["k"])
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            create_partitioned_writer("xml", str(tmp_path), ["k"])
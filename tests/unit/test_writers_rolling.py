@@ -0,0 +1,142 @@
+"""Tests for rolling streaming output files by row count and size."""
+
+import csv
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.writers import create_streaming_writer
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+def _count_rows(path, output_format):
+    if output_format == "csv":
+        return len(_read_csv(path))
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path).num_rows
+    if output_format == "orc":
+        import pyarrow.orc as orc
+
+        return orc.read_table(path).num_rows
+    import fastavro
+
+    with open(path, "rb") as f:
+        return sum(1 for _ in fastavro.reader(f))
+
+
+class TestRollingByRows:
+    """Test max_rows_per_file across formats."""
+
+    @pytest.mark.parametrize("output_format", ["csv", "parquet", "orc", "avro"])
+    def test_rows_split_across_numbered_files(self, tmp_path, output_format):
+        records = [{"id": i, "tags": [{"t": i}]} for i in range(25)]
+
+        files = tm.flatten_stream(
+            records,
+            tmp_path,
+            name="events",
+            output_format=output_format,
+            config=TransmogConfig(batch_size=7),
+            max_rows_per_file=10,
+        )
+
+        ext = f".{output_format}"
+        names = sorted(p.name for p in files)
+        assert names == [
+            f"events-00001{ext}",
+            f"events-00002{ext}",
+            f"events-00003{ext}",
+            f"events_tags-00001{ext}",
+            f"events_tags-00002{ext}",
+            f"events_tags-00003{ext}",
+        ]
+        counts = [
+            _count_rows(tmp_path / f"events-0000{n}{ext}", output_format)
+            for n in (1, 2, 3)
+        ]
+        assert counts == [10, 10, 5]
+
+    def test_csv_rolled_files_have_headers(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": i, "name": f"n{i}"} for i in range(5)],
+            tmp_path,
+            max_rows_per_file=2,
+        )
+
+        rows = [row for path in sorted(files) for row in _read_csv(path)]
+        assert [row["id"] for row in rows] == ["0", "1", "2", "3", "4"]
+        assert all(set(row) >= {"id", "name"} for row in rows)
+
+    def test_exact_multiple_does_not_leave_empty_file(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": i} for i in range(20)],
+            tmp_path,
+            output_format="parquet",
+            max_rows_per_file=10,
+        )
+
+        assert len(files) == 2
+
+
+class TestRollingBySize:
+    """Test max_bytes_per_file across formats."""
+
+    @pytest.mark.parametrize("output_format", ["csv", "parquet", "orc", "avro"])
+    def test_size_limit_rolls_files(self, tmp_path, output_format):
+        records = [{"id": i, "payload": "x" * 200} for i in range(200)]
+
+        files = tm.flatten_stream(
+            records,
+            tmp_path,
+            name="blobs",
+            output_format=output_format,
+            config=TransmogConfig(batch_size=20),
+            max_bytes_per_file=4096,
+        )
+
+        assert len(files) > 1
+        total = sum(_count_rows(path, output_format) for path in files)
+        assert total == 200
+
+    @pytest.mark.parametrize("output_format", ["parquet", "orc"])
+    def test_arrow_files_stay_near_limit(self, tmp_path, output_format):
+        records = [{"id": i, "payload": f"{i:0>100}"} for i in range(5000)]
+
+        files = tm.flatten_stream(
+            records,
+            tmp_path,
+            name="blobs",
+            output_format=output_format,
+            max_bytes_per_file=100_000,
+        )
+
+        assert len(files) > 1
+        assert all(path.stat().st_size <= 100_000 for path in files)
+        assert sum(_count_rows(path, output_format) for path in files) == 5000
+
+
+class TestRollingConfiguration:
+    """Test rolling option validation."""
+
+    @pytest.mark.parametrize("output_format", ["csv", "parquet", "avro"])
+    def test_invalid_limit(self, tmp_path, output_format):
+        with pytest.raises(ConfigurationError):
+            create_streaming_writer(
+                output_format, destination=str(tmp_path), max_rows_per_file=0
+            )
+
+    def test_file_destination_rejected(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            create_streaming_writer(
+                "csv",
+                destination=str(tmp_path / "out.csv"),
+                max_rows_per_file=10,
+            )
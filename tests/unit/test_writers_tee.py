@@ -0,0 +1,178 @@
+"""Tests for multi-format output through TeeStreamingWriter."""
+
+import csv
+import threading
+
+import pytest
+
+import transmog as tm
+from transmog.config import TransmogConfig
+from transmog.exceptions import ConfigurationError
+from transmog.writers import (
+    CsvStreamingWriter,
+    StreamingWriter,
+    TeeStreamingWriter,
+    create_streaming_writer,
+)
+
+
+def _read_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def records():
+    return [{"id": i, "tags": [{"t": i}, {"t": i + 1}]} for i in range(10)]
+
+
+class _RecordingWriter(StreamingWriter):
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+        self.threads: set[int] = set()
+        self.tables: list[str] = []
+        self.closed = False
+
+    def write_main_records(self, records):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise ValueError("boom")
+        self.tables.append("main")
+
+    def write_child_records(self, table_name, records):
+        self.tables.append(table_name)
+
+    def close(self):
+        self.closed = True
+        return []
+
+
+class TestFlattenStreamTee:
+    """Test several output formats in one flatten_stream() call."""
+
+    def test_list_of_formats(self, tmp_path, records):
+        files = tm.flatten_stream(
+            records,
+            tmp_path,
+            name="events",
+            output_format=["csv", "parquet"],
+            config=TransmogConfig(batch_size=3),
+        )
+
+        assert sorted(p.name for p in files) == [
+            "events.csv",
+            "events.parquet",
+            "events_tags.csv",
+            "events_tags.parquet",
+        ]
+
+    def test_outputs_share_flattened_rows(self, tmp_path, records):
+        import pyarrow.parquet as pq
+
+        tm.flatten_stream(
+            records,
+            tmp_path,
+            name="events",
+            output_format=["csv", "parquet"],
+        )
+
+        csv_ids = [row["_id"] for row in _read_csv(tmp_path / "events.csv")]
+        parquet_ids = pq.read_table(tmp_path / "events.parquet")["_id"].to_pylist()
+        assert csv_ids == parquet_ids
+
+    def test_per_format_options_and_destination(self, tmp_path, records):
+        import pyarrow.parquet as pq
+
+        files = tm.flatten_stream(
+            records,
+            tmp_path / "lake",
+            name="events",
+            output_format={
+                "parquet": {"compression": "gzip"},
+                "csv": {"output_path": str(tmp_path / "legacy"), "delimiter": ";"},
+            },
+        )
+
+        assert {p.parent.name for p in files} == {"lake", "legacy"}
+        metadata = pq.ParquetFile(tmp_path / "lake" / "events.parquet").metadata
+        assert metadata.row_group(0).column(0).compression == "GZIP"
+        header = (tmp_path / "legacy" / "events.csv").read_text().splitlines()[0]
+        assert ";" in header
+
+    def test_partitioned_tee(self, tmp_path):
+        files = tm.flatten_stream(
+            [{"id": 1, "region": "eu"}, {"id": 2, "region": "us"}],
+            tmp_path,
+            name="orders",
+            output_format=["csv", "avro"],
+            partition_by=["region"],
+        )
+
+        relative = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert relative == [
+            "orders/region=eu/part-0.avro",
+            "orders/region=eu/part-0.csv",
+            "orders/region=us/part-0.avro",
+            "orders/region=us/part-0.csv",
+        ]
+
+    def test_duplicate_format_rejected(self, tmp_path, records):
+        with pytest.raises(ConfigurationError, match="Duplicate"):
+            tm.flatten_stream(records, tmp_path, output_format=["csv", "CSV"])
+
+    def test_file_object_destination_rejected(self, tmp_path, records):
+        from transmog.streaming import stream_process
+
+        with open(tmp_path / "out.csv", "wb") as f:
+            with pytest.raises(ConfigurationError):
+                stream_process(
+                    config=TransmogConfig(),
+                    data=records,
+                    entity_name="events",
+                    output_format=["csv", "parquet"],
+                    output_destination=f,
+                )
+
+
+class TestTeeStreamingWriter:
+    """Test TeeStreamingWriter fan-out behavior."""
+
+    def test_writers_run_on_worker_threads(self):
+        first, second = _RecordingWriter(), _RecordingWriter()
+        tee = TeeStreamingWriter({"a": first, "b": second})
+
+        tee.write_tables([{"id": 1}], {"child": [{"x": 1}]})
+        tee.close()
+
+        assert first.tables == second.tables == ["main", "child"]
+        assert threading.get_ident() not in first.threads | second.threads
+
+    def test_error_raised_after_all_writers_finish(self):
+        failing, ok = _RecordingWriter(fail=True), _RecordingWriter()
+        tee = TeeStreamingWriter({"bad": failing, "good": ok})
+
+        with pytest.raises(ValueError, match="boom"):
+            tee.write_main_records([{"id": 1}])
+        assert ok.tables == ["main"]
+
+        tee.close()
+        assert failing.closed and ok.closed
+
+    def test_close_returns_all_paths(self, tmp_path):
+        tee = TeeStreamingWriter(
+            {
+                "csv": CsvStreamingWriter(destination=str(tmp_path), entity_name="e"),
+                "avro": create_streaming_writer(
+                    "avro", destination=str(tmp_path), entity_name="e"
+                ),
+            }
+        )
+        tee.write_main_records([{"id": 1}])
+
+        assert sorted(p.name for p in tee.close()) == ["e.avro", "e.csv"]
+        assert tee.close() == []
+
+    def test_requires_writers(self):
+        with pytest.raises(ConfigurationError):
+            TeeStreamingWriter({})